@@ -29,9 +29,13 @@ exit 2
     Usage:
         mongo_db_dump.py -c file -d path
             {-M -o dir_path [-z | -b database [-r | -t name] | -l | -q | -z |
-                -i ] |
-             -A -o dir_path |
-             -E -o dir_path -b database -t name [-q]}
+                -i ] [-P procs | -Z codec] [-N num | auto] |
+             -A -o dir_path [-n threads] [-k [-g] | -w | -a codec]
+                [-m seconds | -K] [-j] [-f dir_path {dir_path2 ...}] [-S]
+                [-D] |
+             -E -o dir_path -b database -t name [-q] |
+             -C dump_path -o dir_path |
+             -R dump_path -o dir_path}
             [-p path | -y flavor_id | -x]
             [-e email {email2 email3 ...} {-s subject_line}]
             [-v | -h]
@@ -52,10 +56,108 @@ exit 2
             -q => Turn quiet mode on. By default, displays out log of dump.
             -o dir_path => Directory path to dump directory. Required argument.
             -i => Turn off TLS checking.
+            -P procs => Number of mongodump programs run at the same time.
+                Without -b or -l options the databases are listed and one
+                mongodump is run per database.  With -b option (and no -t or
+                -r option) the collections are listed and one mongodump is
+                run per collection.  The largest (collStats size) is started
+                first and each finished mongodump starts the next largest, so
+                the run time is close to the largest collection's.  Their
+                logs are combined into the dump log.  Default is 1, a single
+                mongodump.
+            -N num | auto => Number of collections each mongodump dumps at the
+                same time (--numParallelCollections).  Without -N option
+                mongodump's default of 4 is used.  With auto, the value is
+                limited to the local and server CPUs (hostInfo) shared by
+                the -P mongodumps and to the number of collections the data
+                is spread over (total size / largest collection size).  Up to
+                that limit, past runs (MB/s) recorded in
+                mongodump_tuning.json in the dump directory are used to
+                step towards the fastest value.
+            -Z gzip|zstd|none => Compressed archive.  A single mongodump
+                writes an archive (--archive) to standard out, which is
+                compressed in chunks on all CPUs into dump_<dtg>.archive.gz
+                or dump_<dtg>.archive.zst in the dump directory.  The
+                compression level is dump_level in the configuration file.
+                Restore with:  zstd -dc (or gunzip -c) file |
+                mongorestore --archive.  With none, the archive is moved
+                uncompressed from the pipe to dump_<dtg>.archive in the
+                kernel (splice), restore with mongorestore --archive=file.
+                zstd requires the zstandard python module.  Not used with -z
+                option, -P option is ignored.
 
         -A => Run the Sync/Copy dump program. Database server being dumped must
                 also be part of a replica set.
             -o dir_path => Directory path to dump directory. Required argument.
+            -n threads => Number of parallel copy threads.  Files are copied
+                largest first.  Default is the number of CPUs, up to 8.
+            -k => Incremental dump.  Files unchanged since the most recent
+                cp_dump_* directory in the dump directory (same size and
+                modification time) are hardlinked to it instead of copied.
+                -g => Also compare the file contents' digests (sha256).
+            -w => Warm copy.  Copies the database files before locking the
+                database, then locks it and copies only the files that changed
+                during the first copy.
+            -a gzip|zstd => Stream the database files into a single tar
+                archive (cp_dump_YYYYMMDD_HHMM.tar.gz|.tar.zst) compressed
+                using -n threads, instead of a directory copy.  An index file
+                (.idx) allows single files to be extracted in parallel.
+                zstd requires the zstandard python module.
+            -m seconds => Lock budget.  If the database is still locked after
+                this many seconds, the copy is cancelled, the database is
+                unlocked and the partial dump is marked incomplete
+                (cp_dump_incomplete file) and reported as an error.
+            -j => Checksum manifest.  Each file is hashed (sha256) while it is
+                copied, in the same read, and the path, size, modification
+                time and digest are written to cp_dump_manifest.json in the
+                dump directory.  Files are then always copied through user
+                space instead of being cloned.  Not used with -a option.
+            -f dir_path(s) => Fan-out.  Additional dump directories, e.g. on
+                a second volume.  Each block read from the database files is
+                written to the -o dump and to a dump of the same name in each
+                of these directories, so the files are read only once and the
+                lock window is unchanged.  The files are then copied through
+                user space instead of being cloned.  With -k option only the
+                -o dump is hardlinked to the previous dump.
+            -S => Secondary selection.  Reads the replica set status from the
+                configured server and locks and copies the healthy secondary
+                with the least replication lag (then lowest ping time) whose
+                host is this server and whose dbpath is found locally, instead
+                of the configured server.  The primary is never locked.
+            -K => Cold copy.  Instead of locking the database, the secondary
+                is shutdown, its database files are copied at full disk speed
+                and it is restarted (mongod --config cp_mongod_conf --fork,
+                using the -p path).  The program then waits for its
+                replication lag to fall to cp_max_lag seconds.  Requires
+                cp_mongod_conf in the configuration file.  Not used with -S
+                or -m options.
+            -D => Block delta store.  Once the dump is taken, the previous
+                cp_dump_* directory is converted to block deltas against it:
+                each file changed since is replaced by a .cpdelta file holding
+                only the blocks (cp_delta_block_size) not found in the new
+                dump, found with a rolling checksum.  The newest dump is always
+                a full copy, any older dump is rebuilt from the chain of
+                deltas with -R option.  Not used with -a option.
+            Note:  Files are cloned (reflink) when the database directory and
+                the dump directory are on the same filesystem and it supports
+                cloning (e.g. XFS with reflink, btrfs), otherwise the files
+                are copied.
+            Note:  The cp_include and cp_exclude configuration entries are
+                glob patterns of the dbpath files to copy and to skip.  By
+                default diagnostic.data, mongod.lock, _tmp and core files are
+                skipped.
+            Note:  The cp_rate_limit (bytes/sec) and cp_iops_limit (I/O calls
+                per second) configuration entries limit the copy while the
+                database is not locked (-w pre-copy) and the -C verify.  While
+                the database is locked the copy is only limited by
+                cp_locked_rate_limit.  None is no limit.
+            Note:  Sparse files (e.g. preallocated journal files) are kept
+                sparse, only their data extents are copied.
+            Note:  The lock window (lock acquired, copy start/end, unlock),
+                file count, logical bytes, physical (allocated) bytes, bytes
+                written and MB/s are written to cp_dump_stats.json
+                in the dump directory (or archive.stats.json next to an
+                archive) and added to the email, if -e option is used.
 
         -E => Run the mongoexport program.
             -b database => Database name.
@@ -63,6 +165,24 @@ exit 2
             -q => Turn quiet mode on. By default, displays out log of dump.
             -o dir_path => Directory path to dump directory. Required argument.
 
+        -C dump_path => Verify a Sync/Copy dump directory (cp_dump_*) against
+                its checksum manifest (-A -j option).  The files are hashed in
+                parallel using all CPUs.
+            -o dir_path => Directory path to dump directory. Required argument.
+
+        -R dump_path => Restore a Sync/Copy dump directory (cp_dump_*) or
+                archive (cp_dump_*.tar.gz|.tar.zst) into an empty database
+                directory.  The dump must not be marked incomplete and the
+                files in its manifest (-A -j option) must exist with the same
+                size, run -C first for a full checksum verify.  The files are
+                copied (cloned if the filesystem supports it) or extracted in
+                parallel using all CPUs.  The restored files are owned by the
+                owner of the database directory (or cp_restore_owner in the
+                configuration file) and given owner read/write access.  The
+                database server is not connected to, it must be shutdown.
+            -o dir_path => Directory path to the database directory (dbpath)
+                to restore into.  Required argument.
+
         -e email_address(es) => Send output to one or more email addresses.
         -s subject_line => Subject line of email.
             Requires -e option.
@@ -71,7 +191,7 @@ exit 2
         -v => Display version of this program.
         -h => Help and usage message.
             NOTE 1:  -v or -h overrides the other options.
-            NOTE 2:  -A and -M are Xor required arguments.
+            NOTE 2:  -A, -M, -E, -C and -R are Xor required arguments.
 
     Notes:
         Mongo configuration file format (config/mongo.py.TEMPLATE).  The
@@ -111,11 +231,57 @@ exit 2
                 tls_certkey = None
                 tls_certkey_phrase = None
 
+        Page cache setting in the configuration file.  Drops the files read
+            and written by the -A and -M dumps and the -C verify from the
+            page cache, the impact is reported with the dump statistics.
+            Files not owned or writable by the dump user are not dropped, the
+            kernel does not show which of their pages were already cached.
+
+            drop_cache = True
+
+        Progress metrics setting in the configuration file.  The -M and -E
+            progress lines are parsed as they are written into per collection
+            documents done, docs/sec and estimated seconds left.  They are
+            written as JSON lines next to the log file (.progress.jsonl) and,
+            if set, to a Prometheus textfile in the node_exporter textfile
+            collector directory (mongo_db_dump_<program>[_<flavor id>].prom).
+
+            prom_textfile_dir = None
+
+        Compressed archive (-M -Z option) setting in the configuration file.
+            The compression level, None is the codec's default (zstd 3,
+            gzip 6).
+
+            dump_level = None
+
+        Sync/Copy dump (-A option) settings in the configuration file.  The
+            fastest method depends on the storage, see
+            test/benchmark/mongo_db_dump/cp_benchmark.py.
+
+            cp_method = "auto"
+            cp_chunk_size = 67108864
+            cp_direct = False
+            cp_include = None
+            cp_exclude = ["diagnostic.data", "mongod.lock", "_tmp", "core",
+                          "core.*"]
+            cp_rate_limit = None
+            cp_iops_limit = None
+            cp_locked_rate_limit = None
+            cp_mongod_conf = None
+            cp_shutdown_timeout = 300
+            cp_max_lag = 10
+            cp_catchup_timeout = 3600
+            cp_restore_owner = None
+            cp_delta_block_size = 16384
+            cp_delta_roll = 4096
+
         Configuration modules -> Name is runtime dependent as it can be used to
             connect to different databases with different names.
 
         A log file and error file (if any errors are detected) will be
-            written to the same directory as the dump file (-o option).
+            written to the same directory as the dump file (-o option).  The
+            log is displayed as it is written, the email (-e option) holds
+            its first 25 and last 100 lines.
 
             Note:  If the -q option is used on the command line, then there
                 will be no log entries in the log file of the dump.
@@ -132,15 +298,51 @@ exit 2
 ":"""
 # Python program follows
 
+# The program is installed and run as a single file, so the copy, delta and
+#   archive functions stay in this module rather than a library module.
+# pylint:disable=C0302
+
 
 # Libraries and Global Variables
 
 # Standard
 import sys
 import os
+import io
+import re
+import zlib
+import gzip
+import json
+import mmap
+import struct
+import errno
+import fnmatch
+import fcntl
 import shutil
+import socket
+import pwd
+import grp
+import tarfile
+import tempfile
+import hashlib
+import ctypes
+import contextlib
+import functools
+import threading
+import collections
+import time
 import datetime
 import subprocess
+import concurrent.futures
+
+# Third-party
+import pymongo
+
+try:
+    import zstandard
+
+except ImportError:
+    zstandard = None
 
 # Local
 try:
@@ -159,6 +361,85 @@ except (ValueError, ImportError) as err:
 
 __version__ = version.__version__
 
+# Linux ioctl request to share a file's extents with another file (reflink).
+FICLONE = 0x40049409
+
+# Errors meaning the filesystem cannot clone or range copy between two files.
+CLONE_ERRNO = (errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL,
+               errno.ENOSYS)
+
+# File extensions for the compressed archive codecs (-a option).
+ARCH_EXT = {"gzip": ".tar.gz", "zstd": ".tar.zst"}
+# File extensions for the compressed mongodump archives (-Z option).
+DUMP_EXT = {"gzip": ".archive.gz", "zstd": ".archive.zst", "none": ".archive"}
+# Pipe buffer size asked for (F_SETPIPE_SZ) when splicing an archive, the
+# default of 64KB costs a splice call per 64KB.
+PIPE_SIZE = 1048576
+# dbpath content not needed to restore a Sync/Copy dump.
+CP_EXCLUDE = ["diagnostic.data", "mongod.lock", "_tmp", "core", "core.*"]
+CP_METHODS = {
+    "auto": ("ficlone", "copy_file_range"), "clone": ("ficlone",),
+    "copy_file_range": ("copy_file_range",), "sendfile": ("sendfile",),
+    "read": ()}
+
+# Files kept with a dump which are not database files.
+CP_SIDECARS = ["cp_dump_manifest.json", "cp_dump_stats.json",
+               "cp_dump_incomplete", "cp_dump_delta.json"]
+
+# Block delta files (-D option):  file header, record formats and extension.
+DELTA_MAGIC = b"CPDELTA1"
+DELTA_COPY = struct.Struct(">cQI")
+DELTA_DATA = struct.Struct(">cI")
+DELTA_END = struct.Struct(">cQ32s")
+DELTA_EXT = ".cpdelta"
+
+# Largest file stored as a block delta (-D option), the signature of the base
+#   file is held in memory.  Bytes of a file the checksum is rolled over a
+#   byte at a time (about 4 MB/s), after which only block aligned offsets
+#   are checked (about 100 MB/s).
+DELTA_MAX_SIZE = 17179869184
+DELTA_ROLL_LIMIT = 33554432
+
+# Per thread zstd compressors.
+ZSTD_LOCAL = threading.local()
+
+# Past mongodump runs kept in the dump directory to tune -N auto option.
+TUNING_FILE = "mongodump_tuning.json"
+TUNING_RUNS = 20
+
+# First and last lines of a mongo program's log kept for the email.
+LOG_HEAD_LINES = 25
+LOG_TAIL_LINES = 100
+
+# mongodump/mongoexport progress and done lines, seconds between Prometheus
+# textfile writes.
+PROGRESS_LINE = re.compile(
+    r"\[[#.]+\]\s+(?P<ns>\S+)\s+(?P<docs>\d+)/(?P<total>\d+)\s+"
+    r"\((?P<percent>[\d.]+)%\)")
+DONE_LINE = re.compile(
+    r"done dumping (?P<ns>\S+) \((?P<docs>\d+) documents?\)")
+PROM_INTERVAL = 5
+
+# Bytes written to an archive between page cache drops.
+CACHE_FLUSH_SIZE = 67108864
+# Maps a mincore vector byte to 1 if the page is resident, else 0.
+MINCORE_RESIDENT = bytes(item & 1 for item in range(256))
+# Bytes of a file mapped per mincore call, a multiple of the page size.
+MINCORE_WINDOW = 1073741824
+
+# C library calls to read a file's page cache residency (mincore).
+try:
+    LIBC = ctypes.CDLL(None, use_errno=True)
+    LIBC.mmap.restype = ctypes.c_void_p
+    LIBC.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                          ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    LIBC.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t,
+                             ctypes.c_char_p]
+    LIBC.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+
+except (OSError, AttributeError):
+    LIBC = None
+
 
 def help_message():
 
@@ -174,182 +455,4448 @@ def help_message():
     print(__doc__)
 
 
-def sync_cp_dump(server, args, **kwargs):
+def is_match(rel_path, patterns):
 
-    """Function:  sync_cp_dump
+    """Function:  is_match
 
-    Description:  Locks the database and then copies the database files to a
-        destination directory.
+    Description:  Checks a relative path against a list of glob patterns.  A
+        pattern with a "/" is matched against the whole relative path, any
+        other pattern is matched against the file or directory name.
 
     Arguments:
-        (input) server -> Database server instance
-        (input) args -> ArgParser class instance
-        (output) err_flag -> True|False - If an error has occurred
-        (output) err_msg -> Error message
+        (input) rel_path -> Path relative to the directory being copied
+        (input) patterns -> List of glob patterns
+        (output) True|False - If any of the patterns match
+
+    """
+
+    name = os.path.basename(rel_path)
+
+    return any(
+        fnmatch.fnmatchcase(rel_path if "/" in pattern else name, pattern)
+        for pattern in patterns)
+
+
+def get_cp_files(src_dir, **kwargs):
+
+    """Function:  get_cp_files
+
+    Description:  Walks a directory tree and returns the sub-directories and
+        the files within it.  The files are sorted largest first so the
+        longest copies are started first.  Excluded directories are not
+        walked.
+
+    Arguments:
+        (input) src_dir -> Source directory path
         (input) **kwargs:
-            mail -> Email class instance
+            include -> List of glob patterns, only matching files are listed
+            exclude -> List of glob patterns of files and directories to skip
+        (output) dir_list -> List of sub-directories relative to src_dir
+        (output) file_list -> List of (relative file path, file size,
+            modification time in ns) sorted by file size in descending order
 
     """
 
-    err_flag = False
-    err_msg = None
-    mail = kwargs.get("mail", None)
+    dir_list = []
+    file_list = []
+    include = kwargs.get("include", None)
+    exclude = kwargs.get("exclude", None) or []
 
-    if not server.is_locked():
-        server.lock_db(lock=True)
+    for root, dirs, files in os.walk(src_dir, followlinks=True):
+        rel_root = os.path.relpath(root, src_dir)
+        dirs[:] = [
+            name for name in dirs if not is_match(
+                os.path.normpath(os.path.join(rel_root, name)), exclude)]
 
-        if server.is_locked():
-            dmp_dir = args.get_val("-o") + "/cp_dump_" \
-                + datetime.datetime.strftime(
-                    datetime.datetime.now(), "%Y%m%d_%H%M")
+        for name in dirs:
+            dir_list.append(os.path.normpath(os.path.join(rel_root, name)))
 
-            # Backup database.
-            shutil.copytree(server.db_path, dmp_dir)
-            server.unlock_db()
+        for name in files:
+            rel_path = os.path.normpath(os.path.join(rel_root, name))
 
-            if server.is_locked():
-                err_flag = True
-                err_msg = "Warning:  Database still locked after dump."
+            if is_match(rel_path, exclude) \
+               or (include and not is_match(rel_path, include)):
+                continue
 
-        else:
-            err_flag = True
-            err_msg = "Error:  Unable to lock the database for dump to occur."
+            try:
+                f_stat = os.stat(os.path.join(src_dir, rel_path))
 
-    else:
-        err_flag = True
-        err_msg = "Error:  Database previously locked, unable to dump."
+            # File was removed by the database after it was listed.
+            except FileNotFoundError:
+                continue
 
-    if mail and err_flag:
-        mail.add_2_msg("Error/Warning detected in database dump.")
-        mail.add_2_msg(err_msg)
-        mail.send_mail()
+            file_list.append((rel_path, f_stat.st_size, f_stat.st_mtime_ns))
 
-    return err_flag, err_msg
+    file_list.sort(key=lambda item: item[1], reverse=True)
 
+    return dir_list, file_list
 
-def mongo_dump(server, args, **kwargs):
 
-    """Function:  mongo_dump
+class TokenBucket():
+
+    """Class:  TokenBucket
+
+    Description:  Token bucket limiting the bytes per second and I/O calls per
+        second of the copy worker threads sharing it.  Callers reserve tokens
+        before each read or copy call and sleep off any deficit, allowing up
+        to one second of burst.  The rates can be changed between phases.
+
+    Methods:
+        __init__
+        set_rate
+        consume
+
+    """
+
+    def __init__(self, rate=None, iops=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) rate -> Bytes per second or None for no limit
+            (input) iops -> I/O calls per second or None for no limit
+
+        """
+
+        self.mutex = threading.Lock()
+        self.rate = None
+        self.iops = None
+        self.tokens = 0.0
+        self.ops = 0.0
+        self.stamp = time.monotonic()
+        self.set_rate(rate, iops)
+
+    def set_rate(self, rate=None, iops=None):
+
+        """Method:  set_rate
+
+        Description:  Changes the limits, an empty bucket is started.
+
+        Arguments:
+            (input) rate -> Bytes per second or None for no limit
+            (input) iops -> I/O calls per second or None for no limit
+
+        """
+
+        with self.mutex:
+            self.rate = rate
+            self.iops = iops
+            self.tokens = 0.0
+            self.ops = 0.0
+            self.stamp = time.monotonic()
+
+    def consume(self, nbytes):
+
+        """Method:  consume
+
+        Description:  Reserves the tokens for one I/O call of nbytes and waits
+            until the bucket can cover them.
+
+        Arguments:
+            (input) nbytes -> Number of bytes about to be read or copied
+
+        """
 
-    Description:  Create the dump command and execute it.
+        wait = 0
+
+        with self.mutex:
+            now = time.monotonic()
+            elapsed = now - self.stamp
+            self.stamp = now
+
+            if self.rate:
+                self.tokens = min(
+                    self.tokens + elapsed * self.rate, self.rate) - nbytes
+                wait = max(wait, -self.tokens / self.rate)
+
+            if self.iops:
+                self.ops = min(self.ops + elapsed * self.iops, self.iops) - 1
+                wait = max(wait, -self.ops / self.iops)
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def fadvise(fd, offset, length, advice):
+
+    """Function:  fadvise
+
+    Description:  Gives the kernel advice on the page cache use of an open
+        file.  Does nothing where posix_fadvise is not available or the file
+        does not support it.
 
     Arguments:
-        (input) server -> Database server instance
-        (input) args -> ArgParser class instance
-        (input) **kwargs:
-            opt_arg -> Dictionary of additional options to add
-            mail -> Email class instance
-            req_arg -> List of required options for the command line
-        (output) err_flag -> If an error has occurred
-        (output) err_msg -> Error message
+        (input) fd -> File descriptor
+        (input) offset -> Start of the range in bytes
+        (input) length -> Length of the range in bytes, 0 is to end of file
+        (input) advice -> Name of the os.POSIX_FADV_* advice
 
     """
 
-    log_name = "dump_"
-    err_flag = False
-    err_msg = None
-    dtg = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, getattr(os, advice))
 
-    if args.arg_exist("-o") and args.get_val("-o"):
-        log_file = os.path.join(args.get_val("-o"), log_name + dtg + ".log")
-        err_file = os.path.join(args.get_val("-o"), log_name + dtg + ".err")
-        err_flag, err_msg = mongo_generic(
-            server, args, "mongodump", log_file, err_file=err_file, **kwargs)
+        except OSError as msg:
+            if msg.errno not in (errno.EINVAL, errno.ESPIPE):
+                raise
 
-    else:
-        err_flag = True
-        err_msg = "Error:  Missing -o option or value."
 
-    return err_flag, err_msg
+def get_resident(fd, size):
 
+    """Function:  get_resident
 
-def mongo_generic(                                      # pylint:disable=R0914
-        server, args, cmd_name, log_file, **kwargs):
+    Description:  Returns which pages of an open file are in the page cache,
+        using mincore on read only mappings of the file, MINCORE_WINDOW bytes
+        at a time.  The kernel only reports the page cache for files the
+        caller owns or can write to, other files show no page resident.
 
-    """Function:  mongo_generic
+    Arguments:
+        (input) fd -> File descriptor
+        (input) size -> Size of the file in bytes
+        (output) List of start and end byte offsets of the ranges of resident
+            pages, or None if mincore is not available
+
+    """
+
+    if not size or LIBC is None:
+        return [] if size == 0 else None
+
+    ranges = []
+    vec = ctypes.create_string_buffer(
+        -(-min(size, MINCORE_WINDOW) // mmap.PAGESIZE))
+
+    for offset in range(0, size, MINCORE_WINDOW):
+        length = min(size - offset, MINCORE_WINDOW)
+        addr = LIBC.mmap(
+            None, length, mmap.PROT_READ, mmap.MAP_SHARED, fd, offset)
+
+        if addr in (None, ctypes.c_void_p(-1).value):
+            return None
+
+        try:
+            if LIBC.mincore(addr, length, vec):
+                return None
+
+        finally:
+            LIBC.munmap(addr, length)
+
+        for match in re.finditer(b"\x01+", vec.raw[:-(
+                -length // mmap.PAGESIZE)].translate(MINCORE_RESIDENT)):
+            start = offset + match.start() * mmap.PAGESIZE
+            end = min(offset + match.end() * mmap.PAGESIZE, size)
+
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], end)
+
+            else:
+                ranges.append((start, end))
+
+    return ranges
+
+
+def get_cached():
+
+    """Function:  get_cached
+
+    Description:  Returns the size of the system's page cache.
+
+    Arguments:
+        (output) Bytes in the page cache or None if /proc/meminfo cannot be
+            read
+
+    """
+
+    try:
+        with open("/proc/meminfo", mode="r", encoding="UTF-8") as f_hdlr:
+            for line in f_hdlr:
+                if line.startswith("Cached:"):
+                    return int(line.split()[1]) * 1024
+
+    except OSError:
+        pass
+
+    return None
+
+
+class PageCache():
+
+    """Class:  PageCache
+
+    Description:  Keeps the files read and written by a dump from pushing the
+        database's pages out of the page cache.  The pages of a file read
+        which were not cached before the read are dropped once the file is
+        done.  Written files only start their write back when done and are
+        synced and dropped by finish, outside of any lock window.  Shared by
+        the copy worker threads.  mincore under-reports the pages of files
+        the process neither owns nor can write to, so the pages read of those
+        files are kept rather than dropping the database's cached pages.
+
+    Methods:
+        __init__
+        resident
+        release
+        written
+        finish
+
+    """
+
+    def __init__(self):
 
-    Description:  Create a mongo dump/export command and execute it.
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.mutex = threading.Lock()
+        self.cached = get_cached()
+        self.files = []
+        self.stats = {"read_kept": 0, "read_dropped": 0, "written_dropped": 0}
+
+    def resident(self, f_name):
+
+        """Method:  resident
+
+        Description:  Returns which pages of a file are cached before it is
+            read.  For a file whose page cache mincore does not report, the
+            whole file is returned as cached.
+
+        Arguments:
+            (input) f_name -> Directory path and file name
+            (output) get_resident ranges or None
+
+        """
+
+        fd = os.open(f_name, os.O_RDONLY)
+
+        try:
+            stat = os.fstat(fd)
+
+            if os.geteuid() not in (0, stat.st_uid) \
+                    and not os.access(f_name, os.W_OK):
+                return [(0, stat.st_size)]
+
+            return get_resident(fd, stat.st_size)
+
+        finally:
+            os.close(fd)
+
+    def release(self, f_name, resident=None):
+
+        """Method:  release
+
+        Description:  Drops the pages of a file which has been read, except
+            the pages which were cached before the read.
+
+        Arguments:
+            (input) f_name -> Directory path and file name
+            (input) resident -> Ranges from resident taken before the read,
+                None drops the whole file
+
+        """
+
+        fd = os.open(f_name, os.O_RDONLY)
+
+        try:
+            size = os.fstat(fd).st_size
+
+            # The gaps between the resident ranges, up to the current size.
+            bounds = [0] + [item for pair in resident or [] for item in pair] \
+                + [size]
+            ranges = [(start, min(end, size)) for start, end
+                      in zip(bounds[::2], bounds[1::2])
+                      if start < min(end, size)]
+
+            for start, end in ranges:
+                fadvise(fd, start, end - start, "POSIX_FADV_DONTNEED")
+
+        finally:
+            os.close(fd)
+
+        dropped = sum(max(end - start, 0) for start, end in ranges)
+
+        with self.mutex:
+            self.stats["read_dropped"] += dropped
+            self.stats["read_kept"] += max(size - dropped, 0)
+
+    def written(self, f_name):
+
+        """Method:  written
+
+        Description:  Starts the write back of a written file and keeps it to
+            be dropped by finish.  Only clean pages can be dropped.
+
+        Arguments:
+            (input) f_name -> Directory path and file name
+
+        """
+
+        fd = os.open(f_name, os.O_RDONLY)
+
+        try:
+            fadvise(fd, 0, 0, "POSIX_FADV_DONTNEED")
+
+        finally:
+            os.close(fd)
+
+        with self.mutex:
+            self.files.append(f_name)
+
+    def finish(self):
+
+        """Method:  finish
+
+        Description:  Syncs and drops the pages of the written files and
+            returns the page cache statistics.
+
+        Arguments:
+            (output) Dictionary of the bytes read which were already cached
+                (read_kept), the bytes read and dropped (read_dropped), the
+                bytes written and dropped (written_dropped) and the size of
+                the page cache before and after (cached_before, cached_after)
+
+        """
+
+        with self.mutex:
+            files = self.files
+            self.files = []
+
+        for f_name in files:
+            try:
+                fd = os.open(f_name, os.O_RDONLY)
+
+            except FileNotFoundError:
+                continue
+
+            try:
+                os.fdatasync(fd)
+                fadvise(fd, 0, 0, "POSIX_FADV_DONTNEED")
+                self.stats["written_dropped"] += os.fstat(fd).st_size
+
+            finally:
+                os.close(fd)
+
+        return dict(self.stats, cached_before=self.cached,
+                    cached_after=get_cached())
+
+
+def get_out_paths(server, args, archive=None, dump_list=None):
+
+    """Function:  get_out_paths
+
+    Description:  Returns the paths of the output of a mongodump or
+        mongoexport run:  the archive, the export file, the -b database's
+        directory or the directories of the databases dumped, the --db=
+        entries of dump_list or the databases of the instance.  The logs,
+        archives, copies and earlier dumps beside them are not included.
 
     Arguments:
         (input) server -> Database server instance
         (input) args -> ArgParser class instance
-        (input) cmd_name -> Name of Mongo binary program to execute
-        (input) log_file -> Directory path and file name for log file
-        (input) **kwargs:
-            opt_arg -> Dictionary of additional options to add
-            req_arg -> List of required options for the command line
-            mail -> Email class instance
-            err_file -> Directory path and file name for error file
-        (output) err_flag -> If an error has occurred
-        (output) err_msg -> Error message
+        (input) archive -> Dictionary with the arch_file of an archive dump
+        (input) dump_list -> List of --db= options dumped in parallel
+        (output) List of directory paths or file names
 
     """
 
-    err_flag = False
-    err_msg = None
-    mail = kwargs.get("mail", None)
-    err_file = kwargs.get("err_file", log_file + ".err")
-    e_file = open(                                      # pylint:disable=R1732
-        err_file, mode="w", encoding="UTF-8")
-    cmd = mongo_libs.create_cmd(
-        server, args, cmd_name, "-p", no_pass=True, **kwargs)
-    proc2 = subprocess.Popen(                           # pylint:disable=R1732
-        ["echo", server.japd], stdout=subprocess.PIPE)
+    out_dir = args.get_val("-o")
 
-    with open(log_file, mode="w", encoding="UTF-8") as l_file:
-        proc1 = subprocess.Popen(                       # pylint:disable=R1732
-            cmd, stderr=l_file, stdin=proc2.stdout, stdout=e_file)
-        proc1.wait()
+    if archive:
+        return [archive["arch_file"]]
 
-    e_file.close()
-    process_log_file(log_file, args.arg_exist("-x"), mail)
+    if not os.path.isdir(out_dir):
+        return [out_dir]
 
-    if gen_libs.is_empty_file(err_file):
-        gen_libs.rm_file(err_file)
+    if args.arg_exist("-b"):
+        return [os.path.join(out_dir, args.get_val("-b"))]
 
-    else:
-        err_list = gen_libs.file_2_list(err_file)
-        err_flag = True
-        err_msg = f"Error detected in error file: {err_file}"
+    db_list = [option.split("=", 1)[1] for option in dump_list] \
+        if dump_list else get_db_list(server) or []
 
-        if mail:
-            mail.add_2_msg("Error messages detected during dump:")
+    return [os.path.join(out_dir, name) for name in db_list]
 
-        for line in err_list:
-            print(line)
 
-            if mail:
-                mail.add_2_msg(line)
+def get_written(paths, since):
 
-    if mail and mail.msg:
-        mail.send_mail()
+    """Function:  get_written
 
-    return err_flag, err_msg
+    Description:  Returns the files written by an external dump or export
+        program, the files under paths modified since the program started.
+
+    Arguments:
+        (input) paths -> List of directory paths or file names of the
+            program's output
+        (input) since -> time.time_ns() when the program started
+        (output) f_list -> List of file names
 
+    """
 
-def process_log_file(log_file, sup_std, mail):
+    f_list = []
 
-    """Function:  process_log_file
+    for path in paths:
+        for f_name in [path] if os.path.isfile(path) else [
+                os.path.join(root, name) for root, _, files in os.walk(path)
+                for name in files]:
 
-    Description:  Checks and processes the log file to standard out and mail.
+            try:
+                if os.stat(f_name).st_mtime_ns >= since:
+                    f_list.append(f_name)
+
+            except FileNotFoundError:
+                continue
+
+    return f_list
+
+
+def drop_written(paths, since, page_cache):
+
+    """Function:  drop_written
+
+    Description:  Drops from the page cache the files written by an external
+        dump or export program, the files under paths modified since the
+        program started.
 
     Arguments:
-        (input) log_file -> Directory path and file name for log file
-        (input) sup_std -> True|False -Suppress standard out
-        (input) mail -> Email class instance
+        (input) paths -> List of directory paths or file names of the
+            program's output
+        (input) since -> time.time_ns() when the program started
+        (input) page_cache -> PageCache instance
 
     """
 
-    if not gen_libs.is_empty_file(log_file):
-        log_list = gen_libs.file_2_list(log_file)
+    for f_name in get_written(paths, since):
+        page_cache.written(f_name)
 
-        if not sup_std:
-            for line in log_list:
-                print(line)
 
-        if mail:
-            for line in log_list:
-                mail.add_2_msg(line)
+def check_cancel(cancel, f_name):
+
+    """Function:  check_cancel
+
+    Description:  Raises InterruptedError if the copy has been cancelled.
+
+    Arguments:
+        (input) cancel -> threading.Event instance or None
+        (input) f_name -> Name of the file being copied
+
+    """
+
+    if cancel and cancel.is_set():
+        raise InterruptedError(f"Copy cancelled: {f_name}")
+
+
+def get_extents(fd, size):
+
+    """Function:  get_extents
+
+    Description:  Returns the data extents of a file, skipping its holes, using
+        SEEK_DATA/SEEK_HOLE.  If the filesystem cannot report holes the whole
+        file is returned as one extent.
+
+    Arguments:
+        (input) fd -> File descriptor
+        (input) size -> Size of the file
+        (output) extents -> List of (start, end) offsets of the data
+
+    """
+
+    extents = []
+    offset = 0
+
+    if not hasattr(os, "SEEK_DATA"):
+        return [(0, size)] if size else []
+
+    try:
+        while offset < size:
+            start = os.lseek(fd, offset, os.SEEK_DATA)
+            offset = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+
+            if start < offset:
+                extents.append((start, offset))
+
+    except OSError as msg:
+        # ENXIO means there is no more data after the offset.
+        if msg.errno != errno.ENXIO:
+            if msg.errno not in (errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+
+            extents = [(0, size)] if size else []
+
+    return extents
+
+
+def kernel_cp(src, dst, method, **kwargs):
+
+    """Function:  kernel_cp
+
+    Description:  Copies an open file's data in-kernel using copy_file_range
+        or sendfile in chunks.  Only the data extents are copied, holes are
+        left as holes in the destination.
+
+    Arguments:
+        (input) src -> Source file object
+        (input) dst -> Destination file object
+        (input) method -> copy_file_range|sendfile
+        (input) **kwargs:
+            chunk_size -> Number of bytes per call
+            cancel -> threading.Event instance to cancel the copy
+            limiter -> TokenBucket instance limiting the copy rate
+
+    """
+
+    chunk_size = kwargs.get("chunk_size", 67108864)
+    limiter = kwargs.get("limiter", None)
+    size = os.fstat(src.fileno()).st_size
+    length = size
+    fadvise(src.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+
+    for start, end in get_extents(src.fileno(), size):
+        offset = start
+
+        if method == "sendfile":
+            os.lseek(dst.fileno(), start, os.SEEK_SET)
+
+        while offset < end:
+            check_cancel(kwargs.get("cancel", None), src.name)
+            count = min(end - offset, chunk_size)
+
+            if limiter:
+                limiter.consume(count)
+
+            if method == "sendfile":
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, count)
+
+            else:
+                sent = os.copy_file_range(
+                    src.fileno(), dst.fileno(), count, offset, offset)
+
+            if not sent:
+                break
+
+            offset += sent
+
+        # The file shrank during the copy.
+        if offset < end:
+            length = offset
+            break
+
+    os.ftruncate(dst.fileno(), length)
+
+
+def clone_file(src_file, dst_file, **kwargs):
+
+    """Function:  clone_file
+
+    Description:  Copies a file without passing the data through user space.
+        By default first tries to clone the file's extents (FICLONE) which is
+        nearly instant on filesystems with reflink support (XFS, btrfs), then
+        tries an in-kernel copy_file_range.
+
+    Arguments:
+        (input) src_file -> Source directory path and file name
+        (input) dst_file -> Destination directory path and file name
+        (input) **kwargs:
+            methods -> List of methods to try in order:  ficlone,
+                copy_file_range, sendfile
+            chunk_size -> Number of bytes per copy_file_range/sendfile call
+            cancel -> threading.Event instance to cancel the copy
+            limiter -> TokenBucket instance limiting the copy rate
+        (output) method -> Name of the method used or None if the file could
+            not be copied by any of the methods
+
+    """
+
+    methods = kwargs.get("methods", CP_METHODS["auto"])
+
+    with open(src_file, mode="rb") as src, open(dst_file, mode="wb") as dst:
+        for method in methods:
+            try:
+                if method == "ficlone":
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+                elif hasattr(os, method):
+                    kernel_cp(src, dst, method, **kwargs)
+
+                else:
+                    continue
+
+                return method
+
+            except OSError as msg:
+                if msg.errno not in CLONE_ERRNO:
+                    raise
+
+    return None
+
+
+def direct_open(dst_file):
+
+    """Function:  direct_open
+
+    Description:  Opens a file for writing with O_DIRECT.  Returns None if the
+        filesystem does not support O_DIRECT.
+
+    Arguments:
+        (input) dst_file -> Directory path and file name
+        (output) File descriptor or None
+
+    """
+
+    if hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(
+                dst_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT,
+                0o644)
+
+        except OSError as msg:
+            if msg.errno != errno.EINVAL:
+                raise
+
+    return None
+
+
+def hash_zeros(hasher, count):
+
+    """Function:  hash_zeros
+
+    Description:  Updates a hash object with a run of zero bytes, the contents
+        of a hole.
+
+    Arguments:
+        (input) hasher -> hashlib object
+        (input) count -> Number of zero bytes
+
+    """
+
+    zeros = bytes(min(count, 1048576))
+
+    while count > 0:
+        hasher.update(zeros[:count])
+        count -= len(zeros)
+
+
+def stream_copy(                                   # pylint:disable=R0912,R0914
+        src_file, dst_file, **kwargs):
+
+    """Function:  stream_copy
+
+    Description:  Copies a file's data through a user space buffer.  Only the
+        data extents are copied, holes are left as holes in the destination.
+        With direct set the destination is written with O_DIRECT from a page
+        aligned buffer, bypassing the page cache, and the padding of the last
+        block is truncated away.
+
+    Arguments:
+        (input) src_file -> Source directory path and file name
+        (input) dst_file -> Destination directory path and file name
+        (input) **kwargs:
+            chunk_size -> Number of bytes per read
+            direct -> True|False - Write the destination with O_DIRECT
+            hasher -> hashlib object updated with the data as it is copied,
+                including the zeros of the holes
+            cancel -> threading.Event instance to cancel the copy
+            limiter -> TokenBucket instance limiting the copy rate
+            fan_out -> List of additional destination files each chunk read
+                is also written to
+
+    """
+
+    hasher = kwargs.get("hasher", None)
+    limiter = kwargs.get("limiter", None)
+    dst_fds = []
+
+    # O_DIRECT requires aligned buffers and block sized writes.
+    chunk_size = -(-kwargs.get("chunk_size", 1048576) // mmap.PAGESIZE) \
+        * mmap.PAGESIZE
+
+    with mmap.mmap(-1, chunk_size) as buf, \
+            open(src_file, mode="rb", buffering=0) as src:
+        view = memoryview(buf)
+        size = os.fstat(src.fileno()).st_size
+        hashed = 0
+        fadvise(src.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+
+        try:
+            for f_name in [dst_file] + (kwargs.get("fan_out", None) or []):
+                dst_fd = direct_open(f_name) if kwargs.get("direct", False) \
+                    else None
+
+                if dst_fd is None:
+                    dst_fds.append((os.open(
+                        f_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                        0o644), 1))
+
+                else:
+                    dst_fds.append((dst_fd, mmap.PAGESIZE))
+
+            align = max(item[1] for item in dst_fds)
+
+            for start, end in get_extents(src.fileno(), size):
+                pos = start // align * align
+                end = -(-end // align) * align
+
+                while pos < end:
+                    check_cancel(kwargs.get("cancel", None), src_file)
+
+                    if limiter:
+                        limiter.consume(min(end - pos, chunk_size))
+
+                    # Read the next chunk while this one is written.
+                    fadvise(src.fileno(), pos + chunk_size, chunk_size,
+                            "POSIX_FADV_WILLNEED")
+                    src.seek(pos)
+                    cnt = src.readinto(view[:min(end - pos, chunk_size)])
+
+                    if not cnt:
+                        break
+
+                    if hasher:
+                        hash_zeros(hasher, pos - hashed)
+                        hasher.update(view[max(hashed - pos, 0):cnt])
+                        hashed = max(hashed, pos + cnt)
+
+                    for dst_fd, fd_align in dst_fds:
+                        os.lseek(dst_fd, pos, os.SEEK_SET)
+                        wrt_end = -(-cnt // fd_align) * fd_align
+                        offset = 0
+
+                        while offset < wrt_end:
+                            offset += os.write(dst_fd, view[offset:wrt_end])
+
+                    pos += cnt
+
+                # The file shrank during the copy.
+                if pos < min(end, size):
+                    size = pos
+                    break
+
+            if hasher:
+                hash_zeros(hasher, size - hashed)
+
+            for dst_fd, _ in dst_fds:
+                os.ftruncate(dst_fd, size)
+
+        finally:
+            view.release()
+
+            for dst_fd, _ in dst_fds:
+                os.close(dst_fd)
+
+
+def file_digest(f_name, algo="sha256", limiter=None, page_cache=None):
+
+    """Function:  file_digest
+
+    Description:  Returns the hex digest of a file's contents.
+
+    Arguments:
+        (input) f_name -> Directory path and file name
+        (input) algo -> Name of the hashlib algorithm
+        (input) limiter -> TokenBucket instance limiting the read rate
+        (input) page_cache -> PageCache instance to drop the pages read
+        (output) Hex digest of the file
+
+    """
+
+    f_hash = hashlib.new(algo)
+    resident = page_cache.resident(f_name) if page_cache else None
+
+    with open(f_name, mode="rb") as f_hdlr:
+        fadvise(f_hdlr.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+
+        while True:
+            if limiter:
+                limiter.consume(1048576)
+
+            chunk = f_hdlr.read(1048576)
+
+            if not chunk:
+                break
+
+            f_hash.update(chunk)
+
+    if page_cache:
+        page_cache.release(f_name, resident)
+
+    return f_hash.hexdigest()
+
+
+def is_unchanged(src_file, prev_file, use_hash=False, page_cache=None):
+
+    """Function:  is_unchanged
+
+    Description:  Checks if a file is the same as the copy of it in a previous
+        dump.  Compares size and modification time and optionally the
+        contents' digest.
+
+    Arguments:
+        (input) src_file -> Source directory path and file name
+        (input) prev_file -> Directory path and file name in previous dump
+        (input) use_hash -> True|False - Also compare file digests
+        (input) page_cache -> PageCache instance to drop the pages read
+        (output) True|False - If the file is unchanged
+
+    """
+
+    if not os.path.isfile(prev_file):
+        return False
+
+    src_stat = os.stat(src_file)
+    prev_stat = os.stat(prev_file)
+    status = src_stat.st_size == prev_stat.st_size \
+        and src_stat.st_mtime_ns == prev_stat.st_mtime_ns
+
+    if status and use_hash:
+        status = file_digest(src_file, page_cache=page_cache) \
+            == file_digest(prev_file, page_cache=page_cache)
+
+    return status
+
+
+def cp_file(src_file, dst_file, **kwargs):
+
+    """Function:  cp_file
+
+    Description:  Copies a single file along with its metadata.  The file is
+        hardlinked to the previous dump's copy if it is unchanged, cloned
+        when the filesystem allows it, otherwise it is copied.
+
+    Arguments:
+        (input) src_file -> Source directory path and file name
+        (input) dst_file -> Destination directory path and file name
+        (input) **kwargs:
+            prev_file -> Directory path and file name in previous dump
+            use_hash -> True|False - Compare digests against previous dump
+            method -> Copy method from CP_METHODS, default is auto
+            chunk_size -> Number of bytes per copy call
+            direct -> True|False - Write with O_DIRECT when copied through
+                user space
+            hasher -> hashlib object updated with the data as it is copied,
+                the data is then always copied through user space
+            cancel -> threading.Event instance to cancel the copy
+            limiter -> TokenBucket instance limiting the copy rate
+            fan_out -> List of additional destination files written from the
+                same reads, the data is then always copied through user space
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) Number of data bytes written to dst_file, holes are not
+            written and a linked or cloned file shares its data
+
+    """
+
+    prev_file = kwargs.get("prev_file", None)
+    cancel = kwargs.get("cancel", None)
+    fan_out = kwargs.get("fan_out", None) or []
+    page_cache = kwargs.get("page_cache", None)
+    linked = False
+    method = None
+    check_cancel(cancel, src_file)
+
+    # Replace rather than overwrite, the file may be linked to another dump.
+    for f_name in [dst_file] + fan_out:
+        if os.path.lexists(f_name):
+            os.remove(f_name)
+
+    if prev_file \
+       and is_unchanged(src_file, prev_file, kwargs.get("use_hash", False),
+                        page_cache=page_cache):
+        try:
+            os.link(prev_file, dst_file)
+            linked = True
+
+        except OSError as msg:
+            if msg.errno not in (errno.EXDEV, errno.EMLINK, errno.EPERM):
+                raise
+
+    cp_args = {"chunk_size": kwargs.get("chunk_size", 67108864),
+               "cancel": cancel, "limiter": kwargs.get("limiter", None),
+               "direct": kwargs.get("direct", False)}
+    resident = page_cache.resident(src_file) \
+        if page_cache and (fan_out or not linked) else None
+
+    # The previous dump is only in dst_file's directory tree.
+    if linked and fan_out:
+        stream_copy(src_file, fan_out[0], fan_out=fan_out[1:], **cp_args)
+
+    elif not linked:
+        methods = () if kwargs.get("hasher", None) or fan_out \
+            else CP_METHODS[kwargs.get("method", "auto")]
+
+        method = clone_file(src_file, dst_file, methods=methods, **cp_args)
+
+        if not method:
+            stream_copy(src_file, dst_file, fan_out=fan_out,
+                        hasher=kwargs.get("hasher", None), **cp_args)
+
+    for f_name in ([] if linked else [dst_file]) + fan_out:
+        shutil.copystat(src_file, f_name)
+
+    # A clone shares the extents, no data went through the page cache.
+    if page_cache and (fan_out or not linked) and method != "ficlone":
+        page_cache.release(src_file, resident)
+
+        for f_name in ([] if linked else [dst_file]) + fan_out:
+            page_cache.written(f_name)
+
+    if linked or method == "ficlone":
+        return 0
+
+    with open(dst_file, mode="rb") as dst:
+        return sum(end - start for start, end in get_extents(
+            dst.fileno(), os.fstat(dst.fileno()).st_size))
+
+
+def cp_manifest_file(src_file, dst_file, **kwargs):
+
+    """Function:  cp_manifest_file
+
+    Description:  Copies a single file with cp_file and returns its manifest
+        entry.  The digest is computed from the data as it is copied.  For a
+        file hardlinked to the previous dump the previous manifest's digest
+        is used if the entry still matches, otherwise the file is read.
+
+    Arguments:
+        (input) src_file -> Source directory path and file name
+        (input) dst_file -> Destination directory path and file name
+        (input) **kwargs:
+            algo -> Digest algorithm, default is sha256
+            prev_entry -> Manifest entry of the file in the previous dump
+            Any cp_file keyword arguments
+        (output) Number of bytes written
+        (output) entry -> Dictionary of size, mtime_ns and digest
+
+    """
+
+    hasher = hashlib.new(kwargs.get("algo", "sha256"))
+    written = cp_file(src_file, dst_file, hasher=hasher, **kwargs)
+    dst_stat = os.stat(dst_file)
+    prev_entry = kwargs.get("prev_entry", None) or {}
+
+    if written or not dst_stat.st_size:
+        digest = hasher.hexdigest()
+
+    elif prev_entry.get("size") == dst_stat.st_size \
+            and prev_entry.get("mtime_ns") == dst_stat.st_mtime_ns:
+        digest = prev_entry["digest"]
+
+    else:
+        digest = file_digest(dst_file, kwargs.get("algo", "sha256"))
+
+    return written, {"size": dst_stat.st_size,
+                     "mtime_ns": dst_stat.st_mtime_ns, "digest": digest}
+
+
+def parallel_cp(                                   # pylint:disable=R0912,R0914
+        src_dir, dst_dir, **kwargs):
+
+    """Function:  parallel_cp
+
+    Description:  Copies a directory tree using a pool of worker threads.  The
+        largest files are scheduled first and directory metadata is copied
+        once all of the files are in place.
+
+    Arguments:
+        (input) src_dir -> Source directory path
+        (input) dst_dir -> Destination directory path
+        (input) **kwargs:
+            threads -> Number of copy worker threads
+            prev_dir -> Previous dump directory to hardlink unchanged files to
+            use_hash -> True|False - Compare digests against previous dump
+            cp_list -> (dir_list, file_list) from get_cp_files to copy
+                instead of walking src_dir
+            cp_filter -> Dictionary of get_cp_files include and exclude
+                patterns
+            exist_ok -> True|False - Allow dst_dir to already exist
+            missing_ok -> True|False - Skip files and directories removed
+                from src_dir during the copy
+            stats -> Dictionary the files, bytes (logical), bytes_physical
+                (allocated) and bytes_written (data written, not linked,
+                cloned or holes) counts are added to
+            cancel -> threading.Event instance to cancel the copy
+            cp_opts -> Dictionary of cp_file copy method, chunk_size and
+                direct settings
+            manifest -> Dictionary the manifest entry of each file copied is
+                added to, the files are hashed as they are copied
+            prev_manifest -> Manifest of the previous dump (prev_dir)
+            limiter -> TokenBucket instance limiting the copy rate
+            fan_out_dirs -> List of additional destination directory paths
+                written from the same reads as dst_dir
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    threads = kwargs.get("threads", 1)
+    cancel = kwargs.get("cancel", None)
+    cp_opts = kwargs.get("cp_opts", {})
+    manifest = kwargs.get("manifest", None)
+    prev_manifest = kwargs.get("prev_manifest", None) or {}
+    cp_func = cp_file if manifest is None else cp_manifest_file
+    dst_dirs = [dst_dir] + (kwargs.get("fan_out_dirs", None) or [])
+    prev_dir = kwargs.get("prev_dir", None)
+    use_hash = kwargs.get("use_hash", False)
+    missing_ok = kwargs.get("missing_ok", False)
+    stats = kwargs.get("stats", {})
+
+    for key in ["files", "bytes", "bytes_physical", "bytes_written"]:
+        stats.setdefault(key, 0)
+
+    try:
+        dir_list, file_list = kwargs.get("cp_list", None) \
+            or get_cp_files(src_dir, **kwargs.get("cp_filter", {}))
+        for item in dst_dirs:
+            os.makedirs(item, exist_ok=kwargs.get("exist_ok", False))
+
+        for item in [os.path.join(root, name) for root in dst_dirs
+                     for name in dir_list]:
+            os.makedirs(item, exist_ok=True)
+
+    except OSError as msg:
+        return True, f"Error:  Unable to setup copy of {src_dir}: {msg}"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = {
+            pool.submit(
+                cp_func, os.path.join(src_dir, rel_path),
+                os.path.join(dst_dir, rel_path), use_hash=use_hash,
+                cancel=cancel, prev_file=os.path.join(prev_dir, rel_path)
+                if prev_dir else None, prev_entry=prev_manifest.get(rel_path),
+                limiter=kwargs.get("limiter", None),
+                page_cache=kwargs.get("page_cache", None),
+                fan_out=[os.path.join(item, rel_path)
+                         for item in dst_dirs[1:]], **cp_opts):
+            (rel_path, size)
+            for rel_path, size, _ in file_list}
+
+        for future in concurrent.futures.as_completed(futures):
+            if future.cancelled():
+                continue
+
+            try:
+                written = future.result()
+
+                if manifest is not None:
+                    written, manifest[futures[future][0]] = written
+
+                stats["bytes_written"] += written
+                stats["bytes"] += futures[future][1]
+                stats["bytes_physical"] += os.lstat(os.path.join(
+                    dst_dir, futures[future][0])).st_blocks * 512
+                stats["files"] += 1
+
+            except FileNotFoundError as msg:
+                if not missing_ok and not err_flag:
+                    err_flag = True
+                    err_msg = f"Error:  Copy failed for" \
+                        f" {futures[future][0]}: {msg}"
+
+            except OSError as msg:
+                if not err_flag:
+                    err_flag = True
+                    err_msg = f"Error:  Copy failed for" \
+                        f" {futures[future][0]}: {msg}"
+
+                    # Do not start any copies still waiting in the queue.
+                    for item in futures:
+                        item.cancel()
+
+    for root in dst_dirs if not err_flag else []:
+        for item in sorted(dir_list, reverse=True):
+            try:
+                shutil.copystat(
+                    os.path.join(src_dir, item), os.path.join(root, item))
+
+            except FileNotFoundError:
+                if not missing_ok:
+                    raise
+
+        shutil.copystat(src_dir, root)
+
+    return err_flag, err_msg
+
+
+def pre_cp(src_dir, dst_dir, **kwargs):
+
+    """Function:  pre_cp
+
+    Description:  Copies a directory tree while the database is still in use
+        and returns a snapshot of the files as they were before the copy for
+        delta_cp to bring the copy up to date later.
+
+    Arguments:
+        (input) src_dir -> Source directory path
+        (input) dst_dir -> Destination directory path, must not exist
+        (input) **kwargs:
+            threads -> Number of copy worker threads
+            prev_dir -> Previous dump directory to hardlink unchanged files to
+            use_hash -> True|False - Compare digests against previous dump
+            stats -> Dictionary the copy counts are added to
+            manifest -> Dictionary the manifest entries are added to
+            cp_filter -> Dictionary of get_cp_files include and exclude
+                patterns
+            limiter -> TokenBucket instance limiting the copy rate
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+        (output) snapshot -> (walk_time, cp_list) of the pre-copy
+
+    """
+
+    walk_time = time.time_ns()
+
+    try:
+        cp_list = get_cp_files(src_dir, **kwargs.get("cp_filter", {}))
+
+    except OSError as msg:
+        return True, f"Error:  Unable to setup copy of {src_dir}: {msg}", None
+
+    err_flag, err_msg = parallel_cp(
+        src_dir, dst_dir, cp_list=cp_list, missing_ok=True, **kwargs)
+
+    return err_flag, err_msg, (walk_time, cp_list)
+
+
+def delta_cp(                                            # pylint:disable=R0914
+        src_dir, dst_dir, snapshot, **kwargs):
+
+    """Function:  delta_cp
+
+    Description:  Brings a pre-copied directory tree up to date.  Copies the
+        files which changed or were added since the pre-copy's directory walk
+        and removes the files and directories which were deleted since.  Files
+        modified within a second of the walk are always copied again as their
+        modification time may not show a later change.
+
+    Arguments:
+        (input) src_dir -> Source directory path
+        (input) dst_dir -> Destination directory path of the pre-copy
+        (input) snapshot -> (walk_time, cp_list) returned by pre_cp
+        (input) **kwargs:
+            threads -> Number of copy worker threads
+            stats -> Dictionary the copy counts are added to
+            cancel -> threading.Event instance to cancel the copy
+            cp_opts -> Dictionary of cp_file copy settings
+            manifest -> Manifest from pre_cp, updated with the changes
+            cp_filter -> Dictionary of get_cp_files include and exclude
+                patterns, same as the pre-copy
+            limiter -> TokenBucket instance limiting the copy rate
+            fan_out_dirs -> List of additional pre-copy directory paths
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    walk_time, cp_list = snapshot
+    manifest = kwargs.get("manifest", None)
+    fan_out_dirs = kwargs.get("fan_out_dirs", None) or []
+    racy_time = walk_time - 1000000000
+    prev_files = {item[0]: item[1:] for item in cp_list[1]}
+
+    try:
+        dir_list, file_list = get_cp_files(
+            src_dir, **kwargs.get("cp_filter", {}))
+        cur_files = {item[0] for item in file_list}
+        file_list = [
+            item for item in file_list
+            if prev_files.get(item[0]) != item[1:] or item[2] >= racy_time
+            or not all(os.path.lexists(os.path.join(root, item[0]))
+                       for root in [dst_dir] + fan_out_dirs)]
+
+        for root in [dst_dir] + fan_out_dirs:
+            for rel_path in set(prev_files) - cur_files:
+                if os.path.lexists(os.path.join(root, rel_path)):
+                    os.remove(os.path.join(root, rel_path))
+
+            for rel_path in set(cp_list[0]) - set(dir_list):
+                shutil.rmtree(os.path.join(root, rel_path), ignore_errors=True)
+
+        for rel_path in set(manifest or {}) - cur_files:
+            del manifest[rel_path]
+
+    except OSError as msg:
+        return True, f"Error:  Unable to setup delta copy of {src_dir}: {msg}"
+
+    return parallel_cp(
+        src_dir, dst_dir, cp_list=(dir_list, file_list), exist_ok=True,
+        threads=kwargs.get("threads", 1), stats=kwargs.get("stats", {}),
+        cancel=kwargs.get("cancel", None), cp_opts=kwargs.get("cp_opts", {}),
+        manifest=manifest, limiter=kwargs.get("limiter", None),
+        fan_out_dirs=fan_out_dirs, page_cache=kwargs.get("page_cache", None))
+
+
+def get_prev_dump(dump_dir):
+
+    """Function:  get_prev_dump
+
+    Description:  Returns the most recent complete cp_dump_* directory in the
+        dump directory.
+
+    Arguments:
+        (input) dump_dir -> Directory path to dump directory
+        (output) prev_dir -> Directory path of previous dump or None
+
+    """
+
+    dump_list = sorted(
+        item for item in os.listdir(dump_dir)
+        if item.startswith("cp_dump_")
+        and os.path.isdir(os.path.join(dump_dir, item))
+        and not os.path.exists(
+            os.path.join(dump_dir, item, "cp_dump_incomplete")))
+
+    return os.path.join(dump_dir, dump_list[-1]) if dump_list else None
+
+
+def write_manifest(dmp_dir, manifest, algo="sha256"):
+
+    """Function:  write_manifest
+
+    Description:  Writes the checksum manifest (path, size, mtime and digest
+        of each file) to cp_dump_manifest.json in the dump directory.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) manifest -> Dictionary of relative path and manifest entry
+        (input) algo -> Digest algorithm
+        (output) f_name -> Directory path and file name of the manifest
+
+    """
+
+    f_name = os.path.join(dmp_dir, "cp_dump_manifest.json")
+
+    with open(f_name, mode="w", encoding="UTF-8") as f_hdlr:
+        json.dump(
+            {"algo": algo,
+             "files": [{"path": rel_path, **manifest[rel_path]}
+                       for rel_path in sorted(manifest)]},
+            f_hdlr, indent=1)
+
+    return f_name
+
+
+def load_manifest(dmp_dir):
+
+    """Function:  load_manifest
+
+    Description:  Reads the checksum manifest of a dump directory.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (output) algo -> Digest algorithm or None if there is no manifest
+        (output) manifest -> Dictionary of relative path and manifest entry
+
+    """
+
+    try:
+        with open(os.path.join(dmp_dir, "cp_dump_manifest.json"), mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            data = json.load(f_hdlr)
+
+    except FileNotFoundError:
+        return None, {}
+
+    return data["algo"], {item.pop("path"): item for item in data["files"]}
+
+
+def verify_file(f_name, entry, algo="sha256", limiter=None, page_cache=None):
+
+    """Function:  verify_file
+
+    Description:  Checks a file against its manifest entry.
+
+    Arguments:
+        (input) f_name -> Directory path and file name
+        (input) entry -> Manifest entry of the file
+        (input) algo -> Digest algorithm
+        (input) limiter -> TokenBucket instance limiting the read rate
+        (input) page_cache -> PageCache instance to drop the pages read
+        (output) Reason the file failed or None if it matches
+
+    """
+
+    try:
+        if os.path.getsize(f_name) != entry["size"]:
+            return "size mismatch"
+
+        if file_digest(f_name, algo, limiter, page_cache) != entry["digest"]:
+            return "digest mismatch"
+
+    except OSError as msg:
+        return str(msg)
+
+    return None
+
+
+def verify_dump(args, **kwargs):
+
+    """Function:  verify_dump
+
+    Description:  Verifies a Sync/Copy dump directory against its checksum
+        manifest, hashing the files in parallel.  The reads are limited to the
+        cp_rate_limit and cp_iops_limit configuration entries and dropped
+        from the page cache unless drop_cache is False.  Only the dump's
+        files are used, no server.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            mail -> Email class instance
+            cfg -> Configuration module with the rate limit and page cache
+                settings
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    mail = kwargs.get("mail", None)
+    dmp_dir = args.get_val("-C")
+    limiter = TokenBucket(
+        getattr(kwargs.get("cfg", None), "cp_rate_limit", None),
+        getattr(kwargs.get("cfg", None), "cp_iops_limit", None))
+    page_cache = PageCache() \
+        if getattr(kwargs.get("cfg", None), "drop_cache", True) else None
+
+    try:
+        algo, manifest = load_manifest(dmp_dir)
+
+    except (OSError, ValueError, KeyError) as msg:
+        algo, manifest = None, {}
+        err_flag = True
+        err_msg = f"Error:  Unable to read manifest in {dmp_dir}: {msg}"
+
+    if not err_flag and not algo:
+        err_flag = True
+        err_msg = f"Error:  No manifest found in {dmp_dir}"
+
+    elif not err_flag and load_delta(dmp_dir):
+        err_flag = True
+        err_msg = f"Error:  {dmp_dir} is stored as block deltas, restore it" \
+            f" (-R option) to verify it."
+
+    elif not err_flag:
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1) as pool:
+            results = pool.map(
+                lambda rel_path: (rel_path, verify_file(
+                    os.path.join(dmp_dir, rel_path), manifest[rel_path],
+                    algo, limiter, page_cache)), manifest)
+            failed = [f"{rel_path}: {reason}" for rel_path, reason in results
+                      if reason]
+
+        if failed:
+            err_flag = True
+            err_msg = f"Error:  Verify failed for {len(failed)} of" \
+                f" {len(manifest)} files in {dmp_dir}:  " + ", ".join(failed)
+
+    if mail:
+        mail.add_2_msg(err_msg if err_flag else
+                       f"Verified {len(manifest)} files in {dmp_dir}")
+        mail.send_mail()
+
+    return err_flag, err_msg
+
+
+def get_signature(f_name, block_size):
+
+    """Function:  get_signature
+
+    Description:  Returns the block signature of a file:  the adler32 weak
+        checksum and blake2b strong digest of each full block.  Holds an
+        entry per block in memory, about 200 bytes each.
+
+    Arguments:
+        (input) f_name -> Directory path and file name
+        (input) block_size -> Number of bytes per block
+        (output) signature -> Dictionary of weak checksum and a dictionary of
+            strong digest and block number
+
+    """
+
+    signature = collections.defaultdict(dict)
+
+    with open(f_name, mode="rb") as f_hdlr:
+        for block_num, block in enumerate(
+                iter(functools.partial(f_hdlr.read, block_size), b"")):
+            if len(block) == block_size:
+                signature[zlib.adler32(block)].setdefault(
+                    hashlib.blake2b(block, digest_size=16).digest(),
+                    block_num)
+
+    return signature
+
+
+class DeltaWriter():
+
+    """Class:  DeltaWriter
+
+    Description:  Writes the records of a block delta file, merging adjacent
+        block copies into a single record.
+
+    Methods:
+        __init__
+        copy
+        data
+        flush
+        end
+
+    """
+
+    def __init__(self, f_hdlr):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) f_hdlr -> File handle of the delta file
+
+        """
+
+        self.f_hdlr = f_hdlr
+        self.offset = None
+        self.length = 0
+        self.f_hdlr.write(DELTA_MAGIC)
+
+    def copy(self, offset, length):
+
+        """Method:  copy
+
+        Description:  Adds a copy of a range of the base file.
+
+        Arguments:
+            (input) offset -> Offset of the range in the base file
+            (input) length -> Number of bytes in the range
+
+        """
+
+        if self.offset is not None and self.offset + self.length == offset:
+            self.length += length
+
+        else:
+            self.flush()
+            self.offset = offset
+            self.length = length
+
+    def data(self, data):
+
+        """Method:  data
+
+        Description:  Adds bytes which are not in the base file.
+
+        Arguments:
+            (input) data -> Bytes to add
+
+        """
+
+        if data:
+            self.flush()
+            self.f_hdlr.write(DELTA_DATA.pack(b"D", len(data)))
+            self.f_hdlr.write(data)
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Writes the pending copy record.
+
+        Arguments:
+
+        """
+
+        if self.offset is not None:
+            self.f_hdlr.write(
+                DELTA_COPY.pack(b"C", self.offset, self.length))
+            self.offset = None
+            self.length = 0
+
+    def end(self, size, digest):
+
+        """Method:  end
+
+        Description:  Writes the end record with the size and sha256 digest
+            of the file the delta rebuilds.
+
+        Arguments:
+            (input) size -> Size of the rebuilt file
+            (input) digest -> sha256 digest of the rebuilt file
+
+        """
+
+        self.flush()
+        self.f_hdlr.write(DELTA_END.pack(b"E", size, digest))
+
+
+def make_delta(                         # pylint:disable=R0913,R0914,R0917
+        src_file, base_file, delta_file, block_size, max_roll=4096,
+        roll_limit=DELTA_ROLL_LIMIT):
+
+    """Function:  make_delta
+
+    Description:  Writes a block delta file which rebuilds src_file from
+        base_file.  Blocks of src_file found in base_file are stored as copies
+        of base_file, the rest as data.  After a block is not found, the
+        adler32 checksum is rolled forward looking for a block at any offset
+        (confirmed with blake2b), max_roll bytes at a time before the data
+        limit is checked again.  With max_roll of 0 only block aligned
+        offsets are checked.  Gives up once over half of the file would be
+        data.  The roll is a byte at a time in Python, so once roll_limit
+        bytes have been rolled over only block aligned offsets are checked,
+        which bounds the time a heavily changed file takes.
+
+    Arguments:
+        (input) src_file -> Directory path and file name of the file to store
+        (input) base_file -> Directory path and file name of the base file
+        (input) delta_file -> Directory path and file name of the delta file
+        (input) block_size -> Number of bytes per block
+        (input) max_roll -> Number of bytes to roll the checksum between
+            checks of the data limit
+        (input) roll_limit -> Number of bytes of the file to roll the
+            checksum over
+        (output) Size of the delta file or None if not worth storing
+
+    """
+
+    signature = get_signature(base_file, block_size)
+    size = os.path.getsize(src_file)
+
+    with open(src_file, mode="rb") as s_hdlr, \
+            open(delta_file, mode="wb") as d_hdlr:
+        data = mmap.mmap(s_hdlr.fileno(), 0, access=mmap.ACCESS_READ) \
+            if size else b""
+        writer = DeltaWriter(d_hdlr)
+        pos = start = data_bytes = rolled = 0
+
+        while pos + block_size <= size and data_bytes + pos - start \
+                <= size // 2:
+            block = data[pos:pos + block_size]
+            weak = zlib.adler32(block)
+            block_num = signature[weak].get(hashlib.blake2b(
+                block, digest_size=16).digest()) if weak in signature \
+                else None
+            end = min(pos + max_roll, size - block_size,
+                      pos + max(roll_limit - rolled, 0))
+            miss = pos
+
+            while block_num is None and pos < end:
+                out_byte = data[pos]
+                in_byte = data[pos + block_size]
+                sum_a = (weak & 0xffff) - out_byte + in_byte
+                sum_b = ((weak >> 16) - block_size * out_byte - 1 + sum_a) \
+                    % 65521
+                weak = (sum_b << 16) | sum_a % 65521
+                pos += 1
+
+                if weak in signature:
+                    block_num = signature[weak].get(hashlib.blake2b(
+                        data[pos:pos + block_size], digest_size=16).digest())
+
+            rolled += pos - miss
+
+            if block_num is None:
+                pos = end + 1 if end > miss else miss + block_size
+
+            else:
+                data_bytes += pos - start
+                writer.data(data[start:pos])
+                writer.copy(block_num * block_size, block_size)
+                pos = start = pos + block_size
+
+        if data_bytes + size - start > size // 2 and size:
+            data.close()
+
+            return None
+
+        writer.data(data[start:])
+        writer.end(size, hashlib.sha256(data).digest())
+
+        if size:
+            data.close()
+
+    return os.path.getsize(delta_file)
+
+
+def apply_delta(delta_file, base_file, dst_file):
+
+    """Function:  apply_delta
+
+    Description:  Rebuilds a file from a block delta file and its base file
+        and checks the size and sha256 digest of the rebuilt file.
+
+    Arguments:
+        (input) delta_file -> Directory path and file name of the delta file
+        (input) base_file -> Directory path and file name of the base file
+        (input) dst_file -> Directory path and file name of the rebuilt file
+        (output) Size of the rebuilt file
+
+    """
+
+    hasher = hashlib.sha256()
+
+    with open(delta_file, mode="rb") as d_hdlr, \
+            open(base_file, mode="rb") as b_hdlr, \
+            open(dst_file, mode="wb") as o_hdlr:
+        if d_hdlr.read(len(DELTA_MAGIC)) != DELTA_MAGIC:
+            raise ValueError(f"Not a delta file: {delta_file}")
+
+        while True:
+            rec_type = d_hdlr.read(1)
+
+            if rec_type == b"C":
+                _, offset, length = DELTA_COPY.unpack(
+                    rec_type + d_hdlr.read(DELTA_COPY.size - 1))
+
+                while length:
+                    chunk = os.pread(b_hdlr.fileno(), min(length, 8388608),
+                                     offset)
+
+                    if not chunk:
+                        raise ValueError(f"Base file too short: {base_file}")
+
+                    hasher.update(chunk)
+                    o_hdlr.write(chunk)
+                    offset += len(chunk)
+                    length -= len(chunk)
+
+            elif rec_type == b"D":
+                _, length = DELTA_DATA.unpack(
+                    rec_type + d_hdlr.read(DELTA_DATA.size - 1))
+                chunk = d_hdlr.read(length)
+                hasher.update(chunk)
+                o_hdlr.write(chunk)
+
+            elif rec_type == b"E":
+                _, size, digest = DELTA_END.unpack(
+                    rec_type + d_hdlr.read(DELTA_END.size - 1))
+                break
+
+            else:
+                raise ValueError(f"Truncated delta file: {delta_file}")
+
+        if o_hdlr.tell() != size or hasher.digest() != digest:
+            raise ValueError(f"Rebuilt file does not match: {dst_file}")
+
+    return size
+
+
+def load_delta(dmp_dir):
+
+    """Function:  load_delta
+
+    Description:  Reads the block delta index of a dump directory.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (output) index -> Dictionary of base dump name, block_size and list
+            of files stored as deltas, or None if the dump is not a delta
+
+    """
+
+    try:
+        with open(get_sidecar(dmp_dir, None, "delta.json"), mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            return json.load(f_hdlr)
+
+    except FileNotFoundError:
+        return None
+
+
+def delta_store(dmp_dir, base_dir, **kwargs):   # pylint:disable=R0914
+
+    """Function:  delta_store
+
+    Description:  Replaces the files of a dump with block delta files against
+        the files of the same name in a newer dump, so the newest dump stays a
+        full copy and older dumps keep only the blocks that have changed
+        since.  Files hardlinked to the newer dump (-k option) take no extra
+        space and are kept, as are files over max_size and files a delta
+        would not make smaller.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory to store
+        (input) base_dir -> Directory path to the newer cp_dump_* directory
+        (input) **kwargs:
+            threads -> Number of worker threads
+            block_size -> Number of bytes per block
+            max_roll -> Number of bytes to roll the checksum between checks
+                of the data limit
+            roll_limit -> Number of bytes of each file to roll the checksum
+                over
+            max_size -> Largest file to store as a block delta
+            stats -> Dictionary the files, bytes and bytes_delta are added to
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    block_size = kwargs.get("block_size", 16384)
+    stats = kwargs.get("stats", {})
+    stored = {}
+    err_msg = None
+
+    for key in ["files", "bytes", "bytes_delta"]:
+        stats.setdefault(key, 0)
+
+    try:
+        _, file_list = get_cp_files(dmp_dir, exclude=CP_SIDECARS)
+        file_list = [
+            (rel_path, size) for rel_path, size, _ in file_list
+            if size <= kwargs.get("max_size", DELTA_MAX_SIZE)
+            and os.path.isfile(os.path.join(base_dir, rel_path))
+            and not os.path.samefile(os.path.join(dmp_dir, rel_path),
+                                     os.path.join(base_dir, rel_path))]
+
+    except OSError as msg:
+        return True, f"Warning:  Delta store of {dmp_dir} failed: {msg}"
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=kwargs.get("threads", 1)) as pool:
+        futures = {
+            pool.submit(make_delta, os.path.join(dmp_dir, rel_path),
+                        os.path.join(base_dir, rel_path),
+                        os.path.join(dmp_dir, rel_path + DELTA_EXT),
+                        block_size, kwargs.get("max_roll", 4096),
+                        kwargs.get("roll_limit", DELTA_ROLL_LIMIT)):
+            (rel_path, size)
+            for rel_path, size in file_list}
+
+        for future in concurrent.futures.as_completed(futures):
+            rel_path, size = futures[future]
+
+            try:
+                if (future.result() or size) < size:
+                    stored[rel_path] = (size, future.result())
+
+                else:
+                    os.remove(os.path.join(dmp_dir, rel_path + DELTA_EXT))
+
+            except (OSError, ValueError) as msg:
+                err_msg = f"Warning:  Delta store of {dmp_dir} failed for" \
+                    f" {rel_path}: {msg}"
+
+    try:
+        if not err_msg:
+            with open(get_sidecar(dmp_dir, None, "delta.json"), mode="w",
+                      encoding="UTF-8") as f_hdlr:
+                json.dump({"base": os.path.basename(base_dir.rstrip(os.sep)),
+                           "block_size": block_size, "files": sorted(stored)},
+                          f_hdlr, indent=4)
+
+    except OSError as msg:
+        err_msg = f"Warning:  Delta store of {dmp_dir} failed: {msg}"
+
+    # The files are only replaced once the index of the deltas is written.
+    if err_msg:
+        for rel_path, _ in file_list:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(dmp_dir, rel_path + DELTA_EXT))
+
+        return True, err_msg
+
+    for rel_path, (size, delta_size) in stored.items():
+        f_name = os.path.join(dmp_dir, rel_path)
+        shutil.copystat(f_name, f_name + DELTA_EXT)
+        os.remove(f_name)
+        stats["files"] += 1
+        stats["bytes"] += size
+        stats["bytes_delta"] += delta_size
+
+    return False, None
+
+
+def rebuild_file(dmp_dir, rel_path, dst_file, index=None):
+
+    """Function:  rebuild_file
+
+    Description:  Rebuilds a file of a dump stored with delta_store, following
+        the chain of base dumps to the newest full copy.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) rel_path -> Path of the file relative to the dump directory
+        (input) dst_file -> Directory path and file name of the rebuilt file
+        (input) index -> Delta index of dmp_dir from load_delta
+        (output) Size of the rebuilt file
+
+    """
+
+    index = index or load_delta(dmp_dir)
+
+    if not index or rel_path not in index["files"]:
+        return cp_file(os.path.join(dmp_dir, rel_path), dst_file)
+
+    delta_file = os.path.join(dmp_dir, rel_path + DELTA_EXT)
+    base_dir = os.path.join(os.path.dirname(dmp_dir), index["base"])
+    base_index = load_delta(base_dir)
+
+    if base_index and rel_path in base_index["files"]:
+        with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(dst_file)) as tmp_file:
+            rebuild_file(base_dir, rel_path, tmp_file.name, base_index)
+            size = apply_delta(delta_file, tmp_file.name, dst_file)
+
+    else:
+        size = apply_delta(
+            delta_file, os.path.join(base_dir, rel_path), dst_file)
+
+    shutil.copystat(delta_file, dst_file)
+
+    return size
+
+
+def rebuild_dump(dmp_dir, dst_dir, **kwargs):     # pylint:disable=R0914
+
+    """Function:  rebuild_dump
+
+    Description:  Rebuilds all of the files of a dump stored with delta_store
+        into a directory in parallel.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) dst_dir -> Directory path to rebuild the files in
+        (input) **kwargs:
+            threads -> Number of worker threads
+            stats -> Dictionary the files and bytes counts are added to
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    dmp_dir = dmp_dir.rstrip(os.sep)
+    index = load_delta(dmp_dir)
+    stats = kwargs.get("stats", {})
+    dir_list, file_list = get_cp_files(dmp_dir, exclude=CP_SIDECARS)
+
+    for key in ["files", "bytes"]:
+        stats.setdefault(key, 0)
+
+    for item in dir_list:
+        os.makedirs(os.path.join(dst_dir, item), exist_ok=True)
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=kwargs.get("threads", 1)) as pool:
+        futures = {}
+
+        for rel_path, _, _ in file_list:
+            rel_path = rel_path[:-len(DELTA_EXT)] \
+                if rel_path.endswith(DELTA_EXT) else rel_path
+            futures[pool.submit(
+                rebuild_file, dmp_dir, rel_path,
+                os.path.join(dst_dir, rel_path), index)] = rel_path
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                stats["bytes"] += future.result()
+                stats["files"] += 1
+
+            except (OSError, ValueError) as msg:
+                err_flag = True
+                err_msg = f"Error:  Rebuild failed for {futures[future]}:" \
+                    f" {msg}"
+
+    for item in sorted(dir_list, reverse=True) if not err_flag else []:
+        shutil.copystat(os.path.join(dmp_dir, item),
+                        os.path.join(dst_dir, item))
+
+    return err_flag, err_msg
+
+
+def check_dump(dmp_dir, codec=None):
+
+    """Function:  check_dump
+
+    Description:  Checks a Sync/Copy dump can be restored:  it is not marked
+        incomplete and the files in its checksum manifest, if there is one,
+        exist with the same size (or as a delta file, see delta_store).  The
+        digests are not checked (see -C).
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) codec -> Archive codec or None
+        (output) err_msg -> Error message or None if the dump can be restored
+
+    """
+
+    if os.path.exists(get_sidecar(dmp_dir, codec, "incomplete")):
+        return f"Error:  Dump is marked incomplete: {dmp_dir}"
+
+    if codec:
+        return None
+
+    try:
+        _, manifest = load_manifest(dmp_dir)
+        delta = set((load_delta(dmp_dir) or {}).get("files", []))
+
+    except (OSError, ValueError, KeyError) as msg:
+        return f"Error:  Unable to read manifest in {dmp_dir}: {msg}"
+
+    failed = []
+
+    for rel_path, entry in manifest.items():
+        try:
+            # Only the delta file is kept, its size is not the file size.
+            if rel_path in delta:
+                os.stat(os.path.join(dmp_dir, rel_path + DELTA_EXT))
+
+            elif os.stat(os.path.join(dmp_dir, rel_path)).st_size \
+                    != entry["size"]:
+                failed.append(f"{rel_path}: size mismatch")
+
+        except OSError as msg:
+            failed.append(f"{rel_path}: {msg.strerror}")
+
+    return f"Error:  Manifest check failed for {len(failed)} of" \
+        f" {len(manifest)} files in {dmp_dir}:  " + ", ".join(failed) \
+        if failed else None
+
+
+def set_owner(db_path, uid, gid):
+
+    """Function:  set_owner
+
+    Description:  Changes the owner and group of a restored directory tree and
+        gives the owner read and write access to every file and directory.
+
+    Arguments:
+        (input) db_path -> Directory path of the restored database files
+        (input) uid -> User id of the owner
+        (input) gid -> Group id of the owner
+
+    """
+
+    for root, _, files in os.walk(db_path):
+
+        # Each directory is the root of one walk step.
+        for name in [None] + files:
+            f_name = os.path.join(root, name) if name else root
+            f_stat = os.lstat(f_name)
+            mode = 0o600 if name else 0o700
+
+            if (f_stat.st_uid, f_stat.st_gid) != (uid, gid):
+                os.lchown(f_name, uid, gid)
+
+            if f_stat.st_mode & mode != mode and not os.path.islink(f_name):
+                os.chmod(f_name, f_stat.st_mode & 0o7777 | mode)
+
+
+def restore_dump(args, **kwargs):                 # pylint:disable=R0914,R0915
+
+    """Function:  restore_dump
+
+    Description:  Restores a Sync/Copy dump directory or archive into an empty
+        database directory.  The dump is checked against its manifest, the
+        files are copied in parallel (cloned if the filesystem supports it),
+        or rebuilt if the dump is stored as block deltas, and are given to
+        the owner of the database directory or the cp_restore_owner
+        configuration entry.  The database is not running, so no server is
+        used.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            mail -> Email class instance
+            cfg -> Configuration module with the cp_* copy settings
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    stats = {}
+    mail = kwargs.get("mail", None)
+    cfg = kwargs.get("cfg", None)
+    dmp_path = args.get_val("-R").rstrip(os.sep)
+    db_path = args.get_val("-o")
+    owner = getattr(cfg, "cp_restore_owner", None)
+    codec = next((key for key, ext in ARCH_EXT.items()
+                  if dmp_path.endswith(ext)), None)
+    threads = os.cpu_count() or 1
+
+    user, _, group = (owner or "").partition(":")
+    chk_msg = check_dump(
+        dmp_path[:-len(ARCH_EXT[codec])] if codec else dmp_path, codec)
+
+    try:
+        uid = pwd.getpwnam(user).pw_uid if user else None
+        gid = grp.getgrnam(group).gr_gid if group else \
+            pwd.getpwnam(user).pw_gid if user else None
+
+    except KeyError:
+        uid = gid = -1
+
+    if not os.path.exists(dmp_path):
+        err_flag = True
+        err_msg = f"Error:  Dump does not exist: {dmp_path}"
+
+    elif not os.path.isdir(db_path):
+        err_flag = True
+        err_msg = f"Error:  Restore directory does not exist: {db_path}"
+
+    elif set(os.listdir(db_path)) - {"lost+found"}:
+        err_flag = True
+        err_msg = f"Error:  Restore directory is not empty: {db_path}"
+
+    elif uid == -1:
+        err_flag = True
+        err_msg = f"Error:  cp_restore_owner user or group not found: {owner}"
+
+    elif chk_msg:
+        err_flag = True
+        err_msg = chk_msg
+
+    elif codec:
+        stats["copy_start"] = time.time()
+        err_flag, err_msg = extract_archive(
+            dmp_path, db_path, threads=threads)
+        stats["copy_end"] = time.time()
+
+    elif load_delta(dmp_path):
+        stats["copy_start"] = time.time()
+        err_flag, err_msg = rebuild_dump(
+            dmp_path, db_path, threads=threads, stats=stats)
+        stats["copy_end"] = time.time()
+
+    else:
+        stats["copy_start"] = time.time()
+        err_flag, err_msg = parallel_cp(
+            dmp_path, db_path, threads=threads, exist_ok=True, stats=stats,
+            cp_filter={"exclude": CP_SIDECARS},
+            cp_opts={"method": getattr(cfg, "cp_method", "auto"),
+                     "chunk_size": getattr(cfg, "cp_chunk_size", 67108864),
+                     "direct": getattr(cfg, "cp_direct", False)})
+        stats["copy_end"] = time.time()
+
+    if not err_flag:
+        try:
+            d_stat = os.stat(db_path)
+            set_owner(db_path, d_stat.st_uid if uid is None else uid,
+                      d_stat.st_gid if gid is None else gid)
+
+        except OSError as msg:
+            err_flag = True
+            err_msg = f"Error:  Unable to set owner of {db_path}: {msg}"
+
+    if mail:
+        mail.add_2_msg(
+            err_msg if err_flag else
+            f"Restored {dmp_path} to {db_path}:  "
+            + json.dumps(cp_summary(stats)))
+        mail.send_mail()
+
+    return err_flag, err_msg
+
+
+def zstd_compress(data, level=3):
+
+    """Function:  zstd_compress
+
+    Description:  Compresses data into a zstd frame.  Keeps one compressor per
+        thread as a compressor cannot be shared between threads.
+
+    Arguments:
+        (input) data -> Bytes to compress
+        (input) level -> Compression level
+        (output) Compressed zstd frame
+
+    """
+
+    cctx = getattr(ZSTD_LOCAL, "cctx", {})
+    ZSTD_LOCAL.cctx = cctx
+
+    if level not in cctx:
+        cctx[level] = zstandard.ZstdCompressor(level=level)
+
+    return cctx[level].compress(data)
+
+
+def zstd_decompress(data):
+
+    """Function:  zstd_decompress
+
+    Description:  Decompresses one or more concatenated zstd frames.
+
+    Arguments:
+        (input) data -> Compressed zstd frames
+        (output) Decompressed bytes
+
+    """
+
+    with zstandard.ZstdDecompressor().stream_reader(
+            io.BytesIO(data), read_across_frames=True) as reader:
+        return reader.read()
+
+
+def get_codec(codec, level=None):
+
+    """Function:  get_codec
+
+    Description:  Returns compress and decompress functions for an archive
+        codec.  Each call compresses its data into an independent gzip member
+        or zstd frame, so the results can be concatenated into one stream and
+        the functions can be called from several threads at once.
+
+    Arguments:
+        (input) codec -> gzip|zstd
+        (input) level -> Compression level or None for the codec's default
+        (output) compress -> Function to compress a bytes object
+        (output) decompress -> Function to decompress concatenated frames
+
+    """
+
+    if codec == "zstd":
+        return functools.partial(zstd_compress, level=level or 3), \
+            zstd_decompress
+
+    return functools.partial(gzip.compress, compresslevel=level or 6,
+                             mtime=0), gzip.decompress
+
+
+def tar_member(tar, src_path, rel_path, chunk_size, page_cache=None):
+
+    """Function:  tar_member
+
+    Description:  Generator returning a file or directory as a tar member,
+        header, data and padding, in chunks of about chunk_size bytes.
+
+    Arguments:
+        (input) tar -> TarFile instance used to build the header
+        (input) src_path -> Directory path and file name
+        (input) rel_path -> Name of the member in the archive
+        (input) chunk_size -> Number of bytes per chunk
+        (input) page_cache -> PageCache instance to drop the pages read
+        (output) Chunks of the tar member
+
+    """
+
+    tarinfo = tar.gettarinfo(src_path, arcname=rel_path)
+    buf = tarinfo.tobuf(tarfile.PAX_FORMAT, tarfile.ENCODING,
+                        "surrogateescape")
+
+    if tarinfo.isreg():
+        remaining = tarinfo.size
+        resident = page_cache.resident(src_path) if page_cache else None
+
+        with open(src_path, mode="rb") as f_hdlr:
+            fadvise(f_hdlr.fileno(), 0, 0, "POSIX_FADV_SEQUENTIAL")
+
+            while remaining:
+                data = f_hdlr.read(min(chunk_size, remaining))
+
+                if not data:
+                    raise OSError(
+                        f"File changed size while being archived: {src_path}")
+
+                remaining -= len(data)
+                buf += data
+
+                if len(buf) >= chunk_size:
+                    yield buf
+                    buf = b""
+
+        if page_cache:
+            page_cache.release(src_path, resident)
+
+        buf += tarfile.NUL * (-tarinfo.size % tarfile.BLOCKSIZE)
+
+    yield buf
+
+
+def archive_cp(src_dir, arch_file, **kwargs):    # pylint:disable=R0914
+
+    """Function:  archive_cp
+
+    Description:  Streams a directory tree into a single compressed tar
+        archive.  The tar stream is cut into chunks which are compressed in
+        parallel as independent gzip members or zstd frames, so the archive
+        can be read with the standard tar, gzip and zstd tools.  An index file
+        (arch_file.idx) holds each member's offset and length in the archive
+        so single files can be extracted without reading the whole archive.
+
+    Arguments:
+        (input) src_dir -> Source directory path
+        (input) arch_file -> Directory path and file name of the archive
+        (input) **kwargs:
+            codec -> gzip|zstd
+            level -> Compression level
+            threads -> Number of compression threads
+            chunk_size -> Number of bytes compressed per chunk
+            stats -> Dictionary the files, bytes and bytes_written counts
+                are added to
+            cancel -> threading.Event instance to cancel the copy
+            cp_filter -> Dictionary of get_cp_files include and exclude
+                patterns
+            limiter -> TokenBucket instance limiting the read rate
+            fan_out -> List of additional archive files written with the
+                same data
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    limiter = kwargs.get("limiter", None)
+    page_cache = kwargs.get("page_cache", None)
+    arch_files = [arch_file] + (kwargs.get("fan_out", None) or [])
+    codec = kwargs.get("codec", "gzip")
+    threads = kwargs.get("threads", 1)
+    chunk_size = kwargs.get("chunk_size", 4194304)
+    compress, _ = get_codec(codec, kwargs.get("level", None))
+    stats = kwargs.get("stats", {})
+    members = []
+    pending = collections.deque()
+
+    try:
+        dir_list, file_list = get_cp_files(
+            src_dir, **kwargs.get("cp_filter", {}))
+        member_list = [(item, "dir") for item in sorted(dir_list)] \
+            + [(item[0], "file") for item in file_list]
+
+        with contextlib.ExitStack() as stack, \
+                tarfile.open(fileobj=io.BytesIO(), mode="w",
+                             dereference=True) as tar, \
+                concurrent.futures.ThreadPoolExecutor(
+                    max_workers=threads) as pool:
+            out = TeeWriter(
+                (stack.enter_context(open(item, mode="wb"))
+                 for item in arch_files), drop_cache=bool(page_cache))
+
+            for rel_path, m_type in member_list:
+                members.append(
+                    {"name": rel_path, "type": m_type, "offset": None})
+
+                for chunk in tar_member(tar, os.path.join(src_dir, rel_path),
+                                        rel_path, chunk_size, page_cache):
+                    check_cancel(kwargs.get("cancel", None), rel_path)
+
+                    if limiter:
+                        limiter.consume(len(chunk))
+
+                    pending.append((members[-1], pool.submit(compress, chunk)))
+
+                    # Bound the memory held by chunks waiting to be written.
+                    while len(pending) > threads * 2:
+                        write_frame(out, *pending.popleft())
+
+            while pending:
+                write_frame(out, *pending.popleft())
+
+            out.write(compress(tarfile.NUL * tarfile.BLOCKSIZE * 2))
+            stats["files"] = stats.get("files", 0) + len(file_list)
+            stats["bytes"] = stats.get("bytes", 0) \
+                + sum(item[1] for item in file_list)
+            stats["bytes_written"] = stats.get("bytes_written", 0) \
+                + out.tell()
+
+        for item in arch_files:
+            with open(item + ".idx", mode="w", encoding="UTF-8") as f_hdlr:
+                json.dump(
+                    {"codec": codec, "members": members}, f_hdlr, indent=1)
+
+            if page_cache:
+                page_cache.written(item)
+
+    except OSError as msg:
+        err_flag = True
+        err_msg = f"Error:  Unable to archive {src_dir}: {msg}"
+
+    return err_flag, err_msg
+
+
+class TeeWriter():
+
+    """Class:  TeeWriter
+
+    Description:  File-like writer which writes the same data to several
+        files.  The position is that of the first file.  With drop_cache the
+        written pages are dropped from the page cache every CACHE_FLUSH_SIZE
+        bytes.
+
+    Methods:
+        __init__
+        write
+        tell
+
+    """
+
+    def __init__(self, files, drop_cache=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) files -> List of file handlers open for writing
+            (input) drop_cache -> True|False - Drop the written pages
+
+        """
+
+        self.files = list(files)
+        self.drop_cache = drop_cache
+        self.pending = 0
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Writes the data to each of the files.
+
+        Arguments:
+            (input) data -> Bytes to write
+
+        """
+
+        for f_hdlr in self.files:
+            f_hdlr.write(data)
+
+        self.pending += len(data)
+
+        # Pages still being written back are dropped by the next call.
+        if self.drop_cache and self.pending >= CACHE_FLUSH_SIZE:
+            self.pending = 0
+
+            for f_hdlr in self.files:
+                f_hdlr.flush()
+                fadvise(f_hdlr.fileno(), 0, 0, "POSIX_FADV_DONTNEED")
+
+    def tell(self):
+
+        """Method:  tell
+
+        Description:  Returns the position in the first file.
+
+        Arguments:
+
+        """
+
+        return self.files[0].tell()
+
+
+def write_frame(out, member, future):
+
+    """Function:  write_frame
+
+    Description:  Writes a compressed chunk to the archive and updates the
+        member's offset and length in the archive.
+
+    Arguments:
+        (input) out -> Archive file handler
+        (input) member -> Index entry of the member the chunk belongs to
+        (input) future -> Future returning the compressed chunk
+
+    """
+
+    if member["offset"] is None:
+        member["offset"] = out.tell()
+
+    out.write(future.result())
+    member["length"] = out.tell() - member["offset"]
+
+
+class RangeReader(io.RawIOBase):
+
+    """Class:  RangeReader
+
+    Description:  Read-only file-like object over a byte range of an open
+        file.  Reads with os.pread, so several readers can share the file
+        descriptor.
+
+    Methods:
+        __init__
+        readable
+        readinto
+
+    """
+
+    def __init__(self, fd, offset, length):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fd -> File descriptor of the file
+            (input) offset -> Position of the start of the range
+            (input) length -> Number of bytes in the range
+
+        """
+
+        super().__init__()
+        self.fd = fd
+        self.pos = offset
+        self.end = offset + length
+
+    def readable(self):
+
+        """Method:  readable
+
+        Description:  Returns True, the range can be read.
+
+        Arguments:
+
+        """
+
+        return True
+
+    def readinto(self, buf):
+
+        """Method:  readinto
+
+        Description:  Reads up to the size of buf bytes of the range into
+            buf.
+
+        Arguments:
+            (input) buf -> Writable buffer
+            (output) Number of bytes read, 0 at the end of the range
+
+        """
+
+        data = os.pread(self.fd, min(len(buf), self.end - self.pos), self.pos)
+        buf[:len(data)] = data
+        self.pos += len(data)
+
+        return len(data)
+
+
+def extract_member(arch_file, member, dst_dir, codec):
+
+    """Function:  extract_member
+
+    Description:  Extracts a single member from an archive created by
+        archive_cp by reading only the member's frames.  The frames are read,
+        decompressed and extracted as a stream, a chunk at a time.
+
+    Arguments:
+        (input) arch_file -> Directory path and file name of the archive
+        (input) member -> Index entry of the member
+        (input) dst_dir -> Directory path to extract to
+        (input) codec -> gzip|zstd
+
+    """
+
+    with open(arch_file, mode="rb") as f_hdlr:
+        src = io.BufferedReader(
+            RangeReader(f_hdlr.fileno(), member["offset"], member["length"]),
+            buffer_size=1048576)
+
+        if codec == "zstd":
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                src, read_size=1048576, read_across_frames=True)
+
+        else:
+            reader = gzip.GzipFile(fileobj=src, mode="rb")
+
+        with reader, tarfile.open(fileobj=reader, mode="r|",
+                                  bufsize=1048576) as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(path=dst_dir, filter="data")
+
+            else:
+                tar.extractall(path=dst_dir)
+
+
+def extract_archive(arch_file, dst_dir, **kwargs):
+
+    """Function:  extract_archive
+
+    Description:  Extracts members from an archive created by archive_cp in
+        parallel, using its index to read only each member's frames.
+
+    Arguments:
+        (input) arch_file -> Directory path and file name of the archive
+        (input) dst_dir -> Directory path to extract to
+        (input) **kwargs:
+            threads -> Number of extraction threads
+            names -> List of member names to extract, default is all
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    names = kwargs.get("names", None)
+
+    try:
+        with open(arch_file + ".idx", mode="r", encoding="UTF-8") as f_hdlr:
+            index = json.load(f_hdlr)
+
+    except (OSError, ValueError) as msg:
+        return True, f"Error:  Unable to read archive index: {msg}"
+
+    members = [item for item in index["members"]
+               if names is None or item["name"] in names]
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=kwargs.get("threads", 1)) as pool:
+
+        # Directories first, so they exist before their files are extracted.
+        for m_type in ["dir", "file"]:
+            futures = {
+                pool.submit(extract_member, arch_file, item, dst_dir,
+                            index["codec"]): item["name"]
+                for item in members if item["type"] == m_type}
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+
+                except (OSError, EOFError, zlib.error,
+                        tarfile.TarError) as msg:
+                    err_flag = True
+                    err_msg = f"Error:  Extract failed for" \
+                        f" {futures[future]}: {msg}"
+
+    return err_flag, err_msg
+
+
+class LockWatchdog():
+
+    """Class:  LockWatchdog
+
+    Description:  Timer which cancels the copy and unlocks the database if the
+        database stays locked longer than the lock budget.  The database is
+        unlocked only once, by the watchdog or by the copy, whichever is
+        first.
+
+    Methods:
+        __init__
+        start
+        expired
+        unlock
+
+    """
+
+    def __init__(self, server, budget=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Database server instance
+            (input) budget -> Maximum number of seconds to hold the lock
+
+        """
+
+        self.server = server
+        self.budget = budget
+        self.cancel = threading.Event()
+        self.timer = None
+        self.unlocked = False
+        self.mutex = threading.Lock()
+
+        if budget:
+            self.timer = threading.Timer(budget, self.expired)
+            self.timer.daemon = True
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Starts the lock budget timer.
+
+        Arguments:
+
+        """
+
+        if self.timer:
+            self.timer.start()
+
+    def expired(self):
+
+        """Method:  expired
+
+        Description:  Cancels the copy and unlocks the database when the lock
+            budget runs out.
+
+        Arguments:
+
+        """
+
+        self.cancel.set()
+        self.unlock()
+
+    def unlock(self):
+
+        """Method:  unlock
+
+        Description:  Stops the timer and unlocks the database if it has not
+            already been unlocked.
+
+        Arguments:
+
+        """
+
+        with self.mutex:
+            if self.timer:
+                self.timer.cancel()
+
+            if not self.unlocked:
+                self.unlocked = True
+                self.server.unlock_db()
+
+
+def get_sidecar(dmp_dir, codec, name):
+
+    """Function:  get_sidecar
+
+    Description:  Returns the path of a file kept with a dump, inside the dump
+        directory or next to the archive.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) codec -> Archive codec or None
+        (input) name -> Name of the file, e.g. stats.json
+        (output) Directory path and file name of the file
+
+    """
+
+    return dmp_dir + ARCH_EXT[codec] + "." + name if codec \
+        else os.path.join(dmp_dir, "cp_dump_" + name)
+
+
+def write_sidecars(dmp_dir, codec, stats, **kwargs):
+
+    """Function:  write_sidecars
+
+    Description:  Writes the checksum manifest, the statistics and, if the
+        dump failed, the incomplete marker of a dump.  Nothing is written if
+        the dump's parent directory does not exist.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) codec -> Archive codec or None
+        (input) stats -> Dictionary of the dump statistics
+        (input) **kwargs:
+            manifest -> Dictionary of the checksum manifest entries
+            err_msg -> Error message of the failed dump
+        (output) err_msg -> Error or warning message if a file could not be
+            written
+
+    """
+
+    err_msg = None
+    cp_err = kwargs.get("err_msg", None)
+    manifest = kwargs.get("manifest", None)
+    stats_file = get_sidecar(dmp_dir, codec, "stats.json")
+
+    if not os.path.isdir(os.path.dirname(stats_file)):
+        return None
+
+    if not cp_err and manifest is not None:
+        try:
+            write_manifest(dmp_dir, manifest)
+
+        except OSError as msg:
+            err_msg = f"Error:  Unable to write manifest: {msg}"
+
+    try:
+        with open(stats_file, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(stats, f_hdlr, indent=4)
+
+        # Keep a partial dump from being used or restored.
+        if cp_err or err_msg:
+            with open(get_sidecar(dmp_dir, codec, "incomplete"), mode="w",
+                      encoding="UTF-8") as f_hdlr:
+                f_hdlr.write((cp_err or err_msg) + "\n")
+
+    except OSError as msg:
+        err_msg = err_msg or f"Warning:  Unable to write {stats_file}: {msg}"
+
+    return err_msg
+
+
+def cp_summary(stats):
+
+    """Function:  cp_summary
+
+    Description:  Adds the lock window (or offline and catch up time of a cold
+        copy), copy time and copy rate to the Sync/Copy dump statistics and
+        converts the timestamps to ISO 8601 strings.
+
+    Arguments:
+        (input) stats -> Dictionary of copy counts and time.time() timestamps
+        (output) summary -> Dictionary of the dump statistics
+
+    """
+
+    summary = dict(stats)
+
+    if "lock_acquired" in stats and "unlocked" in stats:
+        summary["lock_seconds"] = round(
+            stats["unlocked"] - stats["lock_acquired"], 3)
+
+    if "shutdown" in stats and "restarted" in stats:
+        summary["offline_seconds"] = round(
+            stats["restarted"] - stats["shutdown"], 3)
+
+    if "restarted" in stats and "caught_up" in stats:
+        summary["catch_up_seconds"] = round(
+            stats["caught_up"] - stats["restarted"], 3)
+
+    if "copy_start" in stats and "copy_end" in stats:
+        summary["copy_seconds"] = round(
+            stats["copy_end"] - stats["copy_start"], 3)
+        summary["mb_per_sec"] = round(
+            stats.get("bytes", 0) / 1048576
+            / max(stats["copy_end"] - stats["copy_start"], 0.001), 2)
+
+    for key in ["pre_copy_start", "pre_copy_end", "lock_acquired",
+                "shutdown", "copy_start", "copy_end", "unlocked",
+                "restarted", "caught_up"]:
+        if key in stats:
+            summary[key] = datetime.datetime.fromtimestamp(
+                stats[key]).isoformat()
+
+    return summary
+
+
+def copy_db_files(db_path, dmp_dir, **kwargs):
+
+    """Function:  copy_db_files
+
+    Description:  Copies the database files to the dump directory or archive,
+        either in full, as the changes since a pre-copy snapshot or into a
+        compressed archive.
+
+    Arguments:
+        (input) db_path -> Directory path to the database files
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) **kwargs:
+            threads -> Number of copy worker threads
+            prev_dir -> Previous dump directory to hardlink unchanged files to
+            use_hash -> True|False - Compare digests against previous dump
+            codec -> gzip|zstd - Copy into a compressed archive
+            snapshot -> Pre-copy snapshot from pre_cp, copy only the changes
+            stats -> Dictionary the copy counts are added to
+            cancel -> threading.Event set to stop the copy
+            cp_opts -> Dictionary of cp_file copy settings
+            manifest -> Dictionary the manifest entries are added to
+            prev_manifest -> Manifest of the previous dump
+            cp_filter -> Dictionary of get_cp_files include and exclude
+                patterns
+            limiter -> TokenBucket instance limiting the copy rate
+            fan_out_dirs -> List of additional cp_dump_* directory paths
+                written from the same reads
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    codec = kwargs.get("codec", None)
+    fan_out_dirs = kwargs.get("fan_out_dirs", None) or []
+    threads = kwargs.get("threads", 1)
+    stats = kwargs.get("stats", {})
+    cancel = kwargs.get("cancel", None)
+    cp_filter = kwargs.get("cp_filter", {})
+    limiter = kwargs.get("limiter", None)
+    page_cache = kwargs.get("page_cache", None)
+
+    if codec:
+        return archive_cp(
+            db_path, dmp_dir + ARCH_EXT[codec], codec=codec, threads=threads,
+            stats=stats, cancel=cancel, cp_filter=cp_filter, limiter=limiter,
+            fan_out=[item + ARCH_EXT[codec] for item in fan_out_dirs],
+            page_cache=page_cache)
+
+    if kwargs.get("snapshot", None):
+        return delta_cp(
+            db_path, dmp_dir, kwargs.get("snapshot"), threads=threads,
+            stats=stats, cancel=cancel, cp_opts=kwargs.get("cp_opts", {}),
+            manifest=kwargs.get("manifest", None), cp_filter=cp_filter,
+            limiter=limiter, fan_out_dirs=fan_out_dirs, page_cache=page_cache)
+
+    return parallel_cp(
+        db_path, dmp_dir, threads=threads,
+        prev_dir=kwargs.get("prev_dir", None),
+        use_hash=kwargs.get("use_hash", False), stats=stats, cancel=cancel,
+        cp_opts=kwargs.get("cp_opts", {}),
+        manifest=kwargs.get("manifest", None),
+        prev_manifest=kwargs.get("prev_manifest", None), cp_filter=cp_filter,
+        limiter=limiter, fan_out_dirs=fan_out_dirs, page_cache=page_cache)
+
+
+def locked_cp(server, dmp_dir, **kwargs):
+
+    """Function:  locked_cp
+
+    Description:  Locks the database, copies the database files to the dump
+        directory or archive and unlocks the database.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) **kwargs:
+            threads -> Number of copy worker threads
+            prev_dir -> Previous dump directory to hardlink unchanged files to
+            use_hash -> True|False - Compare digests against previous dump
+            codec -> gzip|zstd - Copy into a compressed archive
+            snapshot -> Pre-copy snapshot from pre_cp, copy only the changes
+            stats -> Dictionary the timestamps and copy counts are added to
+            budget -> Maximum number of seconds to hold the lock
+            cp_opts -> Dictionary of cp_file copy settings
+            manifest -> Dictionary the manifest entries are added to
+            prev_manifest -> Manifest of the previous dump
+            cp_filter -> Dictionary of get_cp_files include and exclude
+                patterns
+            limiter -> TokenBucket instance limiting the copy rate
+            fan_out_dirs -> List of additional cp_dump_* directory paths
+                written from the same reads
+            page_cache -> PageCache instance to drop the pages read and
+                written
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    stats = kwargs.get("stats", {})
+    watchdog = LockWatchdog(server, kwargs.get("budget", None))
+
+    server.lock_db(lock=True)
+
+    if server.is_locked():
+        watchdog.start()
+        stats["lock_acquired"] = time.time()
+        stats["copy_start"] = time.time()
+
+        # Backup database, the database is unlocked whatever the copy raises.
+        try:
+            err_flag, err_msg = copy_db_files(
+                server.db_path, dmp_dir, cancel=watchdog.cancel, **kwargs)
+            stats["copy_end"] = time.time()
+
+        finally:
+            watchdog.unlock()
+            stats["unlocked"] = time.time()
+
+        if watchdog.cancel.is_set():
+            err_flag = True
+            err_msg = f"Error:  Lock budget of {watchdog.budget} seconds" \
+                f" exceeded, copy cancelled and database unlocked."
+
+        if server.is_locked():
+            err_flag = True
+            err_msg = "Warning:  Database still locked after dump."
+
+    else:
+        err_flag = True
+        err_msg = "Error:  Unable to lock the database for dump to occur."
+
+    return err_flag, err_msg
+
+
+def get_lag(server):
+
+    """Function:  get_lag
+
+    Description:  Returns the replication lag of the server behind the primary
+        of its replica set.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) lag -> Lag in seconds or None if not a secondary or there is
+            no primary
+
+    """
+
+    members = server.adm_cmd("replSetGetStatus").get("members", [])
+    own = [item for item in members if item.get("self")]
+    primary = [item["optimeDate"] for item in members
+               if item.get("state") == 1 and "optimeDate" in item]
+
+    if not own or own[0].get("state") != 2 or not primary:
+        return None
+
+    return max((primary[0] - own[0]["optimeDate"]).total_seconds(), 0)
+
+
+def wait_shutdown(db_path, timeout):
+
+    """Function:  wait_shutdown
+
+    Description:  Waits for the database to finish shutting down.  A clean
+        shutdown empties the mongod.lock file in the dbpath.
+
+    Arguments:
+        (input) db_path -> Directory path to the database files
+        (input) timeout -> Maximum number of seconds to wait
+        (output) True|False -> If the database has shutdown
+
+    """
+
+    lock_file = os.path.join(db_path, "mongod.lock")
+    end = time.monotonic() + timeout
+
+    while True:
+        try:
+            if not os.path.getsize(lock_file):
+                return True
+
+        except FileNotFoundError:
+            return True
+
+        if time.monotonic() >= end:
+            return False
+
+        time.sleep(1)
+
+
+def wait_catch_up(server, max_lag, timeout, interval=5):
+
+    """Function:  wait_catch_up
+
+    Description:  Waits for a restarted secondary to come back and its
+        replication lag to fall to max_lag seconds or less.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) max_lag -> Replication lag in seconds to wait for
+        (input) timeout -> Maximum number of seconds to wait
+        (input) interval -> Number of seconds between checks
+        (output) lag -> Replication lag in seconds or None if timed out
+
+    """
+
+    end = time.monotonic() + timeout
+
+    while True:
+        try:
+            lag = get_lag(server)
+
+        except pymongo.errors.PyMongoError:
+            lag = None
+
+        if lag is not None and lag <= max_lag:
+            return lag
+
+        if time.monotonic() >= end:
+            return None
+
+        time.sleep(interval)
+
+
+def cold_cp(server, dmp_dir, **kwargs):
+
+    """Function:  cold_cp
+
+    Description:  Shuts down a secondary, copies the database files to the
+        dump directory or archive, restarts the secondary and waits for its
+        replication lag to fall back under max_lag.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dmp_dir -> Directory path to the cp_dump_* directory
+        (input) **kwargs:
+            start_cmd -> Command line list to restart the database
+            max_lag -> Replication lag in seconds to wait for after restart
+            shutdown_timeout -> Maximum number of seconds to wait for shutdown
+            catchup_timeout -> Maximum number of seconds to wait for catch up
+            stats -> Dictionary the timestamps and copy counts are added to
+            See copy_db_files for the copy arguments.
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    stats = kwargs.get("stats", {})
+    timeout = kwargs.get("shutdown_timeout", 300)
+    db_path = server.db_path
+
+    try:
+        lag = get_lag(server)
+
+    except pymongo.errors.PyMongoError as msg:
+        return True, f"Error:  Unable to get replica set status:  {msg}"
+
+    if lag is None:
+        return True, "Error:  -K option requires a secondary of a replica" \
+            " set with a primary."
+
+    try:
+        server.adm_cmd("shutdown")
+
+    except pymongo.errors.AutoReconnect:
+        # The connection closes as the server shuts down.
+        pass
+
+    except pymongo.errors.PyMongoError as msg:
+        return True, f"Error:  Unable to shutdown the database:  {msg}"
+
+    stats["shutdown"] = time.time()
+
+    if not wait_shutdown(db_path, timeout):
+        return True, f"Error:  Database did not shutdown within {timeout}" \
+            f" seconds, copy not started."
+
+    # The secondary is restarted whatever the copy raises.
+    try:
+        stats["copy_start"] = time.time()
+        err_flag, err_msg = copy_db_files(db_path, dmp_dir, **kwargs)
+        stats["copy_end"] = time.time()
+
+    finally:
+        start_flag, start_msg = restart_secondary(server, **kwargs)
+
+    # A failed restart outranks a copy error, a lag warning does not.
+    if start_flag and not (err_flag and start_msg.startswith("Warning")):
+        err_flag, err_msg = start_flag, start_msg
+
+    return err_flag, err_msg
+
+
+def restart_secondary(server, **kwargs):
+
+    """Function:  restart_secondary
+
+    Description:  Restarts a secondary shut down by cold_cp and waits for
+        its replication lag to fall back under max_lag.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) **kwargs:
+            start_cmd -> Command line list to restart the database
+            max_lag -> Replication lag in seconds to wait for after restart
+            catchup_timeout -> Maximum number of seconds to wait for catch up
+            stats -> Dictionary the timestamps and lag are added to
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    stats = kwargs.get("stats", {})
+    max_lag = kwargs.get("max_lag", 10)
+
+    try:
+        proc = subprocess.run(
+            kwargs.get("start_cmd"), stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, check=False)
+
+    except OSError as msg:
+        return True, f"Error:  Unable to restart the database:  {msg}"
+
+    stats["restarted"] = time.time()
+
+    if proc.returncode:
+        return True, f"Error:  Unable to restart the database:" \
+            f"  {proc.stdout.strip()}"
+
+    lag = wait_catch_up(server, max_lag, kwargs.get("catchup_timeout", 3600))
+    stats["caught_up"] = time.time()
+
+    if lag is None:
+        return True, f"Warning:  Secondary lag still over {max_lag} seconds" \
+            f" after restart."
+
+    stats["lag_seconds"] = lag
+
+    return False, None
+
+
+def is_local_host(host):
+
+    """Function:  is_local_host
+
+    Description:  Checks if a host name or address is this server.
+
+    Arguments:
+        (input) host -> Host name or IP address
+        (output) True|False -> If the host is this server
+
+    """
+
+    try:
+        addrs = {item[4][0] for item in socket.getaddrinfo(host, None)}
+        local = {item[4][0] for item in socket.getaddrinfo(
+            socket.gethostname(), None)}
+
+    except (socket.gaierror, UnicodeError):
+        return False
+
+    return any(addr in local or addr.startswith("127.") or addr == "::1"
+               for addr in addrs)
+
+
+def select_secondary(server, args):
+
+    """Function:  select_secondary
+
+    Description:  Reads the replica set status and connects to the healthy
+        secondary with the least replication lag (then the lowest ping time)
+        that is on this server and whose dbpath directory exists.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+        (output) member -> Server instance of the selected secondary or None
+
+    """
+
+    try:
+        status = server.adm_cmd("replSetGetStatus")
+
+    except pymongo.errors.PyMongoError as msg:
+        return True, f"Error:  Unable to get replica set status:  {msg}", None
+
+    members = status.get("members", [])
+    optimes = [item["optimeDate"] for item in members if "optimeDate" in item]
+    primary = [item["optimeDate"] for item in members
+               if item.get("state") == 1 and "optimeDate" in item]
+    newest = primary[0] if primary else max(optimes, default=None)
+    secondaries = sorted(
+        [item for item in members if item.get("state") == 2
+         and item.get("health") == 1 and "optimeDate" in item],
+        key=lambda item: (newest - item["optimeDate"],
+                          item.get("pingMs", 0)))
+
+    for item in secondaries:
+        host, _, port = item["name"].rpartition(":")
+
+        if not is_local_host(host):
+            continue
+
+        member = mongo_libs.create_instance(
+            args.get_val("-c"), args.get_val("-d"), mongo_class.Server)
+        member.host = host
+        member.port = int(port)
+        conn = member.connect()
+
+        if conn[0] and member.db_path and os.path.isdir(member.db_path):
+            return False, None, member
+
+        if conn[0]:
+            mongo_libs.disconnect([member])
+
+    return True, "Error:  No healthy secondary found on this server with" \
+        " a local dbpath.", None
+
+
+def sync_cp_dump(                           # pylint:disable=R0912,R0914,R0915
+        server, args, **kwargs):
+
+    """Function:  sync_cp_dump
+
+    Description:  Locks the database and then copies the database files to a
+        destination directory.  The lock window and copy statistics are
+        written to cp_dump_stats.json in the dump directory (or to
+        archive.stats.json next to an archive) and added to the email.  Unless
+        drop_cache is False, the pages read and written by the copy are
+        dropped from the page cache and the impact added to the statistics.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (output) err_flag -> True|False - If an error has occurred
+        (output) err_msg -> Error message
+        (input) **kwargs:
+            mail -> Email class instance
+            cfg -> Configuration module with the cp_* copy and filter
+                settings and drop_cache
+
+    """
+
+    err_flag = False
+    err_msg = None
+    snapshot = None
+    member = None
+    stats = {}
+    mail = kwargs.get("mail", None)
+    cfg = kwargs.get("cfg", None)
+    cp_opts = {"method": getattr(cfg, "cp_method", "auto"),
+               "chunk_size": getattr(cfg, "cp_chunk_size", 67108864),
+               "direct": getattr(cfg, "cp_direct", False)}
+    cp_filter = {"include": getattr(cfg, "cp_include", None),
+                 "exclude": getattr(cfg, "cp_exclude", CP_EXCLUDE)}
+    limits = {name: getattr(cfg, name, None) for name in [
+        "cp_rate_limit", "cp_iops_limit", "cp_locked_rate_limit"]}
+    bad_limits = [name for name, value in limits.items()
+                  if value is not None and (
+                      not isinstance(value, (int, float)) or value <= 0)]
+    codec = args.get_val("-a", def_val=None)
+    prev_dir = get_prev_dump(args.get_val("-o")) if args.arg_exist("-k") \
+        else None
+    delta_dir = get_prev_dump(args.get_val("-o")) if args.arg_exist("-D") \
+        else None
+    delta_opts = {"block_size": getattr(cfg, "cp_delta_block_size", 16384),
+                  "max_roll": getattr(cfg, "cp_delta_roll", 4096)}
+    manifest = {} if args.arg_exist("-j") else None
+    fan_out = args.get_val("-f", def_val=[]) if args.arg_exist("-f") else []
+
+    try:
+        threads = int(args.get_val("-n", def_val=min(8, os.cpu_count() or 1)))
+
+    except ValueError:
+        threads = 0
+
+    try:
+        budget = float(args.get_val("-m", def_val=0))
+
+    except ValueError:
+        budget = -1
+
+    if threads < 1:
+        err_flag = True
+        err_msg = "Error:  -n option requires a positive integer."
+
+    elif budget < 0:
+        err_flag = True
+        err_msg = "Error:  -m option requires a positive number of seconds."
+
+    elif cp_opts["method"] not in CP_METHODS:
+        err_flag = True
+        err_msg = f"Error:  cp_method must be one of:" \
+            f" {', '.join(CP_METHODS)}"
+
+    elif not isinstance(cp_opts["chunk_size"], int) \
+            or cp_opts["chunk_size"] < 1:
+        err_flag = True
+        err_msg = "Error:  cp_chunk_size requires a positive integer."
+
+    elif not isinstance(delta_opts["block_size"], int) \
+            or delta_opts["block_size"] < 1 \
+            or not isinstance(delta_opts["max_roll"], int) \
+            or delta_opts["max_roll"] < 0:
+        err_flag = True
+        err_msg = "Error:  cp_delta_block_size requires a positive integer" \
+            " and cp_delta_roll zero or a positive integer."
+
+    elif bad_limits:
+        err_flag = True
+        err_msg = f"Error:  {', '.join(bad_limits)} requires a positive" \
+            f" number or None."
+
+    elif codec and codec not in ARCH_EXT:
+        err_flag = True
+        err_msg = f"Error:  -a option must be one of: {', '.join(ARCH_EXT)}"
+
+    elif not all(os.path.isdir(item) for item in fan_out):
+        err_flag = True
+        err_msg = "Error:  -f directory does not exist: " + ", ".join(
+            item for item in fan_out if not os.path.isdir(item))
+
+    elif codec == "zstd" and not zstandard:
+        err_flag = True
+        err_msg = "Error:  -a zstd requires the zstandard python module."
+
+    elif args.arg_exist("-K") and not getattr(cfg, "cp_mongod_conf", None):
+        err_flag = True
+        err_msg = "Error:  -K option requires cp_mongod_conf in the" \
+            " configuration file."
+
+    elif args.arg_exist("-S"):
+        err_flag, err_msg, member = select_secondary(server, args)
+        server = member if member else server
+
+    if not err_flag and not server.is_locked():
+        dmp_dir = args.get_val("-o") + "/cp_dump_" \
+            + datetime.datetime.strftime(
+                datetime.datetime.now(), "%Y%m%d_%H%M")
+        fan_out_dirs = [os.path.join(item, os.path.basename(dmp_dir))
+                        for item in fan_out]
+        cp_args = {"threads": threads, "prev_dir": prev_dir,
+                   "use_hash": args.arg_exist("-g"), "cp_opts": cp_opts,
+                   "manifest": manifest, "cp_filter": cp_filter,
+                   "limiter": TokenBucket(limits["cp_rate_limit"],
+                                          limits["cp_iops_limit"]),
+                   "fan_out_dirs": fan_out_dirs,
+                   "page_cache": PageCache()
+                   if getattr(cfg, "drop_cache", True) else None}
+
+        if manifest is not None and prev_dir:
+            cp_args["prev_manifest"] = load_manifest(prev_dir)[1]
+
+        # Pre-copy while unlocked, only the changes are copied once locked.
+        if args.arg_exist("-w"):
+            pre_stats = {}
+            stats["pre_copy_start"] = time.time()
+            err_flag, err_msg, snapshot = pre_cp(
+                server.db_path, dmp_dir, stats=pre_stats, **cp_args)
+            stats["pre_copy_end"] = time.time()
+
+            for key, value in pre_stats.items():
+                stats["pre_copy_" + key] = value
+
+        # Nothing else needs the disk while the database is locked.
+        cp_args["limiter"].set_rate(limits["cp_locked_rate_limit"])
+
+        if not err_flag and args.arg_exist("-K"):
+            err_flag, err_msg = cold_cp(
+                server, dmp_dir, codec=codec, snapshot=snapshot, stats=stats,
+                start_cmd=[
+                    os.path.join(args.get_val("-p", def_val=""), "mongod"),
+                    "--config", getattr(cfg, "cp_mongod_conf", None),
+                    "--fork"],
+                max_lag=getattr(cfg, "cp_max_lag", 10),
+                shutdown_timeout=getattr(cfg, "cp_shutdown_timeout", 300),
+                catchup_timeout=getattr(cfg, "cp_catchup_timeout", 3600),
+                **cp_args)
+
+        elif not err_flag:
+            err_flag, err_msg = locked_cp(
+                server, dmp_dir, codec=codec, snapshot=snapshot, stats=stats,
+                budget=budget, **cp_args)
+
+        # Written pages are synced and dropped outside of the lock window.
+        if cp_args["page_cache"] and stats:
+            stats["page_cache"] = cp_args["page_cache"].finish()
+
+        stats = cp_summary(stats)
+        cp_err = err_msg if err_flag else None
+
+        for item in [dmp_dir] + fan_out_dirs:
+            wrt_msg = write_sidecars(
+                item, codec, stats, manifest=manifest, err_msg=cp_err)
+
+            if wrt_msg and not err_flag:
+                err_flag = True
+                err_msg = wrt_msg
+
+        # The previous dump keeps only the blocks changed since.
+        if delta_dir and not load_delta(delta_dir) and not err_flag:
+            delta_stats = {"dump": delta_dir}
+            err_flag, err_msg = delta_store(
+                delta_dir, dmp_dir, threads=threads, stats=delta_stats,
+                **delta_opts)
+            stats["delta_store"] = delta_stats
+
+    elif not err_flag:
+        err_flag = True
+        err_msg = "Error:  Database previously locked, unable to dump."
+
+    if mail and (err_flag or stats):
+        if err_flag:
+            mail.add_2_msg("Error/Warning detected in database dump.")
+            mail.add_2_msg(err_msg)
+
+        if stats:
+            mail.add_2_msg("Sync/Copy dump statistics:")
+            mail.add_2_msg(json.dumps(stats, indent=4))
+
+        mail.send_mail()
+
+    if member:
+        mongo_libs.disconnect([member])
+
+    return err_flag, err_msg
+
+
+def get_db_list(server):
+
+    """Function:  get_db_list
+
+    Description:  Returns the names of the databases to dump, largest on disk
+        first.  The local database is skipped as mongodump does for a whole
+        instance.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) List of database names or None if the databases could not
+            be listed
+
+    """
+
+    try:
+        data = server.adm_cmd("listDatabases")
+
+    except pymongo.errors.PyMongoError:
+        return None
+
+    return [item["name"] for item in sorted(
+        data.get("databases", []), key=lambda item: item.get("sizeOnDisk", 0),
+        reverse=True) if item["name"] != "local"]
+
+
+def get_coll_sizes(server, db_name):
+
+    """Function:  get_coll_sizes
+
+    Description:  Returns the data size (collStats) of the collections and
+        views of a database to dump.  Views and collections without
+        statistics are size 0.  System collections other than system.js are
+        skipped as mongodump does.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) db_name -> Database name
+        (output) sizes -> Dictionary of collection name and size or None if
+            the collections could not be listed
+
+    """
+
+    sizes = {}
+
+    try:
+        database = server.conn[db_name]
+
+        for item in database.list_collections():
+            if item["name"].startswith("system.") \
+                    and item["name"] != "system.js":
+                continue
+
+            try:
+                sizes[item["name"]] = database.command(
+                    "collStats", item["name"]).get("size", 0)
+
+            # A view has no statistics.
+            except pymongo.errors.OperationFailure:
+                sizes[item["name"]] = 0
+
+    except pymongo.errors.PyMongoError:
+        return None
+
+    return sizes
+
+
+def get_coll_list(server, db_name):
+
+    """Function:  get_coll_list
+
+    Description:  Returns the names of the collections and views of a
+        database to dump, largest data size (collStats) first.  Views and
+        collections without statistics are last.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) db_name -> Database name
+        (output) List of collection names or None if the collections could
+            not be listed
+
+    """
+
+    sizes = get_coll_sizes(server, db_name)
+
+    return None if sizes is None else sorted(
+        sizes, key=lambda name: sizes[name], reverse=True)
+
+
+def get_tuning(dmp_dir):
+
+    """Function:  get_tuning
+
+    Description:  Returns the past mongodump runs recorded in the dump
+        directory's tuning file.  A missing or unreadable file is no runs.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to dump directory
+        (output) List of dictionaries of past runs
+
+    """
+
+    try:
+        with open(os.path.join(dmp_dir, TUNING_FILE),
+                  mode="r", encoding="UTF-8") as f_hdlr:
+            runs = json.load(f_hdlr)
+
+    except (OSError, ValueError):
+        return []
+
+    return runs if isinstance(runs, list) else []
+
+
+def save_tuning(dmp_dir, run):
+
+    """Function:  save_tuning
+
+    Description:  Adds a mongodump run to the dump directory's tuning file,
+        keeping the last TUNING_RUNS runs.
+
+    Arguments:
+        (input) dmp_dir -> Directory path to dump directory
+        (input) run -> Dictionary of the run:  num_parallel, procs, bytes and
+            seconds
+
+    """
+
+    runs = (get_tuning(dmp_dir) + [run])[-TUNING_RUNS:]
+    f_name = os.path.join(dmp_dir, TUNING_FILE)
+
+    with open(f_name + ".tmp", mode="w", encoding="UTF-8") as f_hdlr:
+        json.dump(runs, f_hdlr, indent=4)
+
+    os.replace(f_name + ".tmp", f_name)
+
+
+def auto_parallel(server, args, procs=1):
+
+    """Function:  auto_parallel
+
+    Description:  Returns the --numParallelCollections value for -N auto
+        option.  The upper bound is the local and server cores shared by the
+        procs mongodumps, and the collections the data is spread over:  the
+        dump cannot finish before the largest collection, so more than
+        total size / largest size collections at a time does not help.  Up to
+        the bound the past runs with the same procs are hill climbed:  the
+        value with the best average MB/s is used once its neighbours have
+        been tried.  With no past runs the bound is used.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) procs -> Number of mongodumps run at the same time
+        (output) Number of collections to dump in parallel
+
+    """
+
+    local_cores = os.cpu_count() or 1
+
+    try:
+        server_cores = server.adm_cmd("hostInfo")["system"]["numCores"]
+
+    except (pymongo.errors.PyMongoError, KeyError, TypeError):
+        server_cores = local_cores
+
+    sizes = []
+    db_list = [args.get_val("-b")] if args.arg_exist("-b") \
+        else get_db_list(server) or []
+
+    for db_name in db_list:
+        sizes.extend((get_coll_sizes(server, db_name) or {}).values())
+
+    # Ceiling of the total size over the largest collection's size.
+    spread = -(-sum(sizes) // max(sizes)) if sizes and max(sizes) \
+        else len(sizes) or local_cores
+    bound = max(1, min(local_cores // procs, server_cores // procs, spread))
+
+    rates = collections.defaultdict(list)
+
+    for run in get_tuning(args.get_val("-o")):
+        if run.get("procs") == procs and run.get("seconds", 0) > 0 \
+                and 1 <= run.get("num_parallel", 0) <= bound:
+            rates[run["num_parallel"]].append(run["bytes"] / run["seconds"])
+
+    if not rates:
+        return bound
+
+    best = max(rates, key=lambda item: sum(rates[item]) / len(rates[item]))
+
+    for num in (best + 1, best - 1):
+        if 1 <= num <= bound and num not in rates:
+            return num
+
+    return best
+
+
+def compress_stream(src, arch_file, **kwargs):
+
+    """Function:  compress_stream
+
+    Description:  Reads a stream to its end and writes it compressed to a
+        file.  The stream is cut into chunks which are compressed in parallel
+        as independent gzip members or zstd frames and written in order, so
+        the file can be read with the standard gzip and zstd tools.
+
+    Arguments:
+        (input) src -> Binary file object to read, e.g. a program's stdout
+        (input) arch_file -> Directory path and file name of the compressed
+            file
+        (input) **kwargs:
+            codec -> gzip|zstd
+            level -> Compression level
+            threads -> Number of compression threads
+            chunk_size -> Number of bytes compressed per chunk
+            stats -> Dictionary the bytes and bytes_written counts are set in
+
+    """
+
+    compress, _ = get_codec(kwargs.get("codec", "zstd"),
+                            kwargs.get("level", None))
+    threads = kwargs.get("threads", 1)
+    chunk_size = kwargs.get("chunk_size", 4194304)
+    stats = kwargs.get("stats", {})
+    pending = collections.deque()
+    nbytes = 0
+
+    with open(arch_file, mode="wb") as out, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        for data in iter(functools.partial(src.read, chunk_size), b""):
+            nbytes += len(data)
+            pending.append(pool.submit(compress, data))
+
+            # Bound the memory held by chunks waiting to be written.
+            while len(pending) > threads * 2:
+                out.write(pending.popleft().result())
+
+        while pending:
+            out.write(pending.popleft().result())
+
+        stats["bytes"] = nbytes
+        stats["bytes_written"] = out.tell()
+
+
+def splice_stream(src, arch_file, **kwargs):
+
+    """Function:  splice_stream
+
+    Description:  Writes a pipe's data to a file until the pipe is closed,
+        without copying it through user space:  splice moves the pages from
+        the pipe to the file in the kernel.  Falls back to a read/write loop
+        if splice is not available or the file does not support it.
+
+    Arguments:
+        (input) src -> Binary file object of a pipe, e.g. a program's stdout
+        (input) arch_file -> Directory path and file name of the file
+        (input) **kwargs:
+            chunk_size -> Number of bytes per call
+            stats -> Dictionary the bytes and bytes_written counts are set in
+
+    """
+
+    chunk_size = kwargs.get("chunk_size", PIPE_SIZE)
+    stats = kwargs.get("stats", {})
+    use_splice = callable(getattr(os, "splice", None))
+    fd_in = src.fileno()
+    nbytes = 0
+
+    with contextlib.suppress(AttributeError, OSError):
+        fcntl.fcntl(fd_in, fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+
+    with open(arch_file, mode="wb", buffering=0) as out:
+        while True:
+            if use_splice:
+                try:
+                    count = os.splice(fd_in, out.fileno(), chunk_size)
+
+                except OSError as msg:
+                    if msg.errno not in (errno.EINVAL, errno.ENOSYS):
+                        raise
+
+                    use_splice = False
+                    continue
+
+            else:
+                data = memoryview(os.read(fd_in, chunk_size))
+                count = len(data)
+
+                while data:
+                    data = data[out.write(data):]
+
+            if not count:
+                break
+
+            nbytes += count
+
+    stats["bytes"] = nbytes
+    stats["bytes_written"] = nbytes
+
+
+def run_cmd(                                      # pylint:disable=R0913,R0917
+        server, cmd, log_file, err_file, line_func=None, out_func=None):
+
+    """Function:  run_cmd
+
+    Description:  Runs a mongo program with the password passed on standard
+        in and waits for it to finish.  Its standard error (the program's log)
+        is written to log_file and its standard out to err_file.  With
+        line_func, the log is read a line at a time as it is written, each
+        line is written to log_file and passed to line_func.  With out_func,
+        standard out is passed to out_func in a thread instead, the program
+        is killed if out_func fails.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) cmd -> Command line list
+        (input) log_file -> Directory path and file name for log file
+        (input) err_file -> Directory path and file name for error file
+        (input) line_func -> Function called with each log line
+        (input) out_func -> Function called with the standard out stream
+        (output) Return code of the program
+
+    """
+
+    with open(err_file, mode="w", encoding="UTF-8") as e_file:
+        proc2 = subprocess.Popen(                       # pylint:disable=R1732
+            ["echo", server.japd], stdout=subprocess.PIPE)
+
+        # Line buffered so the log file is as current as the output.
+        with open(log_file, mode="w", encoding="UTF-8",
+                  buffering=1) as l_file:
+            proc1 = subprocess.Popen(                   # pylint:disable=R1732
+                cmd, stderr=subprocess.PIPE if line_func else l_file,
+                stdin=proc2.stdout,
+                stdout=subprocess.PIPE if out_func else e_file)
+
+            def read_out():
+                done = False
+
+                try:
+                    out_func(proc1.stdout)
+                    done = True
+
+                finally:
+                    # Do not leave the program blocked on a full pipe.
+                    if not done:
+                        proc1.kill()
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                future = pool.submit(read_out) if out_func else None
+
+                if line_func:
+                    with io.TextIOWrapper(proc1.stderr, encoding="UTF-8",
+                                          errors="replace") as f_hdlr:
+                        for line in f_hdlr:
+                            l_file.write(line)
+                            line_func(line)
+
+                if future:
+                    future.result()
+
+            return proc1.wait()
+
+
+def parallel_dump(                          # pylint:disable=R0913,R0914,R0917
+        server, cmd, dump_list, log_file, err_file, procs=1, line_func=None):
+
+    """Function:  parallel_dump
+
+    Description:  Runs the dump command once per entry of dump_list (a --db=
+        or --collection= option), up to procs at the same time.  Each
+        command is started as soon as one finishes, in the order of
+        dump_list, so with the largest first the work is spread with longest
+        processing time scheduling.  Once all are done, each command's log
+        and error output is appended to log_file and err_file in the order of
+        dump_list.  A command exiting with an error adds a line to err_file.
+        With line_func, each command's log lines are passed to it as they are
+        written.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) cmd -> Command line list
+        (input) dump_list -> List of command line options, one command run
+            per option, largest first
+        (input) log_file -> Directory path and file name for log file
+        (input) err_file -> Directory path and file name for error file
+        (input) procs -> Number of commands run at the same time
+        (input) line_func -> Function called with each log line
+
+    """
+
+    log_base, log_ext = os.path.splitext(log_file)
+    err_base, err_ext = os.path.splitext(err_file)
+    parts = [(option, f"{log_base}_{index}{log_ext}",
+              f"{err_base}_{index}{err_ext}")
+             for index, option in enumerate(dump_list)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=procs) as pool:
+        codes = list(pool.map(
+            lambda item: run_cmd(
+                server, cmd + [item[0]], item[1], item[2], line_func),
+            parts))
+
+    with open(log_file, mode="w", encoding="UTF-8") as l_file, \
+            open(err_file, mode="w", encoding="UTF-8") as e_file:
+        for (option, part_log, part_err), code in zip(parts, codes):
+            for part_file, f_hdlr in [(part_log, l_file), (part_err, e_file)]:
+                with open(part_file, mode="r", encoding="UTF-8") as p_hdlr:
+                    shutil.copyfileobj(p_hdlr, f_hdlr)
+
+                os.remove(part_file)
+
+            if code:
+                e_file.write(f"{os.path.basename(cmd[0])} {option} exited"
+                             f" with return code {code}\n")
+
+
+def mongo_dump(server, args, **kwargs):                 # pylint:disable=R0912
+
+    """Function:  mongo_dump
+
+    Description:  Create the dump command and execute it.  With -P option
+        over 1, one mongodump is run per database, or per collection of a
+        single database (-b option), -P option at the same time.  A point in
+        time (-l option), single collection (-t option) or users and roles
+        (-r option) dump is a single mongodump.  The -N option sets
+        --numParallelCollections, auto_parallel picks it for -N auto.  With
+        -Z option a single mongodump writes an archive which is compressed
+        with the codec using all CPUs, or written as is with -Z none.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) **kwargs:
+            opt_arg -> Dictionary of additional options to add
+            mail -> Email class instance
+            req_arg -> List of required options for the command line
+            cfg -> Configuration module with the dump_level setting
+        (output) err_flag -> If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    log_name = "dump_"
+    err_flag = False
+    err_msg = None
+    dtg = datetime.datetime.strftime(datetime.datetime.now(), "%Y%m%d_%H%M%S")
+
+    try:
+        procs = int(args.get_val("-P", def_val=1))
+
+    except ValueError:
+        procs = 0
+
+    num_parallel = args.get_val("-N", def_val=None)
+    codec = args.get_val("-Z", def_val=None)
+    level = getattr(kwargs.get("cfg", None), "dump_level", None)
+
+    if num_parallel not in (None, "auto") \
+            and not (num_parallel.isdigit() and int(num_parallel) > 0):
+        err_flag = True
+        err_msg = "Error:  -N option requires a positive integer or auto."
+
+    elif codec and codec not in DUMP_EXT:
+        err_flag = True
+        err_msg = f"Error:  -Z option must be one of: {', '.join(DUMP_EXT)}"
+
+    elif codec == "zstd" and not zstandard:
+        err_flag = True
+        err_msg = "Error:  -Z zstd requires the zstandard python module."
+
+    elif level is not None and not isinstance(level, int):
+        err_flag = True
+        err_msg = "Error:  dump_level must be an integer or None."
+
+    elif procs < 1:
+        err_flag = True
+        err_msg = "Error:  -P option requires a positive integer."
+
+    elif args.arg_exist("-o") and args.get_val("-o"):
+        log_file = os.path.join(args.get_val("-o"), log_name + dtg + ".log")
+        err_file = os.path.join(args.get_val("-o"), log_name + dtg + ".err")
+
+        # A single archive is written by a single mongodump.
+        if codec:
+            kwargs = dict(kwargs, archive={
+                "arch_file": os.path.join(
+                    args.get_val("-o"), log_name + dtg + DUMP_EXT[codec]),
+                "codec": codec, "level": level,
+                "threads": os.cpu_count() or 1, "stats": {}})
+
+        # --oplog is only consistent within a single whole instance dump.
+        elif procs > 1 and not args.arg_exist("-b") \
+                and not args.arg_exist("-l"):
+            kwargs = dict(kwargs, procs=procs, dump_list=[
+                "--db=" + name for name in get_db_list(server) or []])
+
+        # A single database is split by collection.
+        elif procs > 1 and args.arg_exist("-b") and not args.arg_exist("-t") \
+                and not args.arg_exist("-r"):
+            kwargs = dict(kwargs, procs=procs, dump_list=[
+                "--collection=" + name for name in
+                get_coll_list(server, args.get_val("-b")) or []])
+
+        if num_parallel == "auto":
+            num_parallel = auto_parallel(
+                server, args, kwargs.get("procs", 1))
+
+        if num_parallel:
+            kwargs = dict(kwargs, num_parallel=int(num_parallel))
+
+        err_flag, err_msg = mongo_generic(
+            server, args, "mongodump", log_file, err_file=err_file, **kwargs)
+
+    else:
+        err_flag = True
+        err_msg = "Error:  Missing -o option or value."
+
+    return err_flag, err_msg
+
+
+def mongo_generic(                          # pylint:disable=R0912,R0914,R0915
+        server, args, cmd_name, log_file, **kwargs):
+
+    """Function:  mongo_generic
+
+    Description:  Create a mongo dump/export command and execute it.  Unless
+        drop_cache is False, the files written are dropped from the page cache
+        once the command is done.  With num_parallel a successful run's size
+        and time are saved to the dump directory's tuning file for -N auto
+        option.
+        The command's log is shown as it is written and a LogSummary of it
+        is mailed.  Its progress lines are written by DumpProgress as JSON
+        lines next to the log file and, with prom_textfile_dir, as a
+        Prometheus textfile.  With archive, mongodump writes an archive to
+        standard out which compress_stream compresses into the dump
+        directory, or splice_stream moves there as is with codec none.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) cmd_name -> Name of Mongo binary program to execute
+        (input) log_file -> Directory path and file name for log file
+        (input) **kwargs:
+            opt_arg -> Dictionary of additional options to add
+            req_arg -> List of required options for the command line
+            mail -> Email class instance
+            err_file -> Directory path and file name for error file
+            cfg -> Configuration module with the drop_cache and
+                prom_textfile_dir settings
+            dump_list -> List of --db= or --collection= options to dump in
+                parallel, one command per option
+            procs -> Number of commands run at the same time for dump_list
+            num_parallel -> Value of --numParallelCollections option
+            archive -> Dictionary of compress_stream arguments:  arch_file,
+                codec, level, threads and stats
+        (output) err_flag -> If an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    mail = kwargs.get("mail", None)
+    page_cache = PageCache() \
+        if getattr(kwargs.get("cfg", None), "drop_cache", True) \
+        and args.arg_exist("-o") else None
+    err_file = kwargs.get("err_file", log_file + ".err")
+    archive = kwargs.get("archive", None)
+    summary = LogSummary(args.arg_exist("-x"))
+    prom_dir = getattr(kwargs.get("cfg", None), "prom_textfile_dir", None)
+    flavor = args.get_val("-y", def_val=None)
+    progress = DumpProgress(
+        os.path.splitext(log_file)[0] + ".progress.jsonl",
+        os.path.join(prom_dir, f"mongo_db_dump_{cmd_name}"
+                     f"{'_' + flavor if flavor else ''}.prom")
+        if prom_dir else None, cmd_name)
+    cmd = mongo_libs.create_cmd(
+        server, args, cmd_name, "-p", no_pass=True, **kwargs)
+
+    if kwargs.get("num_parallel", None):
+        cmd.append(f"--numParallelCollections={kwargs['num_parallel']}")
+
+    if archive:
+        cmd = [item for item in cmd if not item.startswith("--out=")] \
+            + ["--archive"]
+
+    # File times lag the clock by up to a timer tick.
+    start = time.time_ns() - 1000000000
+    run_start = time.monotonic()
+
+    def line_func(line):
+        summary.add(line)
+        progress.add(line)
+
+    code = 0
+
+    if kwargs.get("dump_list", None):
+        parallel_dump(server, cmd, kwargs["dump_list"], log_file, err_file,
+                      kwargs.get("procs", 1), line_func)
+
+    elif archive:
+        try:
+            code = run_cmd(
+                server, cmd, log_file, err_file, line_func,
+                functools.partial(
+                    splice_stream if archive["codec"] == "none"
+                    else compress_stream, **archive))
+
+        except (OSError, ValueError) as msg:
+            err_flag = True
+            err_msg = f"Error:  Unable to write {archive['arch_file']}: {msg}"
+
+    else:
+        code = run_cmd(server, cmd, log_file, err_file, line_func)
+
+    progress.finish()
+    process_log_file(log_file, args.arg_exist("-x"), mail, summary)
+    out_paths = get_out_paths(
+        server, args, archive, kwargs.get("dump_list", None)) \
+        if args.arg_exist("-o") else []
+
+    # Only a successful run is a sample of the dump rate.
+    if kwargs.get("num_parallel", None) and not err_flag and not code \
+            and gen_libs.is_empty_file(err_file):
+        save_tuning(args.get_val("-o"), {
+            "date": datetime.datetime.now().isoformat(),
+            "num_parallel": kwargs["num_parallel"],
+            "procs": kwargs.get("procs", 1)
+            if kwargs.get("dump_list", None) else 1,
+            "bytes": sum(os.path.getsize(f_name)
+                         for f_name in get_written(out_paths, start)),
+            "seconds": round(time.monotonic() - run_start, 3)})
+
+    if archive and not err_flag:
+        arch_msg = "Archive:  " + json.dumps(
+            dict(archive["stats"], file=archive["arch_file"]))
+
+        if not args.arg_exist("-x"):
+            print(arch_msg)
+
+        if mail:
+            mail.add_2_msg(arch_msg)
+
+    if page_cache:
+        drop_written(out_paths, start, page_cache)
+        cache_msg = "Page cache:  " + json.dumps(page_cache.finish())
+
+        if not args.arg_exist("-x"):
+            print(cache_msg)
+
+        if mail:
+            mail.add_2_msg(cache_msg)
+
+    if gen_libs.is_empty_file(err_file):
+        gen_libs.rm_file(err_file)
+
+    else:
+        err_list = gen_libs.file_2_list(err_file)
+        err_flag = True
+        err_msg = f"Error detected in error file: {err_file}"
+
+        if mail:
+            mail.add_2_msg("Error messages detected during dump:")
+
+        for line in err_list:
+            print(line)
+
+            if mail:
+                mail.add_2_msg(line)
+
+    if mail and mail.msg:
+        mail.send_mail()
+
+    return err_flag, err_msg
+
+
+class LogSummary():
+
+    """Class:  LogSummary
+
+    Description:  Shows the lines of a mongo program's log as they are read
+        and keeps a bounded summary for the email:  the first LOG_HEAD_LINES
+        and last LOG_TAIL_LINES lines and the number of lines in between, so
+        the memory used does not grow with the log.  Lines can be added by
+        several threads.
+
+    Methods:
+        __init__
+        add
+        lines
+
+    """
+
+    def __init__(self, sup_std=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) sup_std -> True|False - Suppress standard out
+
+        """
+
+        self.mutex = threading.Lock()
+        self.sup_std = sup_std
+        self.head = []
+        self.tail = collections.deque(maxlen=LOG_TAIL_LINES)
+        self.count = 0
+
+    def add(self, line):
+
+        """Method:  add
+
+        Description:  Prints a log line, unless suppressed, and adds it to the
+            summary.
+
+        Arguments:
+            (input) line -> Log line
+
+        """
+
+        line = line.rstrip("\n")
+
+        with self.mutex:
+            if not self.sup_std:
+                print(line, flush=True)
+
+            if len(self.head) < LOG_HEAD_LINES:
+                self.head.append(line)
+
+            else:
+                self.tail.append(line)
+
+            self.count += 1
+
+    def lines(self):
+
+        """Method:  lines
+
+        Description:  Returns the summary lines, a note replaces the lines not
+            kept.
+
+        Arguments:
+            (output) List of log lines
+
+        """
+
+        with self.mutex:
+            skipped = self.count - len(self.head) - len(self.tail)
+
+            return self.head + (
+                [f"... {skipped} log lines not shown ..."] if skipped
+                else []) + list(self.tail)
+
+
+class DumpProgress():                           # pylint:disable=R0902
+
+    """Class:  DumpProgress
+
+    Description:  Parses the progress lines ([####....] db.coll 1234/5678
+        (21.7%)) and done lines of a mongo program's log as they are read
+        into per collection progress:  documents done, docs/sec since the
+        collection was first seen and estimated seconds left.  Each update is
+        appended as a JSON line to json_file and the latest progress of all
+        collections is written to a Prometheus textfile (prom_file), at most
+        every PROM_INTERVAL seconds and when finished, so a stalled or slow
+        dump can be seen while it runs.  Lines can be added by several
+        threads.  If a file cannot be written, a warning is printed and no
+        more metrics are written, the mongo program is not affected.
+
+    Methods:
+        __init__
+        add
+        write_prom
+        stop
+        finish
+
+    """
+
+    def __init__(self, json_file, prom_file=None, program="mongodump"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) json_file -> Path and file name of the JSON lines file
+            (input) prom_file -> Path and file name of the Prometheus textfile
+                or None
+            (input) program -> Name of the mongo program, a metric label
+
+        """
+
+        self.mutex = threading.Lock()
+        self.json_file = json_file
+        self.prom_file = prom_file
+        self.program = program
+        self.f_hdlr = None
+        self.colls = {}
+        self.start = time.time()
+        self.prom_time = 0.0
+        self.running = 1
+
+        if self.prom_file:
+            try:
+                self.write_prom()
+
+            except OSError as msg:
+                self.stop(msg)
+
+    def add(self, line):
+
+        """Method:  add
+
+        Description:  Updates the progress of a collection from a log line,
+            other lines are ignored.
+
+        Arguments:
+            (input) line -> Log line
+
+        """
+
+        match = PROGRESS_LINE.search(line) or DONE_LINE.search(line)
+
+        if not match or not self.json_file:
+            return
+
+        now = time.time()
+        docs = int(match.group("docs"))
+        total = int(match.group("total")) \
+            if "total" in match.groupdict() else docs
+
+        with self.mutex:
+            coll = self.colls.setdefault(match.group("ns"), {
+                "first_time": now, "first_docs": docs})
+            elapsed = now - coll["first_time"]
+            rate = (docs - coll["first_docs"]) / elapsed if elapsed else 0.0
+            coll.update({
+                "time": round(now, 3), "docs": docs, "total": total,
+                "percent": round(docs / total * 100, 1) if total else 100.0,
+                "docs_per_sec": round(rate, 1),
+                "eta_seconds": round((total - docs) / rate, 1) if rate
+                else None, "done": match.re is DONE_LINE})
+
+            if coll["done"]:
+                coll["eta_seconds"] = 0.0
+
+            try:
+                if self.f_hdlr is None:
+                    self.f_hdlr = open(             # pylint:disable=R1732
+                        self.json_file, mode="a", encoding="UTF-8",
+                        buffering=1)
+
+                self.f_hdlr.write(json.dumps(dict(
+                    {"ns": match.group("ns"), "program": self.program},
+                    **{key: coll[key] for key in [
+                        "time", "docs", "total", "percent", "docs_per_sec",
+                        "eta_seconds", "done"]})) + "\n")
+
+                if self.prom_file and now - self.prom_time >= PROM_INTERVAL:
+                    self.write_prom(now)
+
+            except OSError as msg:
+                self.stop(msg)
+
+    def write_prom(self, now=None):
+
+        """Method:  write_prom
+
+        Description:  Writes the progress in Prometheus text format to
+            prom_file, replacing it in one rename so it is never read half
+            written.  Called with the mutex held or before any lines.
+
+        Arguments:
+            (input) now -> time.time() of the write
+
+        """
+
+        self.prom_time = now or time.time()
+        label = f'program="{self.program}"'
+        lines = [
+            "# HELP mongo_dump_running 1 while the mongo program runs.",
+            "# TYPE mongo_dump_running gauge",
+            f"mongo_dump_running{{{label}}} {self.running}",
+            "# HELP mongo_dump_start_time_seconds Start of the mongo program.",
+            "# TYPE mongo_dump_start_time_seconds gauge",
+            f"mongo_dump_start_time_seconds{{{label}}} {self.start:.3f}"]
+        metrics = [
+            ("docs", "Documents done.", "docs"),
+            ("total_docs", "Documents in the collection.", "total"),
+            ("docs_per_second", "Documents per second.", "docs_per_sec"),
+            ("eta_seconds", "Estimated seconds left.", "eta_seconds"),
+            ("done", "1 once the collection is done.", "done"),
+            ("last_update_time_seconds", "Time of the last progress line.",
+             "time")]
+
+        for name, text, key in metrics:
+            lines.extend([f"# HELP mongo_dump_collection_{name} {text}",
+                          f"# TYPE mongo_dump_collection_{name} gauge"])
+
+            for nspace, coll in sorted(self.colls.items()):
+                if coll[key] is not None:
+                    ns_label = nspace.replace("\\", "\\\\").replace(
+                        '"', '\\"')
+                    lines.append(
+                        f'mongo_dump_collection_{name}{{{label},'
+                        f'ns="{ns_label}"}} {round(float(coll[key]), 3)}')
+
+        with open(self.prom_file + ".tmp", mode="w",
+                  encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("\n".join(lines) + "\n")
+
+        os.replace(self.prom_file + ".tmp", self.prom_file)
+
+    def stop(self, msg):
+
+        """Method:  stop
+
+        Description:  Prints a warning and stops writing the metrics after a
+            file cannot be written.  Called with the mutex held or before any
+            lines.
+
+        Arguments:
+            (input) msg -> Error of the failed write
+
+        """
+
+        print(f"Warning:  Progress metrics stopped: {msg}")
+        self.json_file = None
+        self.prom_file = None
+
+        if self.f_hdlr:
+            with contextlib.suppress(OSError):
+                self.f_hdlr.close()
+
+            self.f_hdlr = None
+
+    def finish(self):
+
+        """Method:  finish
+
+        Description:  Closes the JSON lines file and writes the final
+            Prometheus textfile with mongo_dump_running 0.
+
+        Arguments:
+
+        """
+
+        with self.mutex:
+            if self.f_hdlr:
+                self.f_hdlr.close()
+                self.f_hdlr = None
+
+            self.running = 0
+
+            if self.prom_file:
+                try:
+                    self.write_prom()
+
+                except OSError as msg:
+                    self.stop(msg)
+
+
+def process_log_file(log_file, sup_std, mail, summary=None):
+
+    """Function:  process_log_file
+
+    Description:  Checks and processes the log file to standard out and mail.
+        The log file is read a line at a time and only a LogSummary of it is
+        mailed.  With summary, the log was already shown as it was written
+        and only the summary is mailed.
+
+    Arguments:
+        (input) log_file -> Directory path and file name for log file
+        (input) sup_std -> True|False -Suppress standard out
+        (input) mail -> Email class instance
+        (input) summary -> LogSummary of the log already read
+
+    """
+
+    if summary is None and not gen_libs.is_empty_file(log_file):
+        summary = LogSummary(sup_std)
+
+        with open(log_file, mode="r", encoding="UTF-8",
+                  errors="replace") as f_hdlr:
+            for line in f_hdlr:
+                summary.add(line)
+
+    if summary and mail:
+        for line in summary.lines():
+            mail.add_2_msg(line)
 
 
 def mongo_export(server, args, **kwargs):
@@ -429,17 +4976,22 @@ def run_program(args, func_dict, **kwargs):
         (input) **kwargs:
             opt_arg -> Dictionary of additional options to add
             arg_req_dict -> contains link between config and required option
+            offline_list -> List of options whose functions only use files,
+                the server is not connected to or passed to them
 
     """
 
     func_dict = dict(func_dict)
     arg_req_dict = dict(kwargs.get("arg_req_dict", {}))
+    offline = set(args.get_args_keys()) & set(kwargs.pop("offline_list", []))
     mail = None
     server = mongo_libs.create_instance(
         args.get_val("-c"), args.get_val("-d"), mongo_class.Server)
-    status = server.connect()
+    status = (True, None) if offline else server.connect()
 
     if status[0]:
+        kwargs["cfg"] = gen_libs.load_module(
+            args.get_val("-c"), args.get_val("-d"))
         req_arg = get_req_options(server, arg_req_dict)
 
         if args.arg_exist("-e"):
@@ -451,14 +5003,16 @@ def run_program(args, func_dict, **kwargs):
 
         # Intersect args_array and func_dict to decide which functions to call
         for item in set(args.get_args_keys()) & set(func_dict.keys()):
+            func_args = [args] if item in offline else [server, args]
             err_flag, err_msg = func_dict[item](
-                server, args, mail=mail, req_arg=req_arg, **kwargs)
+                *func_args, mail=mail, req_arg=req_arg, **kwargs)
 
             if err_flag:
                 print(err_msg)
                 break
 
-        mongo_libs.disconnect([server])
+        if not offline:
+            mongo_libs.disconnect([server])
 
     else:
         print(f"Connection failure:  {status[1]}")
@@ -476,6 +5030,7 @@ def main():
         dir_perms_chk -> contains directories and their octal permissions
         dir_perms_crt -> contains directories to be created and their perms
         func_dict -> dictionary list for the function calls or other options
+        offline_list -> contains options which do not connect to the server
         opt_arg_list -> contains optional arguments for the command line
         opt_con_req_list -> contains the options that require other options
         opt_multi_list -> contains the options that will have multiple values
@@ -492,18 +5047,32 @@ def main():
     arg_req_dict = {"auth_db": "--authenticationDatabase="}
     dir_perms_chk = {"-d": 5, "-p": 5}
     dir_perms_crt = {"-o": 7}
-    func_dict = {"-A": sync_cp_dump, "-M": mongo_dump, "-E": mongo_export}
+    func_dict = {
+        "-A": sync_cp_dump, "-M": mongo_dump, "-E": mongo_export,
+        "-C": verify_dump, "-R": restore_dump}
+    offline_list = ["-C", "-R"]
     opt_arg_list = {
         "-l": "--oplog", "-z": "--gzip", "-b": "--db=", "-o": "--out=",
         "-q": "--quiet", "-i": "--tlsInsecure", "-r": "--dumpDbUsersAndRoles",
         "-t": "--collection="}
     opt_con_req_list = {
-        "-r": ["-b"], "-t": ["-b"], "-s": ["-e"], "-E": ["-b", "-t"]}
-    opt_multi_list = ["-e", "-s"]
+        "-r": ["-b"], "-t": ["-b"], "-s": ["-e"], "-E": ["-b", "-t"],
+        "-n": ["-A"], "-k": ["-A"], "-g": ["-k"], "-w": ["-A"],
+        "-a": ["-A"], "-m": ["-A"], "-j": ["-A"], "-f": ["-A"],
+        "-S": ["-A"], "-K": ["-A"], "-D": ["-A"], "-P": ["-M"],
+        "-N": ["-M"], "-Z": ["-M"]}
+    opt_multi_list = ["-e", "-s", "-f"]
     opt_req_list = ["-c", "-d", "-o"]
-    opt_val_list = ["-b", "-c", "-d", "-o", "-p", "-t", "-e", "-s", "-y"]
-    opt_xor_dict = {"-A": ["-M", "-E"], "-E": ["-M", "-A"], "-M": ["-A", "-E"]}
-    xor_noreq_list = {"-l": "-b"}
+    opt_val_list = [
+        "-b", "-c", "-d", "-o", "-p", "-t", "-e", "-s", "-y", "-n", "-a",
+        "-m", "-C", "-f", "-R", "-P", "-N", "-Z"]
+    opt_xor_dict = {
+        "-A": ["-M", "-E", "-C", "-R"], "-E": ["-M", "-A", "-C", "-R"],
+        "-M": ["-A", "-E", "-C", "-R"], "-C": ["-A", "-M", "-E", "-R"],
+        "-R": ["-A", "-M", "-E", "-C"]}
+    xor_noreq_list = {
+        "-l": "-b", "-a": "-w", "-k": "-a", "-j": "-a", "-K": "-S", "-m": "-K",
+        "-D": "-a", "-Z": "-z"}
 
     # Process argument list from command line.
     args = gen_class.ArgParser(
@@ -522,7 +5091,7 @@ def main():
             prog_lock = gen_class.ProgramLock(
                 sys.argv, args.get_val("-y", def_val=""))
             run_program(args, func_dict, opt_arg=opt_arg_list,
-                        arg_req_dict=arg_req_dict)
+                        arg_req_dict=arg_req_dict, offline_list=offline_list)
             del prog_lock
 
         except gen_class.SingleInstanceException:
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  cp_benchmark.py
+
+    Description:  Micro-benchmark of the Sync/Copy dump copy methods in
+        mongo_db_dump.py.  Creates a synthetic dbpath (a few large collection
+        files and many small index files) and times shutil.copytree against
+        parallel_cp with each cp_method setting.  Run it against the storage
+        the dumps are written to and set cp_method in the configuration file
+        to the fastest method.
+
+    Usage:
+        test/benchmark/mongo_db_dump/cp_benchmark.py [dir_path [size_mb
+            [threads]]]
+
+    Arguments:
+        dir_path -> Directory to create the dbpath and copies in, should be
+            on the dump storage (default is ./test/unit/mongo_db_dump/tmp).
+        size_mb -> Total size of the synthetic dbpath in MB (default 1024).
+        threads -> Number of copy worker threads (default 8).
+
+    Notes:
+        Results are in MB/s.  Copies within the same filesystem may be cloned
+            (clone and auto methods), which does not move any data.  Drop the
+            page cache between runs for cold cache results.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def make_dbpath(db_path, size_mb):
+
+    """Function:  make_dbpath
+
+    Description:  Creates a synthetic dbpath.  Three quarters of the data is
+        in 8 collection files, the rest is in 64 index files.
+
+    Arguments:
+        (input) db_path -> Directory path to create
+        (input) size_mb -> Total size in MB
+
+    """
+
+    block = os.urandom(1048576)
+    os.makedirs(os.path.join(db_path, "journal"))
+    files = [(f"collection-{cnt}.wt", size_mb * 3 // 4 // 8)
+             for cnt in range(8)]
+    files += [(f"index-{cnt}.wt", max(1, size_mb // 4 // 64))
+              for cnt in range(64)]
+
+    for f_name, f_size in files:
+        with open(os.path.join(db_path, f_name), mode="wb") as f_hdlr:
+            for _ in range(f_size):
+                f_hdlr.write(block)
+
+    with open(os.path.join(db_path, "journal", "WiredTigerLog.1"),
+              mode="wb") as f_hdlr:
+        f_hdlr.write(block)
+
+
+def run_test(name, func, dst_dir):
+
+    """Function:  run_test
+
+    Description:  Times a copy and removes the copy afterwards.
+
+    Arguments:
+        (input) name -> Name of the test
+        (input) func -> Function which does the copy
+        (input) dst_dir -> Directory path the copy is made to
+        (output) Number of seconds the copy took
+
+    """
+
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(dst_dir)
+    print(f"{name:<24} {elapsed:8.3f} s", end="")
+
+    return elapsed
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Creates the synthetic dbpath and runs each copy method.
+
+    Variables:
+        dir_path -> Directory the tests are run in
+        size_mb -> Total size of the synthetic dbpath in MB
+        threads -> Number of copy worker threads
+
+    Arguments:
+
+    """
+
+    dir_path = sys.argv[1] if len(sys.argv) > 1 \
+        else "./test/unit/mongo_db_dump/tmp"
+    size_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    db_path = os.path.join(dir_path, "cp_benchmark_db")
+    dst_dir = os.path.join(dir_path, "cp_benchmark_dst")
+    tests = [("copytree", lambda: shutil.copytree(db_path, dst_dir))]
+
+    for method in mongo_db_dump.CP_METHODS:
+        for direct in ([False, True] if method == "read" else [False]):
+            opts = {"method": method, "chunk_size": 67108864,
+                    "direct": direct}
+            tests.append(
+                (method + (" (O_DIRECT)" if direct else ""),
+                 lambda opts=opts: mongo_db_dump.parallel_cp(
+                     db_path, dst_dir, threads=threads, cp_opts=opts)))
+
+    make_dbpath(db_path, size_mb)
+    mb_size = sum(
+        os.path.getsize(os.path.join(path, f_name))
+        for path, _, f_list in os.walk(db_path)
+        for f_name in f_list) / 1048576
+
+    try:
+        for name, func in tests:
+            elapsed = run_test(name, func, dst_dir)
+            print(f" {mb_size / elapsed:10.1f} MB/s")
+
+    finally:
+        shutil.rmtree(db_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+# Classification (U)
+
+"""Program:  pipe_benchmark.py
+
+    Description:  Micro-benchmark of the mongodump archive (-M -Z option)
+        pipe sinks in mongo_db_dump.py.  Creates a synthetic archive file,
+        streams it through a pipe from a child program (cat) as mongodump
+        --archive does and times writing the pipe's data to a file with a
+        buffered read/write copy (shutil.copyfileobj) against splice_stream
+        (-Z none) and compress_stream (-Z gzip and zstd).
+
+    Usage:
+        test/benchmark/mongo_db_dump/pipe_benchmark.py [dir_path [size_mb
+            [threads]]]
+
+    Arguments:
+        dir_path -> Directory to create the archive and copies in, should be
+            on the dump storage (default is ./test/unit/mongo_db_dump/tmp).
+        size_mb -> Size of the synthetic archive in MB (default 1024).
+        threads -> Number of compression threads (default is all CPUs).
+
+    Notes:
+        Results are in MB/s of the archive.  The synthetic archive is half
+            random and half repeated data so it compresses about 2:1.  The
+            child reads the archive from the page cache, so the results are
+            of the pipe and the sink, not of the storage the archive is
+            read from.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import shutil
+import functools
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def make_archive(src_file, size_mb):
+
+    """Function:  make_archive
+
+    Description:  Creates a synthetic archive file, each MB is half random
+        and half repeated data.
+
+    Arguments:
+        (input) src_file -> Directory path and file name to create
+        (input) size_mb -> Size in MB
+
+    """
+
+    with open(src_file, mode="wb") as f_hdlr:
+        for _ in range(size_mb):
+            f_hdlr.write(os.urandom(524288) + b"mongodump" * 58254
+                         + b"\0" * 2)
+
+
+def buffered_stream(src, dst_file, **kwargs):
+
+    """Function:  buffered_stream
+
+    Description:  Writes a pipe's data to a file through a user space buffer,
+        the path the data takes without splice_stream.
+
+    Arguments:
+        (input) src -> Binary file object of a pipe
+        (input) dst_file -> Directory path and file name of the file
+        (input) **kwargs:
+            chunk_size -> Number of bytes per read
+
+    """
+
+    with open(dst_file, mode="wb") as f_hdlr:
+        shutil.copyfileobj(src, f_hdlr,
+                           kwargs.get("chunk_size", mongo_db_dump.PIPE_SIZE))
+
+
+def run_test(name, func, src_file, dst_file):
+
+    """Function:  run_test
+
+    Description:  Times a pipe sink reading a child's standard out and
+        removes the file written afterwards.
+
+    Arguments:
+        (input) name -> Name of the test
+        (input) func -> Function which reads the pipe and writes the file
+        (input) src_file -> Directory path and file name the child writes to
+            the pipe
+        (input) dst_file -> Directory path and file name of the file
+        (output) Number of seconds the copy took
+
+    """
+
+    start = time.perf_counter()
+
+    with subprocess.Popen(["cat", src_file],
+                          stdout=subprocess.PIPE) as proc:
+        func(proc.stdout, dst_file)
+
+    elapsed = time.perf_counter() - start
+    os.remove(dst_file)
+    print(f"{name:<24} {elapsed:8.3f} s", end="")
+
+    return elapsed
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Creates the synthetic archive and runs each pipe sink.
+
+    Variables:
+        dir_path -> Directory the tests are run in
+        size_mb -> Size of the synthetic archive in MB
+        threads -> Number of compression threads
+
+    Arguments:
+
+    """
+
+    dir_path = sys.argv[1] if len(sys.argv) > 1 \
+        else "./test/unit/mongo_db_dump/tmp"
+    size_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 \
+        else os.cpu_count() or 1
+    src_file = os.path.join(dir_path, "pipe_benchmark_src.archive")
+    dst_file = os.path.join(dir_path, "pipe_benchmark_dst.archive")
+    tests = [("read/write (buffered)", buffered_stream),
+             ("splice (-Z none)", mongo_db_dump.splice_stream)]
+
+    for codec in mongo_db_dump.DUMP_EXT:
+        if codec != "none" and (codec != "zstd" or mongo_db_dump.zstandard):
+            tests.append(
+                (f"{codec} (-Z {codec})",
+                 functools.partial(mongo_db_dump.compress_stream,
+                                   codec=codec, threads=threads)))
+
+    make_archive(src_file, size_mb)
+
+    try:
+        for name, func in tests:
+            elapsed = run_test(name, func, src_file, dst_file)
+            print(f" {size_mb / elapsed:10.1f} MB/s")
+
+    finally:
+        os.remove(src_file)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
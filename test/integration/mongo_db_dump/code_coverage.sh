@@ -8,6 +8,7 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=mongo_db_dump test/integration/mongo_db_dump/cold_cp.py
 coverage run -a --source=mongo_db_dump test/integration/mongo_db_dump/sync_cp_dump.py
 
 echo ""
@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  cold_cp.py
+
+    Description:  Integration testing of cold_cp in mongo_db_dump.py against
+        a two member replica set started locally with mongod.  The test is
+        skipped if mongod is not in the $PATH.
+
+    Usage:
+        test/integration/mongo_db_dump/cold_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import shutil
+import tempfile
+import subprocess
+import unittest
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+REPSET = "rsColdCp"
+PORTS = [27117, 27118]
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class holder for the mongo_class.Server attributes and
+        methods used by cold_cp, connected directly to one member.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self, port, db_path):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = f"127.0.0.1:{port}"
+        self.db_path = db_path
+        self.conn = pymongo.MongoClient(
+            "127.0.0.1", port, directConnection=True,
+            serverSelectionTimeoutMS=2000)
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Runs an administration command.
+
+        Arguments:
+
+        """
+
+        return self.conn.admin.command(cmd)
+
+
+def start_member(base_dir, port):
+
+    """Function:  start_member
+
+    Description:  Writes a mongod configuration file and starts a member.
+
+    Arguments:
+        (input) base_dir -> Directory path for the member files
+        (input) port -> Port number of the member
+        (output) conf_file -> Path to the mongod configuration file
+
+    """
+
+    db_path = os.path.join(base_dir, str(port))
+    conf_file = db_path + ".conf"
+    os.makedirs(db_path)
+
+    with open(conf_file, mode="w", encoding="UTF-8") as f_hdlr:
+        f_hdlr.write(
+            f"storage:\n  dbPath: {db_path}\n"
+            f"systemLog:\n  destination: file\n  path: {db_path}.log\n"
+            f"net:\n  port: {port}\n  bindIp: 127.0.0.1\n"
+            f"replication:\n  replSetName: {REPSET}\n")
+
+    subprocess.run(["mongod", "--config", conf_file, "--fork"], check=True,
+                   stdout=subprocess.DEVNULL)
+
+    return conf_file
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUpClass
+        tearDownClass
+        test_cold_copy
+
+    """
+
+    @classmethod
+    def setUpClass(cls):
+
+        """Function:  setUpClass
+
+        Description:  Starts and initiates a local replica set.
+
+        Arguments:
+
+        """
+
+        if not shutil.which("mongod"):
+            raise unittest.SkipTest("mongod not found in the $PATH")
+
+        cls.base_dir = tempfile.mkdtemp()
+        cls.conf_files = [start_member(cls.base_dir, port) for port in PORTS]
+        cls.primary = pymongo.MongoClient(
+            "127.0.0.1", PORTS[0], directConnection=True)
+        cls.primary.admin.command("replSetInitiate", {
+            "_id": REPSET, "members": [
+                {"_id": 0, "host": f"127.0.0.1:{PORTS[0]}", "priority": 2},
+                {"_id": 1, "host": f"127.0.0.1:{PORTS[1]}", "priority": 0}]})
+        cls.server = Server(PORTS[1], os.path.join(cls.base_dir,
+                                                   str(PORTS[1])))
+
+        for _ in range(60):
+            try:
+                if mongo_db_dump.get_lag(cls.server) is not None:
+                    break
+
+            except pymongo.errors.PyMongoError:
+                pass
+
+            time.sleep(1)
+
+        cls.primary.test.coll.insert_many([{"doc": num} for num in range(100)])
+
+    @classmethod
+    def tearDownClass(cls):
+
+        """Function:  tearDownClass
+
+        Description:  Shuts down the replica set and removes its files.
+
+        Arguments:
+
+        """
+
+        for port in PORTS:
+            try:
+                pymongo.MongoClient(
+                    "127.0.0.1", port, directConnection=True).admin.command(
+                        "shutdown", force=True)
+
+            except pymongo.errors.PyMongoError:
+                pass
+
+        shutil.rmtree(cls.base_dir)
+
+    def test_cold_copy(self):
+
+        """Function:  test_cold_copy
+
+        Description:  Test with the secondary shutdown, copied and restarted.
+
+        Arguments:
+
+        """
+
+        stats = {}
+        dmp_dir = os.path.join(self.base_dir, "cp_dump_cold")
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, dmp_dir, threads=2, stats=stats,
+                cp_filter={"exclude": mongo_db_dump.CP_EXCLUDE},
+                start_cmd=["mongod", "--config", self.conf_files[1],
+                           "--fork"], max_lag=10, shutdown_timeout=60,
+                catchup_timeout=120), (False, None))
+        self.assertTrue(os.path.isfile(os.path.join(dmp_dir, "WiredTiger")))
+        self.assertFalse(
+            os.path.exists(os.path.join(dmp_dir, "mongod.lock")))
+        self.assertLessEqual(stats["lag_seconds"], 10)
+        self.assertEqual(
+            self.primary.test.coll.count_documents({}), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,4 +6,5 @@
 
 echo ""
 echo "Unit testing..."
+/usr/bin/python test/integration/mongo_db_dump/cold_cp.py
 /usr/bin/python test/unit/mongo_db_dump/sync_cp_dump.py
@@ -28,7 +28,7 @@ import version                                  # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
-class ArgParser():                                      # pylint:disable=R0903
+class ArgParser():
 
     """Class:  ArgParser
 
@@ -36,6 +36,7 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        arg_exist
         get_val
 
     """
@@ -52,6 +53,18 @@ class ArgParser():                                      # pylint:disable=R0903
 
         self.args_array = {"-c": "mongo_cfg", "-d": "config"}
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def get_val(self, skey, def_val=None):
 
         """Method:  get_val
@@ -343,7 +356,7 @@ class UnitTest(unittest.TestCase):
     @unittest.skip("Not yet working")
     @mock.patch("mongo_db_dump.gen_class.Mail.send_mail",
                 mock.Mock(return_value=True))
-    @mock.patch("mongo_db_dump.shutil.copytree")
+    @mock.patch("mongo_db_dump.parallel_cp")
     def test_db_dump_locked_mail(self, mock_copy):
 
         """Function:  test_db_dump_locked_mail
@@ -354,13 +367,15 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_copy.return_value = True
+        mock_copy.return_value = (False, None)
 
         self.assertEqual((mongo_db_dump.sync_cp_dump(
             self.server, self.args, mail=self.mail)), (True, self.msg1))
         self.assertEqual(self.mail.msg, self.msg1a)
 
-    @mock.patch("mongo_db_dump.shutil.copytree")
+    @mock.patch("mongo_db_dump.gen_class.Mail.send_mail",
+                mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.parallel_cp")
     def test_db_dump_mail(self, mock_copy):
 
         """Function:  test_db_dump_mail
@@ -371,11 +386,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_copy.return_value = True
+        mock_copy.return_value = (False, None)
 
         self.assertEqual((mongo_db_dump.sync_cp_dump(
             self.server3, self.args, mail=self.mail)), (False, None))
-        self.assertEqual(self.mail.msg, "")
+        self.assertIn("lock_seconds", self.mail.msg)
 
 
 if __name__ == "__main__":
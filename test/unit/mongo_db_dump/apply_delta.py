@@ -0,0 +1,172 @@
+# Classification (U)
+
+"""Program:  apply_delta.py
+
+    Description:  Unit testing of apply_delta in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/apply_delta.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_delta_file
+        test_truncated
+        test_base_changed
+        test_base_too_short
+        test_apply_delta
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.base_file = os.path.join(self.dir_path, "base.wt")
+        self.src_file = os.path.join(self.dir_path, "src.wt")
+        self.delta_file = os.path.join(self.dir_path, "src.wt.cpdelta")
+        self.dst_file = os.path.join(self.dir_path, "dst.wt")
+        self.base = os.urandom(self.block_size * 16)
+        os.makedirs(self.dir_path)
+
+        with open(self.base_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.base)
+
+        self.src = self.base[:self.block_size * 8] + b"new data"
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.src)
+
+        mongo_db_dump.make_delta(
+            self.src_file, self.base_file, self.delta_file, self.block_size)
+
+    def test_not_delta_file(self):
+
+        """Function:  test_not_delta_file
+
+        Description:  Test with a file which is not a delta file.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mongo_db_dump.apply_delta(
+                self.base_file, self.base_file, self.dst_file)
+
+    def test_truncated(self):
+
+        """Function:  test_truncated
+
+        Description:  Test with a delta file missing its end record.
+
+        Arguments:
+
+        """
+
+        os.truncate(self.delta_file, os.path.getsize(self.delta_file) - 41)
+
+        with self.assertRaises(ValueError):
+            mongo_db_dump.apply_delta(
+                self.delta_file, self.base_file, self.dst_file)
+
+    def test_base_changed(self):
+
+        """Function:  test_base_changed
+
+        Description:  Test with a base file changed since the delta.
+
+        Arguments:
+
+        """
+
+        with open(self.base_file, mode="r+b") as f_hdlr:
+            f_hdlr.write(b"changed")
+
+        with self.assertRaises(ValueError):
+            mongo_db_dump.apply_delta(
+                self.delta_file, self.base_file, self.dst_file)
+
+    def test_base_too_short(self):
+
+        """Function:  test_base_too_short
+
+        Description:  Test with a base file shorter than the delta copies.
+
+        Arguments:
+
+        """
+
+        os.truncate(self.base_file, self.block_size)
+
+        with self.assertRaises(ValueError):
+            mongo_db_dump.apply_delta(
+                self.delta_file, self.base_file, self.dst_file)
+
+    def test_apply_delta(self):
+
+        """Function:  test_apply_delta
+
+        Description:  Test with the file rebuilt from the delta.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.apply_delta(
+                self.delta_file, self.base_file, self.dst_file),
+            len(self.src))
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.src)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+# Classification (U)
+
+"""Program:  archive_cp.py
+
+    Description:  Unit testing of archive_cp in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/archive_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import shutil
+import tarfile
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_src
+        test_zstd_archive
+        test_index
+        test_fan_out
+        test_gzip_archive
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp"
+        self.src_dir = os.path.join(self.base_dir, "src_dir")
+        self.arch_file = os.path.join(self.base_dir, "cp_dump.tar.gz")
+        self.arch_file2 = os.path.join(self.base_dir, "cp_dump.tar.zst")
+        self.files = {"collection-1.wt": os.urandom(50000),
+                      os.path.join("journal", "WiredTigerLog.1"): b"a" * 10}
+        os.makedirs(os.path.join(self.src_dir, "journal"))
+
+        for name, data in self.files.items():
+            with open(os.path.join(self.src_dir, name), mode="wb") as f_hdlr:
+                f_hdlr.write(data)
+
+    def test_missing_src(self):
+
+        """Function:  test_missing_src
+
+        Description:  Test with an archive write failing.
+
+        Arguments:
+
+        """
+
+        err_flag, err_msg = mongo_db_dump.archive_cp(
+            self.src_dir, os.path.join(self.base_dir, "no_dir", "arch"))
+
+        self.assertTrue(err_flag)
+        self.assertTrue(err_msg.startswith("Error:  Unable to archive"))
+
+    @unittest.skipIf(mongo_db_dump.zstandard is None,
+                     "zstandard module not installed")
+    def test_zstd_archive(self):
+
+        """Function:  test_zstd_archive
+
+        Description:  Test with a zstd compressed archive.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.archive_cp(
+                self.src_dir, self.arch_file2, codec="zstd", threads=2,
+                chunk_size=4096), (False, None))
+
+        with open(self.arch_file2, mode="rb") as f_hdlr:
+            data = mongo_db_dump.zstd_decompress(f_hdlr.read())
+
+        self.assertEqual(len(data) % tarfile.BLOCKSIZE, 0)
+
+    def test_index(self):
+
+        """Function:  test_index
+
+        Description:  Test with the index holding each member.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.archive_cp(
+            self.src_dir, self.arch_file, threads=2, chunk_size=4096)
+
+        with open(self.arch_file + ".idx", mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            index = json.load(f_hdlr)
+
+        self.assertEqual(index["codec"], "gzip")
+        self.assertEqual(
+            sorted((item["name"], item["type"]) for item in index["members"]),
+            sorted([("journal", "dir")]
+                   + [(name, "file") for name in self.files]))
+
+    def test_fan_out(self):
+
+        """Function:  test_fan_out
+
+        Description:  Test with the archive also written to a second file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.archive_cp(
+                self.src_dir, self.arch_file, threads=2, chunk_size=4096,
+                fan_out=[self.arch_file2]), (False, None))
+
+        for f_name in [self.arch_file, self.arch_file + ".idx"]:
+            with open(f_name, mode="rb") as f_hdlr, \
+                    open(f_name.replace(".tar.gz", ".tar.zst"),
+                         mode="rb") as f_hdlr2:
+                self.assertEqual(f_hdlr.read(), f_hdlr2.read())
+
+    def test_gzip_archive(self):
+
+        """Function:  test_gzip_archive
+
+        Description:  Test with a gzip compressed archive.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.archive_cp(
+                self.src_dir, self.arch_file, threads=4, chunk_size=4096),
+            (False, None))
+
+        with tarfile.open(self.arch_file, mode="r:gz") as tar:
+            for name, data in self.files.items():
+                self.assertEqual(tar.extractfile(name).read(), data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.src_dir, ignore_errors=True)
+
+        for f_name in [self.arch_file, self.arch_file2]:
+            for name in [f_name, f_name + ".idx"]:
+                if os.path.isfile(name):
+                    os.remove(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
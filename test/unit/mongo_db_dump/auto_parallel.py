@@ -0,0 +1,395 @@
+# Classification (U)
+
+"""Program:  auto_parallel.py
+
+    Description:  Unit testing of auto_parallel in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/auto_parallel.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-o": "/directory/path"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cores = 16
+        self.error = None
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+            (input) cmd -> Admin command
+
+        """
+
+        if self.error:
+            raise self.error
+
+        return {"system": {"numCores": self.cores}} if cmd == "hostInfo" \
+            else {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_local_cores
+        test_server_cores
+        test_host_info_failure
+        test_procs
+        test_spread
+        test_empty_collections
+        test_single_db
+        test_try_neighbour
+        test_best
+        test_other_runs
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.sizes = {f"coll{num}": 1048576 for num in range(10)}
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_local_cores(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_local_cores
+
+        Description:  Test with the value limited to the local CPUs.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 2
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = []
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 2)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_server_cores(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_server_cores
+
+        Description:  Test with the value limited to the server CPUs.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 32
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = []
+        self.server.cores = 4
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 4)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_host_info_failure(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_host_info_failure
+
+        Description:  Test with the server CPUs not returned.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 6
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = []
+        self.server.error = pymongo.errors.OperationFailure("not authorized")
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 6)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_procs(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_procs
+
+        Description:  Test with the CPUs shared by several mongodumps.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 16
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = []
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args, 4), 4)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_spread(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_spread
+
+        Description:  Test with the data mostly in one collection.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 16
+        mock_sizes.return_value = {"large": 1000, "small1": 100, "small2": 50}
+        mock_tuning.return_value = []
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 2)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_empty_collections(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_empty_collections
+
+        Description:  Test with the collections all empty.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 16
+        mock_sizes.return_value = {"coll1": 0, "coll2": 0, "coll3": 0}
+        mock_tuning.return_value = []
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 3)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_single_db(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_single_db
+
+        Description:  Test with -b option, the database's collections only.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 16
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = []
+        self.args.args_array["-b"] = "sales"
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 10)
+        mock_sizes.assert_called_once_with(self.server, "sales")
+        self.assertFalse(mongo_db_dump.get_db_list.called)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_try_neighbour(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_try_neighbour
+
+        Description:  Test with a neighbour of the best value not tried yet.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 8
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = [
+            {"num_parallel": 8, "procs": 1, "bytes": 1000, "seconds": 1}]
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 7)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_best(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_best
+
+        Description:  Test with the best value and its neighbours tried.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 8
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = [
+            {"num_parallel": 3, "procs": 1, "bytes": 1000, "seconds": 1},
+            {"num_parallel": 4, "procs": 1, "bytes": 3000, "seconds": 1},
+            {"num_parallel": 4, "procs": 1, "bytes": 1000, "seconds": 1},
+            {"num_parallel": 5, "procs": 1, "bytes": 1500, "seconds": 1}]
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 4)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db1"]))
+    @mock.patch("mongo_db_dump.get_tuning")
+    @mock.patch("mongo_db_dump.get_coll_sizes")
+    @mock.patch("mongo_db_dump.os.cpu_count")
+    def test_other_runs(self, mock_cpu, mock_sizes, mock_tuning):
+
+        """Function:  test_other_runs
+
+        Description:  Test with past runs of other -P values or over the limit
+            ignored.
+
+        Arguments:
+
+        """
+
+        mock_cpu.return_value = 8
+        mock_sizes.return_value = self.sizes
+        mock_tuning.return_value = [
+            {"num_parallel": 3, "procs": 2, "bytes": 1000, "seconds": 1},
+            {"num_parallel": 12, "procs": 1, "bytes": 1000, "seconds": 1},
+            {"num_parallel": 4, "procs": 1, "bytes": 1000, "seconds": 0}]
+
+        self.assertEqual(
+            mongo_db_dump.auto_parallel(self.server, self.args), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
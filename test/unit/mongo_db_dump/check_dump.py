@@ -0,0 +1,231 @@
+# Classification (U)
+
+"""Program:  check_dump.py
+
+    Description:  Unit testing of check_dump in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/check_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import json
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_manifest
+        test_incomplete
+        test_incomplete_archive
+        test_archive
+        test_bad_manifest
+        test_missing_file
+        test_size_mismatch
+        test_delta_dump
+        test_check_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_dir = "./test/unit/mongo_db_dump/tmp/cp_dump_20250101_0100"
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        os.makedirs(os.path.join(self.dmp_dir, "journal"))
+
+        for name in self.files:
+            with open(os.path.join(self.dmp_dir, name), mode="wb") as f_hdlr:
+                f_hdlr.write(b"x" * 4096)
+
+        self.manifest = {name: {"size": 4096, "mtime_ns": 1, "digest": "0"}
+                         for name in self.files}
+
+    def test_no_manifest(self):
+
+        """Function:  test_no_manifest
+
+        Description:  Test with a dump without a manifest.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_db_dump.check_dump(self.dmp_dir))
+
+    def test_incomplete(self):
+
+        """Function:  test_incomplete
+
+        Description:  Test with a dump marked incomplete.
+
+        Arguments:
+
+        """
+
+        open(os.path.join(self.dmp_dir, "cp_dump_incomplete"), mode="w",
+             encoding="UTF-8").close()
+
+        self.assertEqual(
+            mongo_db_dump.check_dump(self.dmp_dir),
+            f"Error:  Dump is marked incomplete: {self.dmp_dir}")
+
+    def test_incomplete_archive(self):
+
+        """Function:  test_incomplete_archive
+
+        Description:  Test with an archive marked incomplete.
+
+        Arguments:
+
+        """
+
+        open(self.dmp_dir + "/arch.tar.gz.incomplete", mode="w",
+             encoding="UTF-8").close()
+
+        self.assertIn("incomplete", mongo_db_dump.check_dump(
+            self.dmp_dir + "/arch", "gzip"))
+
+    def test_archive(self):
+
+        """Function:  test_archive
+
+        Description:  Test with an archive, there is no manifest to check.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mongo_db_dump.check_dump(self.dmp_dir + "/arch", "zstd"))
+
+    def test_bad_manifest(self):
+
+        """Function:  test_bad_manifest
+
+        Description:  Test with a manifest which cannot be read.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, "cp_dump_manifest.json"),
+                  mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("{")
+
+        self.assertIn("Unable to read manifest",
+                      mongo_db_dump.check_dump(self.dmp_dir))
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a manifest file missing from the dump.
+
+        Arguments:
+
+        """
+
+        os.remove(os.path.join(self.dmp_dir, self.files[1]))
+        mongo_db_dump.write_manifest(self.dmp_dir, self.manifest)
+
+        self.assertEqual(
+            mongo_db_dump.check_dump(self.dmp_dir),
+            f"Error:  Manifest check failed for 1 of 2 files in"
+            f" {self.dmp_dir}:  {self.files[1]}: No such file or directory")
+
+    def test_size_mismatch(self):
+
+        """Function:  test_size_mismatch
+
+        Description:  Test with a file size different from the manifest.
+
+        Arguments:
+
+        """
+
+        self.manifest[self.files[0]]["size"] = 8192
+        mongo_db_dump.write_manifest(self.dmp_dir, self.manifest)
+
+        self.assertIn(f"{self.files[0]}: size mismatch",
+                      mongo_db_dump.check_dump(self.dmp_dir))
+
+    def test_delta_dump(self):
+
+        """Function:  test_delta_dump
+
+        Description:  Test with a file stored as a delta file.
+
+        Arguments:
+
+        """
+
+        f_name = os.path.join(self.dmp_dir, self.files[0])
+        os.rename(f_name, f_name + ".cpdelta")
+        mongo_db_dump.write_manifest(self.dmp_dir, self.manifest)
+
+        with open(os.path.join(self.dmp_dir, "cp_dump_delta.json"), mode="w",
+                  encoding="UTF-8") as f_hdlr:
+            json.dump({"base": "cp_dump_20250102_0100", "block_size": 4096,
+                       "files": [self.files[0]]}, f_hdlr)
+
+        self.assertIsNone(mongo_db_dump.check_dump(self.dmp_dir))
+
+    def test_check_dump(self):
+
+        """Function:  test_check_dump
+
+        Description:  Test with a dump matching its manifest.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.write_manifest(self.dmp_dir, self.manifest)
+
+        self.assertIsNone(mongo_db_dump.check_dump(self.dmp_dir))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
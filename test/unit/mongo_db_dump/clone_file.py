@@ -0,0 +1,222 @@
+# Classification (U)
+
+"""Program:  clone_file.py
+
+    Description:  Unit testing of clone_file in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/clone_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import errno
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_other_error
+        test_not_supported
+        test_copy_file_range
+        test_sendfile
+        test_small_chunks
+        test_sparse
+        test_ficlone
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp"
+        self.src_file = os.path.join(self.dir_path, "collection-1.wt")
+        self.dst_file = os.path.join(self.dir_path, "collection-1.wt.cp")
+        self.data = os.urandom(4096)
+        self.not_sup = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        self.cross_dev = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    @mock.patch("mongo_db_dump.fcntl.ioctl")
+    def test_other_error(self, mock_ioctl):
+
+        """Function:  test_other_error
+
+        Description:  Test with an unexpected error being raised.
+
+        Arguments:
+
+        """
+
+        mock_ioctl.side_effect = OSError(errno.EIO, "I/O error")
+
+        with self.assertRaises(OSError):
+            mongo_db_dump.clone_file(self.src_file, self.dst_file)
+
+    @mock.patch("mongo_db_dump.os.copy_file_range")
+    @mock.patch("mongo_db_dump.fcntl.ioctl")
+    def test_not_supported(self, mock_ioctl, mock_range):
+
+        """Function:  test_not_supported
+
+        Description:  Test with neither clone or range copy supported.
+
+        Arguments:
+
+        """
+
+        mock_ioctl.side_effect = self.not_sup
+        mock_range.side_effect = self.cross_dev
+
+        self.assertIsNone(
+            mongo_db_dump.clone_file(self.src_file, self.dst_file))
+
+    @mock.patch("mongo_db_dump.fcntl.ioctl")
+    def test_copy_file_range(self, mock_ioctl):
+
+        """Function:  test_copy_file_range
+
+        Description:  Test with clone not supported and range copy used.
+
+        Arguments:
+
+        """
+
+        mock_ioctl.side_effect = self.not_sup
+
+        self.assertEqual(
+            mongo_db_dump.clone_file(self.src_file, self.dst_file),
+            "copy_file_range")
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_sendfile(self):
+
+        """Function:  test_sendfile
+
+        Description:  Test with only sendfile requested.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.clone_file(
+                self.src_file, self.dst_file, methods=("sendfile",)),
+            "sendfile")
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("mongo_db_dump.os.copy_file_range")
+    def test_small_chunks(self, mock_range):
+
+        """Function:  test_small_chunks
+
+        Description:  Test with the range copy done in several chunks.
+
+        Arguments:
+
+        """
+
+        mock_range.side_effect = lambda src, dst, cnt, off_src, off_dst: cnt
+
+        self.assertEqual(
+            mongo_db_dump.clone_file(
+                self.src_file, self.dst_file, methods=("copy_file_range",),
+                chunk_size=1000), "copy_file_range")
+        self.assertEqual(mock_range.call_count, 5)
+        self.assertEqual(mock_range.call_args.args[2], 96)
+
+    def test_sparse(self):
+
+        """Function:  test_sparse
+
+        Description:  Test with the holes kept by each in-kernel method.
+
+        Arguments:
+
+        """
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.seek(1048576)
+            f_hdlr.write(self.data)
+            f_hdlr.truncate(4194304)
+
+        with open(self.src_file, mode="rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        for method in ["copy_file_range", "sendfile"]:
+            self.assertEqual(
+                mongo_db_dump.clone_file(
+                    self.src_file, self.dst_file, methods=(method,)), method)
+
+            with open(self.dst_file, mode="rb") as f_hdlr:
+                self.assertEqual(f_hdlr.read(), data)
+
+            self.assertLess(
+                os.stat(self.dst_file).st_blocks * 512, len(data) // 2)
+
+    @mock.patch("mongo_db_dump.fcntl.ioctl", mock.Mock(return_value=0))
+    def test_ficlone(self):
+
+        """Function:  test_ficlone
+
+        Description:  Test with the file cloned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.clone_file(self.src_file, self.dst_file),
+            "ficlone")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        for f_name in [self.src_file, self.dst_file]:
+            if os.path.isfile(f_name):
+                os.remove(f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,374 @@
+# Classification (U)
+
+"""Program:  cold_cp.py
+
+    Description:  Unit testing of cold_cp in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/cold_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.db_path = "/db"
+        self.cmds = []
+        self.err = pymongo.errors.AutoReconnect("connection closed")
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if self.err:
+            raise self.err
+
+
+class Proc():                                           # pylint:disable=R0903
+
+    """Class:  Proc
+
+    Description:  Class stub holder for subprocess.CompletedProcess class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, returncode=0, stdout=""):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.returncode = returncode
+        self.stdout = stdout
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_status_failure
+        test_not_secondary
+        test_shutdown_failure
+        test_shutdown_timeout
+        test_restart_failure
+        test_copy_failure
+        test_copy_raises
+        test_start_cmd_missing
+        test_catch_up_timeout
+        test_cold_copy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.stats = {}
+        self.start_cmd = ["mongod", "--config", "/etc/mongod.conf", "--fork"]
+        self.kwargs = {"stats": self.stats, "start_cmd": self.start_cmd,
+                       "max_lag": 10, "shutdown_timeout": 60,
+                       "catchup_timeout": 600, "threads": 4}
+
+    @mock.patch("mongo_db_dump.get_lag")
+    def test_status_failure(self, mock_lag):
+
+        """Function:  test_status_failure
+
+        Description:  Test with the replica set status not available.
+
+        Arguments:
+
+        """
+
+        mock_lag.side_effect = pymongo.errors.OperationFailure(
+            "not running with --replSet")
+
+        err_flag, err_msg = mongo_db_dump.cold_cp(
+            self.server, "/dump/cp_dump_1", **self.kwargs)
+
+        self.assertTrue(err_flag)
+        self.assertIn("Unable to get replica set status", err_msg)
+        self.assertEqual(self.server.cmds, [])
+
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=None))
+    def test_not_secondary(self):
+
+        """Function:  test_not_secondary
+
+        Description:  Test with the server not being a secondary.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs),
+            (True, "Error:  -K option requires a secondary of a replica set"
+             " with a primary."))
+        self.assertEqual(self.server.cmds, [])
+
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_shutdown_failure(self):
+
+        """Function:  test_shutdown_failure
+
+        Description:  Test with the shutdown command refused.
+
+        Arguments:
+
+        """
+
+        self.server.err = pymongo.errors.OperationFailure("not authorized")
+
+        err_flag, err_msg = mongo_db_dump.cold_cp(
+            self.server, "/dump/cp_dump_1", **self.kwargs)
+
+        self.assertTrue(err_flag)
+        self.assertIn("Unable to shutdown the database", err_msg)
+
+    @mock.patch("mongo_db_dump.copy_db_files")
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=False))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_shutdown_timeout(self, mock_copy):
+
+        """Function:  test_shutdown_timeout
+
+        Description:  Test with the database not shutdown in time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs),
+            (True, "Error:  Database did not shutdown within 60 seconds,"
+             " copy not started."))
+        self.assertFalse(mock_copy.called)
+
+    @mock.patch("mongo_db_dump.wait_catch_up")
+    @mock.patch("mongo_db_dump.subprocess.run")
+    @mock.patch("mongo_db_dump.copy_db_files", mock.Mock(
+        return_value=(False, None)))
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_restart_failure(self, mock_run, mock_wait):
+
+        """Function:  test_restart_failure
+
+        Description:  Test with the database failing to restart.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = Proc(1, "ERROR: child process failed\n")
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs),
+            (True, "Error:  Unable to restart the database:  ERROR: child"
+             " process failed"))
+        self.assertFalse(mock_wait.called)
+
+    @mock.patch("mongo_db_dump.wait_catch_up", mock.Mock(return_value=2.0))
+    @mock.patch("mongo_db_dump.subprocess.run")
+    @mock.patch("mongo_db_dump.copy_db_files", mock.Mock(
+        return_value=(True, "Error:  Copy failed")))
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_copy_failure(self, mock_run):
+
+        """Function:  test_copy_failure
+
+        Description:  Test with the database restarted after a copy failure.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = Proc()
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs),
+            (True, "Error:  Copy failed"))
+        self.assertTrue(mock_run.called)
+
+    @mock.patch("mongo_db_dump.wait_catch_up")
+    @mock.patch("mongo_db_dump.subprocess.run")
+    @mock.patch("mongo_db_dump.copy_db_files", mock.Mock(
+        side_effect=ValueError("Bad zstd frame")))
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_copy_raises(self, mock_run, mock_wait):
+
+        """Function:  test_copy_raises
+
+        Description:  Test with the copy raising, the database is restarted
+            and caught up.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = Proc()
+        mock_wait.return_value = 1.0
+
+        with self.assertRaises(ValueError):
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs)
+
+        self.assertEqual(mock_run.call_args.args, (self.start_cmd,))
+        self.assertTrue(mock_wait.called)
+        self.assertEqual(self.stats["lag_seconds"], 1.0)
+
+    @mock.patch("mongo_db_dump.wait_catch_up")
+    @mock.patch("mongo_db_dump.subprocess.run", mock.Mock(
+        side_effect=FileNotFoundError("No such file: 'mongod'")))
+    @mock.patch("mongo_db_dump.copy_db_files", mock.Mock(
+        return_value=(False, None)))
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_start_cmd_missing(self, mock_wait):
+
+        """Function:  test_start_cmd_missing
+
+        Description:  Test with the restart command not found.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs),
+            (True, "Error:  Unable to restart the database:  No such file:"
+             " 'mongod'"))
+        self.assertFalse(mock_wait.called)
+
+    @mock.patch("mongo_db_dump.wait_catch_up", mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.subprocess.run", mock.Mock(
+        return_value=Proc()))
+    @mock.patch("mongo_db_dump.copy_db_files", mock.Mock(
+        return_value=(False, None)))
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_catch_up_timeout(self):
+
+        """Function:  test_catch_up_timeout
+
+        Description:  Test with the lag still over max_lag after restart.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs),
+            (True, "Warning:  Secondary lag still over 10 seconds after"
+             " restart."))
+        self.assertNotIn("lag_seconds", self.stats)
+
+    @mock.patch("mongo_db_dump.wait_catch_up")
+    @mock.patch("mongo_db_dump.subprocess.run")
+    @mock.patch("mongo_db_dump.copy_db_files")
+    @mock.patch("mongo_db_dump.wait_shutdown", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=0))
+    def test_cold_copy(self, mock_copy, mock_run, mock_wait):
+
+        """Function:  test_cold_copy
+
+        Description:  Test with shutdown, copy, restart and catch up.
+
+        Arguments:
+
+        """
+
+        mock_copy.return_value = (False, None)
+        mock_run.return_value = Proc()
+        mock_wait.return_value = 3.0
+
+        self.assertEqual(
+            mongo_db_dump.cold_cp(
+                self.server, "/dump/cp_dump_1", **self.kwargs), (False, None))
+        self.assertEqual(self.server.cmds, ["shutdown"])
+        self.assertEqual(mock_copy.call_args.args, ("/db", "/dump/cp_dump_1"))
+        self.assertEqual(mock_copy.call_args.kwargs["threads"], 4)
+        self.assertEqual(mock_run.call_args.args, (self.start_cmd,))
+        mock_wait.assert_called_once_with(self.server, 10, 600)
+        self.assertEqual(self.stats["lag_seconds"], 3.0)
+
+        for key in ["shutdown", "copy_start", "copy_end", "restarted",
+                    "caught_up"]:
+            self.assertIn(key, self.stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  compress_stream.py
+
+    Description:  Unit testing of compress_stream in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/compress_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import gzip
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gzip
+        test_zstd
+        test_empty_stream
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/compress"
+        self.arch_file = os.path.join(self.dir_path, "dump.archive.gz")
+        self.data = os.urandom(1000) * 100
+        os.makedirs(self.dir_path)
+
+    def test_gzip(self):
+
+        """Function:  test_gzip
+
+        Description:  Test with the stream compressed in gzip members.
+
+        Arguments:
+
+        """
+
+        stats = {}
+        mongo_db_dump.compress_stream(
+            io.BytesIO(self.data), self.arch_file, codec="gzip", threads=4,
+            chunk_size=4096, stats=stats)
+
+        with open(self.arch_file, mode="rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertEqual(gzip.decompress(data), self.data)
+        self.assertEqual(stats, {"bytes": len(self.data),
+                                 "bytes_written": len(data)})
+
+    @unittest.skipIf(mongo_db_dump.zstandard is None,
+                     "zstandard module not installed")
+    def test_zstd(self):
+
+        """Function:  test_zstd
+
+        Description:  Test with the stream compressed in zstd frames.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.compress_stream(
+            io.BytesIO(self.data), self.arch_file, codec="zstd", level=1,
+            threads=2, chunk_size=8192)
+
+        with open(self.arch_file, mode="rb") as f_hdlr:
+            self.assertEqual(mongo_db_dump.zstd_decompress(f_hdlr.read()),
+                             self.data)
+
+    def test_empty_stream(self):
+
+        """Function:  test_empty_stream
+
+        Description:  Test with an empty stream.
+
+        Arguments:
+
+        """
+
+        stats = {}
+        mongo_db_dump.compress_stream(
+            io.BytesIO(b""), self.arch_file, codec="gzip", stats=stats)
+
+        self.assertEqual(stats, {"bytes": 0, "bytes_written": 0})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
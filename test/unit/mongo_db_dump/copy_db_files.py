@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  copy_db_files.py
+
+    Description:  Unit testing of copy_db_files in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/copy_db_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_archive
+        test_snapshot
+        test_full_copy
+
+    """
+
+    @mock.patch("mongo_db_dump.archive_cp")
+    def test_archive(self, mock_arch):
+
+        """Function:  test_archive
+
+        Description:  Test with a copy into a compressed archive.
+
+        Arguments:
+
+        """
+
+        mock_arch.return_value = (False, None)
+
+        self.assertEqual(
+            mongo_db_dump.copy_db_files(
+                "/db", "/dump/cp_dump_1", codec="gzip",
+                fan_out_dirs=["/dump2/cp_dump_1"]), (False, None))
+        self.assertEqual(mock_arch.call_args.args,
+                         ("/db", "/dump/cp_dump_1.tar.gz"))
+        self.assertEqual(mock_arch.call_args.kwargs["fan_out"],
+                         ["/dump2/cp_dump_1.tar.gz"])
+
+    @mock.patch("mongo_db_dump.delta_cp")
+    def test_snapshot(self, mock_delta):
+
+        """Function:  test_snapshot
+
+        Description:  Test with only the changes since a pre-copy copied.
+
+        Arguments:
+
+        """
+
+        mock_delta.return_value = (False, None)
+        snapshot = {"file1": (1, 1)}
+
+        self.assertEqual(
+            mongo_db_dump.copy_db_files(
+                "/db", "/dump/cp_dump_1", snapshot=snapshot), (False, None))
+        self.assertEqual(mock_delta.call_args.args,
+                         ("/db", "/dump/cp_dump_1", snapshot))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_full_copy(self, mock_copy):
+
+        """Function:  test_full_copy
+
+        Description:  Test with a full copy of the database files.
+
+        Arguments:
+
+        """
+
+        mock_copy.return_value = (True, "Error:  Copy failed")
+        cancel = mock.Mock()
+
+        self.assertEqual(
+            mongo_db_dump.copy_db_files(
+                "/db", "/dump/cp_dump_1", threads=4, cancel=cancel,
+                prev_dir="/dump/cp_dump_0"), (True, "Error:  Copy failed"))
+        self.assertEqual(mock_copy.call_args.kwargs["threads"], 4)
+        self.assertEqual(mock_copy.call_args.kwargs["cancel"], cancel)
+        self.assertEqual(mock_copy.call_args.kwargs["prev_dir"],
+                         "/dump/cp_dump_0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,312 @@
+# Classification (U)
+
+"""Program:  cp_file.py
+
+    Description:  Unit testing of cp_file in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/cp_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_changed
+        test_unchanged_link
+        test_copy_fallback
+        test_read_method
+        test_fan_out_linked
+        test_fan_out
+        test_page_cache
+        test_page_cache_cloned
+        test_cloned
+        test_sparse
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp"
+        self.src_file = os.path.join(self.dir_path, "collection-1.wt")
+        self.dst_file = os.path.join(self.dir_path, "collection-1.wt.cp")
+        self.prev_file = os.path.join(self.dir_path, "collection-1.wt.prev")
+        self.dst_file2 = os.path.join(self.dir_path, "collection-1.wt.cp2")
+        self.data = os.urandom(2048)
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        os.utime(self.src_file, (1600000000, 1600000000))
+
+    @mock.patch("mongo_db_dump.is_unchanged", mock.Mock(return_value=False))
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with file changed since previous dump.
+
+        Arguments:
+
+        """
+
+        with open(self.prev_file, mode="wb") as f_hdlr:
+            f_hdlr.write(b"old")
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(
+                self.src_file, self.dst_file, prev_file=self.prev_file),
+            len(self.data))
+        self.assertNotEqual(
+            os.stat(self.dst_file).st_ino, os.stat(self.prev_file).st_ino)
+
+    @mock.patch("mongo_db_dump.is_unchanged", mock.Mock(return_value=True))
+    def test_unchanged_link(self):
+
+        """Function:  test_unchanged_link
+
+        Description:  Test with unchanged file hardlinked to previous dump.
+
+        Arguments:
+
+        """
+
+        with open(self.prev_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(
+                self.src_file, self.dst_file, prev_file=self.prev_file), 0)
+        self.assertEqual(
+            os.stat(self.dst_file).st_ino, os.stat(self.prev_file).st_ino)
+
+    @mock.patch("mongo_db_dump.clone_file", mock.Mock(return_value=None))
+    def test_copy_fallback(self):
+
+        """Function:  test_copy_fallback
+
+        Description:  Test with the file copied when it cannot be cloned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(self.src_file, self.dst_file),
+            len(self.data))
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("mongo_db_dump.clone_file")
+    def test_read_method(self, mock_clone):
+
+        """Function:  test_read_method
+
+        Description:  Test with the read method copying through user space.
+
+        Arguments:
+
+        """
+
+        mock_clone.return_value = None
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(
+                self.src_file, self.dst_file, method="read", chunk_size=512),
+            len(self.data))
+        self.assertEqual(mock_clone.call_args.kwargs["methods"], ())
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("mongo_db_dump.is_unchanged", mock.Mock(return_value=True))
+    def test_fan_out_linked(self):
+
+        """Function:  test_fan_out_linked
+
+        Description:  Test with the unchanged file linked in the first dump
+            and copied to the fan-out dump.
+
+        Arguments:
+
+        """
+
+        with open(self.prev_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(
+                self.src_file, self.dst_file, prev_file=self.prev_file,
+                fan_out=[self.dst_file2]), 0)
+        self.assertEqual(
+            os.stat(self.dst_file).st_ino, os.stat(self.prev_file).st_ino)
+        self.assertEqual(os.stat(self.dst_file2).st_mtime, 1600000000)
+
+        with open(self.dst_file2, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("mongo_db_dump.clone_file")
+    def test_fan_out(self, mock_clone):
+
+        """Function:  test_fan_out
+
+        Description:  Test with the file written to two destinations.
+
+        Arguments:
+
+        """
+
+        mock_clone.return_value = None
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(
+                self.src_file, self.dst_file, fan_out=[self.dst_file2]),
+            len(self.data))
+        self.assertEqual(mock_clone.call_args.kwargs["methods"], ())
+
+        for f_name in [self.dst_file, self.dst_file2]:
+            with open(f_name, mode="rb") as f_hdlr:
+                self.assertEqual(f_hdlr.read(), self.data)
+
+    @mock.patch("mongo_db_dump.clone_file")
+    def test_page_cache(self, mock_clone):
+
+        """Function:  test_page_cache
+
+        Description:  Test with the pages read and written dropped.
+
+        Arguments:
+
+        """
+
+        page_cache = mock.Mock()
+        page_cache.resident.return_value = [(0, 4096)]
+        mock_clone.return_value = None
+
+        mongo_db_dump.cp_file(self.src_file, self.dst_file,
+                              page_cache=page_cache)
+
+        page_cache.release.assert_called_once_with(self.src_file, [(0, 4096)])
+        page_cache.written.assert_called_once_with(self.dst_file)
+
+    @mock.patch("mongo_db_dump.clone_file")
+    def test_page_cache_cloned(self, mock_clone):
+
+        """Function:  test_page_cache_cloned
+
+        Description:  Test with a cloned file, no pages are dropped.
+
+        Arguments:
+
+        """
+
+        def clone(src_file, dst_file, **kwargs):
+            shutil.copyfile(src_file, dst_file)
+            return "ficlone"
+
+        page_cache = mock.Mock()
+        mock_clone.side_effect = clone
+
+        mongo_db_dump.cp_file(self.src_file, self.dst_file,
+                              page_cache=page_cache)
+
+        self.assertFalse(page_cache.release.called)
+        self.assertFalse(page_cache.written.called)
+
+    @mock.patch("mongo_db_dump.clone_file")
+    def test_cloned(self, mock_clone):
+
+        """Function:  test_cloned
+
+        Description:  Test with the file cloned, no bytes written, and
+            metadata copied.
+
+        Arguments:
+
+        """
+
+        def clone(src_file, dst_file, **kwargs):
+            shutil.copyfile(src_file, dst_file)
+            return "ficlone"
+
+        mock_clone.side_effect = clone
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(self.src_file, self.dst_file), 0)
+        self.assertEqual(os.path.getmtime(self.dst_file), 1600000000)
+
+    def test_sparse(self):
+
+        """Function:  test_sparse
+
+        Description:  Test with a sparse file, only the data is counted as
+            written.
+
+        Arguments:
+
+        """
+
+        with open(self.src_file, mode="r+b") as f_hdlr:
+            f_hdlr.truncate(1048576 * 4)
+
+        with open(self.src_file, mode="rb") as f_hdlr:
+            data_size = sum(end - start for start, end in
+                            mongo_db_dump.get_extents(
+                                f_hdlr.fileno(), 1048576 * 4))
+
+        self.assertEqual(
+            mongo_db_dump.cp_file(self.src_file, self.dst_file,
+                                  method="read"), data_size)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        for f_name in [self.src_file, self.dst_file, self.prev_file,
+                       self.dst_file2]:
+            if os.path.isfile(f_name):
+                os.remove(f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+# Classification (U)
+
+"""Program:  cp_manifest_file.py
+
+    Description:  Unit testing of cp_manifest_file in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/cp_manifest_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import hashlib
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_linked_no_prev_entry
+        test_linked_prev_entry
+        test_empty_file
+        test_copied
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp"
+        self.src_file = os.path.join(self.dir_path, "collection-1.wt")
+        self.dst_file = os.path.join(self.dir_path, "collection-1.wt.cp")
+        self.prev_file = os.path.join(self.dir_path, "collection-1.wt.prev")
+        self.data = os.urandom(2048)
+        self.digest = hashlib.sha256(self.data).hexdigest()
+
+        for f_name in [self.src_file, self.prev_file]:
+            with open(f_name, mode="wb") as f_hdlr:
+                f_hdlr.write(self.data)
+
+            os.utime(f_name, ns=(1600000000000000000, 1600000000000000000))
+
+    @mock.patch("mongo_db_dump.is_unchanged", mock.Mock(return_value=True))
+    def test_linked_no_prev_entry(self):
+
+        """Function:  test_linked_no_prev_entry
+
+        Description:  Test with a linked file and no previous manifest entry.
+
+        Arguments:
+
+        """
+
+        written, entry = mongo_db_dump.cp_manifest_file(
+            self.src_file, self.dst_file, prev_file=self.prev_file)
+
+        self.assertEqual(written, 0)
+        self.assertEqual(entry["digest"], self.digest)
+
+    @mock.patch("mongo_db_dump.file_digest")
+    @mock.patch("mongo_db_dump.is_unchanged", mock.Mock(return_value=True))
+    def test_linked_prev_entry(self, mock_digest):
+
+        """Function:  test_linked_prev_entry
+
+        Description:  Test with a linked file using the previous manifest.
+
+        Arguments:
+
+        """
+
+        prev_entry = {"size": len(self.data),
+                      "mtime_ns": 1600000000000000000, "digest": "abc"}
+
+        written, entry = mongo_db_dump.cp_manifest_file(
+            self.src_file, self.dst_file, prev_file=self.prev_file,
+            prev_entry=prev_entry)
+
+        self.assertEqual(written, 0)
+        self.assertEqual(entry, prev_entry)
+        self.assertFalse(mock_digest.called)
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        with open(self.src_file, mode="wb"):
+            pass
+
+        self.assertEqual(
+            mongo_db_dump.cp_manifest_file(
+                self.src_file, self.dst_file)[1]["digest"],
+            hashlib.sha256(b"").hexdigest())
+
+    @mock.patch("mongo_db_dump.clone_file")
+    def test_copied(self, mock_clone):
+
+        """Function:  test_copied
+
+        Description:  Test with the file hashed as it is copied.
+
+        Arguments:
+
+        """
+
+        mock_clone.return_value = None
+
+        written, entry = mongo_db_dump.cp_manifest_file(
+            self.src_file, self.dst_file)
+
+        self.assertEqual(written, len(self.data))
+        self.assertEqual(entry["digest"], self.digest)
+        self.assertEqual(entry["size"], len(self.data))
+        self.assertEqual(mock_clone.call_args.kwargs["methods"], ())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        for f_name in [self.src_file, self.dst_file, self.prev_file]:
+            if os.path.isfile(f_name):
+                os.remove(f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  cp_summary.py
+
+    Description:  Unit testing of cp_summary in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/cp_summary.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_lock
+        test_timestamps
+        test_copy_rate
+        test_lock_window
+        test_cold_copy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stats = {"lock_acquired": 1600000000.0,
+                      "copy_start": 1600000000.5,
+                      "copy_end": 1600000004.5,
+                      "unlocked": 1600000005.0,
+                      "files": 3, "bytes": 41943040}
+
+    def test_no_lock(self):
+
+        """Function:  test_no_lock
+
+        Description:  Test with the database never locked.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_db_dump.cp_summary({}), {})
+
+    def test_timestamps(self):
+
+        """Function:  test_timestamps
+
+        Description:  Test with timestamps converted to ISO 8601.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.cp_summary(self.stats)
+
+        self.assertTrue(summary["unlocked"].startswith("2020-09-1"))
+        self.assertEqual(summary["files"], 3)
+
+    def test_copy_rate(self):
+
+        """Function:  test_copy_rate
+
+        Description:  Test with copy time and rate.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.cp_summary(self.stats)
+
+        self.assertEqual(summary["copy_seconds"], 4.0)
+        self.assertEqual(summary["mb_per_sec"], 10.0)
+
+    def test_lock_window(self):
+
+        """Function:  test_lock_window
+
+        Description:  Test with the lock window.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.cp_summary(self.stats)["lock_seconds"], 5.0)
+
+    def test_cold_copy(self):
+
+        """Function:  test_cold_copy
+
+        Description:  Test with the offline and catch up time of a cold copy.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.cp_summary(
+            {"shutdown": 1600000000.0, "copy_start": 1600000001.0,
+             "copy_end": 1600000005.0, "restarted": 1600000006.0,
+             "caught_up": 1600000016.0, "bytes": 41943040})
+
+        self.assertEqual(summary["offline_seconds"], 6.0)
+        self.assertEqual(summary["catch_up_seconds"], 10.0)
+        self.assertNotIn("lock_seconds", summary)
+        self.assertTrue(summary["caught_up"].startswith("2020-09-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
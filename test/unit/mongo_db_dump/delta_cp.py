@@ -0,0 +1,235 @@
+# Classification (U)
+
+"""Program:  delta_cp.py
+
+    Description:  Unit testing of delta_cp in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/delta_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write_file
+        read_dst
+        test_racy_file
+        test_removed_file
+        test_manifest
+        test_added_file
+        test_changed_file
+        test_unchanged
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp"
+        self.src_dir = os.path.join(self.base_dir, "src_dir")
+        self.dst_dir = os.path.join(self.base_dir, "dst_dir")
+        os.makedirs(os.path.join(self.src_dir, "journal"))
+        self.write_file("collection-1.wt", b"a" * 100)
+        self.write_file(os.path.join("journal", "WiredTigerLog.1"), b"b" * 10)
+        self.snapshot = (
+            time.time_ns(), mongo_db_dump.get_cp_files(self.src_dir))
+        shutil.copytree(self.src_dir, self.dst_dir)
+
+    def write_file(self, name, data, mtime=1600000000):
+
+        """Function:  write_file
+
+        Description:  Writes a source file with an old modification time.
+
+        Arguments:
+
+        """
+
+        f_name = os.path.join(self.src_dir, name)
+
+        with open(f_name, mode="wb") as f_hdlr:
+            f_hdlr.write(data)
+
+        os.utime(f_name, (mtime, mtime))
+
+    def read_dst(self, name):
+
+        """Function:  read_dst
+
+        Description:  Returns the contents of a destination file.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dst_dir, name), mode="rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_racy_file(self):
+
+        """Function:  test_racy_file
+
+        Description:  Test with a file modified as the pre-copy started.
+
+        Arguments:
+
+        """
+
+        self.write_file("collection-1.wt", b"c" * 100)
+        mtime = self.snapshot[0] / 1000000000
+        os.utime(os.path.join(self.src_dir, "collection-1.wt"),
+                 (mtime, mtime))
+        self.snapshot = (
+            self.snapshot[0], mongo_db_dump.get_cp_files(self.src_dir))
+
+        self.assertEqual(
+            mongo_db_dump.delta_cp(self.src_dir, self.dst_dir, self.snapshot),
+            (False, None))
+        self.assertEqual(self.read_dst("collection-1.wt"), b"c" * 100)
+
+    def test_removed_file(self):
+
+        """Function:  test_removed_file
+
+        Description:  Test with a file removed since the pre-copy.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(os.path.join(self.src_dir, "journal"))
+
+        self.assertEqual(
+            mongo_db_dump.delta_cp(self.src_dir, self.dst_dir, self.snapshot),
+            (False, None))
+        self.assertFalse(
+            os.path.exists(os.path.join(self.dst_dir, "journal")))
+
+    def test_manifest(self):
+
+        """Function:  test_manifest
+
+        Description:  Test with the pre-copy manifest brought up to date.
+
+        Arguments:
+
+        """
+
+        journal = os.path.join("journal", "WiredTigerLog.1")
+        manifest = {"collection-1.wt": {"digest": "old"},
+                    journal: {"digest": "old"}}
+        os.remove(os.path.join(self.src_dir, journal))
+        self.write_file("collection-1.wt", b"c" * 100, mtime=1700000000)
+
+        self.assertEqual(
+            mongo_db_dump.delta_cp(
+                self.src_dir, self.dst_dir, self.snapshot, manifest=manifest),
+            (False, None))
+        self.assertEqual(list(manifest), ["collection-1.wt"])
+        self.assertEqual(
+            manifest["collection-1.wt"]["digest"],
+            mongo_db_dump.file_digest(
+                os.path.join(self.src_dir, "collection-1.wt")))
+
+    def test_added_file(self):
+
+        """Function:  test_added_file
+
+        Description:  Test with a file added since the pre-copy.
+
+        Arguments:
+
+        """
+
+        self.write_file("index-2.wt", b"d" * 5)
+
+        self.assertEqual(
+            mongo_db_dump.delta_cp(self.src_dir, self.dst_dir, self.snapshot),
+            (False, None))
+        self.assertEqual(self.read_dst("index-2.wt"), b"d" * 5)
+
+    def test_changed_file(self):
+
+        """Function:  test_changed_file
+
+        Description:  Test with a file changed since the pre-copy.
+
+        Arguments:
+
+        """
+
+        self.write_file("collection-1.wt", b"e" * 120, mtime=1600000100)
+
+        self.assertEqual(
+            mongo_db_dump.delta_cp(
+                self.src_dir, self.dst_dir, self.snapshot, threads=2),
+            (False, None))
+        self.assertEqual(self.read_dst("collection-1.wt"), b"e" * 120)
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with no changes since the pre-copy.
+
+        Arguments:
+
+        """
+
+        dst_file = os.path.join(self.dst_dir, "collection-1.wt")
+        inode = os.stat(dst_file).st_ino
+
+        self.assertEqual(
+            mongo_db_dump.delta_cp(self.src_dir, self.dst_dir, self.snapshot),
+            (False, None))
+        self.assertEqual(os.stat(dst_file).st_ino, inode)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.src_dir, ignore_errors=True)
+        shutil.rmtree(self.dst_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+# Classification (U)
+
+"""Program:  delta_store.py
+
+    Description:  Unit testing of delta_store in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/delta_store.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_delta_store
+        test_metadata
+        test_hardlinked
+        test_not_in_base
+        test_max_size
+        test_delta_failure
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.dumps = [os.path.join(self.base_dir, "cp_dump_2025010" + str(num)
+                                   + "_0100") for num in range(1, 4)]
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        self.data = {}
+        data = {name: os.urandom(self.block_size * 16)
+                for name in self.files}
+
+        for num, dmp_dir in enumerate(self.dumps):
+            os.makedirs(os.path.join(dmp_dir, "journal"))
+
+            for name in self.files:
+                data[name] = data[name][:self.block_size * num] \
+                    + os.urandom(self.block_size) \
+                    + data[name][self.block_size * (num + 1):]
+                self.data[(dmp_dir, name)] = data[name]
+
+                with open(os.path.join(dmp_dir, name), mode="wb") as f_hdlr:
+                    f_hdlr.write(data[name])
+
+    def test_delta_store(self):
+
+        """Function:  test_delta_store
+
+        Description:  Test with the files replaced by delta files.
+
+        Arguments:
+
+        """
+
+        stats = {}
+
+        self.assertEqual(
+            mongo_db_dump.delta_store(
+                self.dumps[0], self.dumps[1], block_size=self.block_size,
+                threads=2, stats=stats), (False, None))
+        self.assertEqual(
+            sorted(os.listdir(self.dumps[0])),
+            ["collection-1.wt.cpdelta", "cp_dump_delta.json", "journal"])
+        self.assertEqual(stats["files"], 2)
+        self.assertEqual(stats["bytes"], self.block_size * 32)
+        self.assertLess(stats["bytes_delta"], self.block_size * 3)
+
+    def test_metadata(self):
+
+        """Function:  test_metadata
+
+        Description:  Test with the file metadata kept on the delta file.
+
+        Arguments:
+
+        """
+
+        f_name = os.path.join(self.dumps[0], self.files[0])
+        os.utime(f_name, ns=(1600000000000000000, 1600000000000000000))
+        mongo_db_dump.delta_store(self.dumps[0], self.dumps[1],
+                                  block_size=self.block_size)
+
+        self.assertEqual(
+            os.stat(f_name + ".cpdelta").st_mtime_ns, 1600000000000000000)
+
+    def test_hardlinked(self):
+
+        """Function:  test_hardlinked
+
+        Description:  Test with a file hardlinked to the newer dump kept.
+
+        Arguments:
+
+        """
+
+        f_name = os.path.join(self.dumps[0], self.files[0])
+        os.remove(f_name)
+        os.link(os.path.join(self.dumps[1], self.files[0]), f_name)
+        mongo_db_dump.delta_store(self.dumps[0], self.dumps[1],
+                                  block_size=self.block_size)
+
+        self.assertTrue(os.path.isfile(f_name))
+        self.assertEqual(mongo_db_dump.load_delta(self.dumps[0])["files"],
+                         [self.files[1]])
+
+    def test_not_in_base(self):
+
+        """Function:  test_not_in_base
+
+        Description:  Test with a file removed in the newer dump kept.
+
+        Arguments:
+
+        """
+
+        os.remove(os.path.join(self.dumps[1], self.files[0]))
+        mongo_db_dump.delta_store(self.dumps[0], self.dumps[1],
+                                  block_size=self.block_size)
+
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.dumps[0], self.files[0])))
+
+    def test_max_size(self):
+
+        """Function:  test_max_size
+
+        Description:  Test with the files over max_size kept.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.delta_store(
+                self.dumps[0], self.dumps[1], block_size=self.block_size,
+                max_size=self.block_size * 8), (False, None))
+        self.assertEqual(
+            sorted(os.listdir(self.dumps[0])),
+            ["collection-1.wt", "cp_dump_delta.json", "journal"])
+
+    @mock.patch("mongo_db_dump.make_delta")
+    def test_delta_failure(self, mock_delta):
+
+        """Function:  test_delta_failure
+
+        Description:  Test with a delta failure, the dump is left as it was.
+
+        Arguments:
+
+        """
+
+        mock_delta.side_effect = [100, OSError("Disk full")]
+
+        err_flag, err_msg = mongo_db_dump.delta_store(
+            self.dumps[0], self.dumps[1], block_size=self.block_size)
+
+        self.assertTrue(err_flag)
+        self.assertIn("Disk full", err_msg)
+        self.assertIsNone(mongo_db_dump.load_delta(self.dumps[0]))
+
+        for name in self.files:
+            self.assertTrue(
+                os.path.isfile(os.path.join(self.dumps[0], name)))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.base_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  delta_writer.py
+
+    Description:  Unit testing of DeltaWriter in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/delta_writer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_header
+        test_merge_copies
+        test_data
+        test_end
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.f_hdlr = io.BytesIO()
+        self.writer = mongo_db_dump.DeltaWriter(self.f_hdlr)
+        self.magic = mongo_db_dump.DELTA_MAGIC
+
+    def test_header(self):
+
+        """Function:  test_header
+
+        Description:  Test with the file header written.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.f_hdlr.getvalue(), self.magic)
+
+    def test_merge_copies(self):
+
+        """Function:  test_merge_copies
+
+        Description:  Test with adjacent copies merged into one record.
+
+        Arguments:
+
+        """
+
+        self.writer.copy(0, 4096)
+        self.writer.copy(4096, 4096)
+        self.writer.copy(16384, 4096)
+        self.writer.flush()
+
+        self.assertEqual(
+            self.f_hdlr.getvalue(),
+            self.magic + mongo_db_dump.DELTA_COPY.pack(b"C", 0, 8192)
+            + mongo_db_dump.DELTA_COPY.pack(b"C", 16384, 4096))
+
+    def test_data(self):
+
+        """Function:  test_data
+
+        Description:  Test with data written after the pending copy.
+
+        Arguments:
+
+        """
+
+        self.writer.copy(0, 4096)
+        self.writer.data(b"abc")
+        self.writer.data(b"")
+
+        self.assertEqual(
+            self.f_hdlr.getvalue(),
+            self.magic + mongo_db_dump.DELTA_COPY.pack(b"C", 0, 4096)
+            + mongo_db_dump.DELTA_DATA.pack(b"D", 3) + b"abc")
+
+    def test_end(self):
+
+        """Function:  test_end
+
+        Description:  Test with the end record.
+
+        Arguments:
+
+        """
+
+        self.writer.copy(0, 4096)
+        self.writer.end(4096, b"d" * 32)
+
+        self.assertTrue(self.f_hdlr.getvalue().endswith(
+            mongo_db_dump.DELTA_COPY.pack(b"C", 0, 4096)
+            + mongo_db_dump.DELTA_END.pack(b"E", 4096, b"d" * 32)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+# Classification (U)
+
+"""Program:  dump_progress.py
+
+    Description:  Unit testing of DumpProgress in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/dump_progress.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _read_json
+        test_other_line
+        test_progress
+        test_done
+        test_prom_file
+        test_prom_interval
+        test_no_prom_dir
+        test_json_failure
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/progress"
+        self.json_file = os.path.join(self.dir_path, "dump.progress.jsonl")
+        self.prom_file = os.path.join(self.dir_path, "mongo_db_dump.prom")
+        self.line1 = "2025-01-01T10:00:00.000+0000\t[##..............]" \
+            "  sales.orders  100/1000  (10.0%)\n"
+        self.line2 = "2025-01-01T10:00:10.000+0000\t[#####...........]" \
+            "  sales.orders  300/1000  (30.0%)\n"
+        self.done = "2025-01-01T10:00:20.000+0000\tdone dumping sales.orders" \
+            " (1000 documents)\n"
+        os.makedirs(self.dir_path)
+
+    def _read_json(self):
+
+        """Function:  _read_json
+
+        Description:  Returns the JSON lines written.
+
+        Arguments:
+
+        """
+
+        with open(self.json_file, mode="r", encoding="UTF-8") as f_hdlr:
+            return [json.loads(line) for line in f_hdlr]
+
+    def test_other_line(self):
+
+        """Function:  test_other_line
+
+        Description:  Test with a log line not a progress line.
+
+        Arguments:
+
+        """
+
+        progress = mongo_db_dump.DumpProgress(self.json_file)
+        progress.add("2025-01-01T10:00:00.000+0000\twriting sales.orders to\n")
+        progress.finish()
+
+        self.assertEqual(progress.colls, {})
+        self.assertFalse(os.path.exists(self.json_file))
+
+    def test_progress(self):
+
+        """Function:  test_progress
+
+        Description:  Test with the docs/sec and seconds left of a collection.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_db_dump.time.time",
+                        mock.Mock(side_effect=[1000.0, 1000.0, 1010.0])):
+            progress = mongo_db_dump.DumpProgress(self.json_file)
+            progress.add(self.line1)
+            progress.add(self.line2)
+
+        progress.finish()
+        lines = self._read_json()
+
+        self.assertEqual(len(lines), 2)
+        self.assertIsNone(lines[0]["eta_seconds"])
+        self.assertEqual(lines[1], {
+            "ns": "sales.orders", "program": "mongodump", "time": 1010.0,
+            "docs": 300, "total": 1000, "percent": 30.0, "docs_per_sec": 20.0,
+            "eta_seconds": 35.0, "done": False})
+
+    def test_done(self):
+
+        """Function:  test_done
+
+        Description:  Test with a collection done.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_db_dump.time.time",
+                        mock.Mock(side_effect=[1000.0, 1000.0, 1020.0])):
+            progress = mongo_db_dump.DumpProgress(self.json_file)
+            progress.add(self.line1)
+            progress.add(self.done)
+
+        progress.finish()
+        line = self._read_json()[-1]
+
+        self.assertTrue(line["done"])
+        self.assertEqual(line["percent"], 100.0)
+        self.assertEqual(line["eta_seconds"], 0.0)
+        self.assertEqual(line["docs_per_sec"], 45.0)
+
+    def test_prom_file(self):
+
+        """Function:  test_prom_file
+
+        Description:  Test with the Prometheus textfile written while running
+            and when finished.
+
+        Arguments:
+
+        """
+
+        progress = mongo_db_dump.DumpProgress(
+            self.json_file, self.prom_file, "mongoexport")
+
+        with open(self.prom_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertIn('mongo_dump_running{program="mongoexport"} 1\n',
+                          f_hdlr.read())
+
+        progress.add(self.line1.replace("sales.orders", 'sales.a"b'))
+        progress.finish()
+
+        with open(self.prom_file, mode="r", encoding="UTF-8") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertIn('mongo_dump_running{program="mongoexport"} 0\n', data)
+        self.assertIn('mongo_dump_collection_docs{program="mongoexport",'
+                      'ns="sales.a\\"b"} 100.0\n', data)
+        self.assertFalse(os.path.exists(self.prom_file + ".tmp"))
+
+    def test_prom_interval(self):
+
+        """Function:  test_prom_interval
+
+        Description:  Test with the Prometheus textfile not rewritten within
+            PROM_INTERVAL seconds.
+
+        Arguments:
+
+        """
+
+        progress = mongo_db_dump.DumpProgress(self.json_file, self.prom_file)
+        progress.add(self.line1)
+
+        with mock.patch.object(progress, "write_prom") as mock_write:
+            progress.add(self.line2)
+
+        progress.finish()
+
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("mongo_db_dump.print")
+    def test_no_prom_dir(self, mock_print):
+
+        """Function:  test_no_prom_dir
+
+        Description:  Test with a missing Prometheus textfile directory.
+
+        Arguments:
+
+        """
+
+        progress = mongo_db_dump.DumpProgress(
+            self.json_file, os.path.join(self.dir_path, "none", "dump.prom"))
+        progress.add(self.line1)
+        progress.finish()
+
+        self.assertEqual(mock_print.call_count, 1)
+        self.assertFalse(os.path.exists(self.json_file))
+
+    @mock.patch("mongo_db_dump.print")
+    def test_json_failure(self, mock_print):
+
+        """Function:  test_json_failure
+
+        Description:  Test with a failed write of the JSON lines file.
+
+        Arguments:
+
+        """
+
+        progress = mongo_db_dump.DumpProgress(self.json_file, self.prom_file)
+        progress.add(self.line1)
+
+        with mock.patch.object(progress.f_hdlr, "write",
+                               side_effect=OSError("No space left")):
+            progress.add(self.line2)
+
+        progress.add(self.done)
+        progress.finish()
+
+        self.assertEqual(mock_print.call_count, 1)
+        self.assertEqual(len(self._read_json()), 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
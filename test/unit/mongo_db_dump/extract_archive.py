@@ -0,0 +1,168 @@
+# Classification (U)
+
+"""Program:  extract_archive.py
+
+    Description:  Unit testing of extract_archive in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/extract_archive.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_index
+        test_single_file
+        test_extract_all
+        test_zstd
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp"
+        self.src_dir = os.path.join(self.base_dir, "src_dir")
+        self.dst_dir = os.path.join(self.base_dir, "dst_dir")
+        self.arch_file = os.path.join(self.base_dir, "cp_dump.tar.gz")
+        self.name = os.path.join("journal", "WiredTigerLog.1")
+        self.files = {"collection-1.wt": os.urandom(50000),
+                      "index-2.wt": b"b" * 100, self.name: b"a" * 10}
+        os.makedirs(os.path.join(self.src_dir, "journal"))
+
+        for name, data in self.files.items():
+            with open(os.path.join(self.src_dir, name), mode="wb") as f_hdlr:
+                f_hdlr.write(data)
+
+        mongo_db_dump.archive_cp(self.src_dir, self.arch_file, chunk_size=4096)
+
+    def test_no_index(self):
+
+        """Function:  test_no_index
+
+        Description:  Test with a missing archive index.
+
+        Arguments:
+
+        """
+
+        os.remove(self.arch_file + ".idx")
+
+        err_flag, err_msg = mongo_db_dump.extract_archive(
+            self.arch_file, self.dst_dir)
+
+        self.assertTrue(err_flag)
+        self.assertTrue(err_msg.startswith("Error:  Unable to read archive"))
+
+    def test_single_file(self):
+
+        """Function:  test_single_file
+
+        Description:  Test with extracting a single file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.extract_archive(
+                self.arch_file, self.dst_dir, names=["journal", self.name]),
+            (False, None))
+        self.assertEqual(os.listdir(self.dst_dir), ["journal"])
+
+        with open(os.path.join(self.dst_dir, self.name), mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.files[self.name])
+
+    def test_extract_all(self):
+
+        """Function:  test_extract_all
+
+        Description:  Test with extracting all files in parallel.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.extract_archive(
+                self.arch_file, self.dst_dir, threads=3), (False, None))
+
+        for name, data in self.files.items():
+            with open(os.path.join(self.dst_dir, name), mode="rb") as f_hdlr:
+                self.assertEqual(f_hdlr.read(), data)
+
+    @unittest.skipIf(mongo_db_dump.zstandard is None,
+                     "zstandard module not installed")
+    def test_zstd(self):
+
+        """Function:  test_zstd
+
+        Description:  Test with extracting all files of a zstd archive.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.archive_cp(self.src_dir, self.arch_file, codec="zstd",
+                                 chunk_size=4096)
+
+        self.assertEqual(
+            mongo_db_dump.extract_archive(
+                self.arch_file, self.dst_dir, threads=3), (False, None))
+
+        for name, data in self.files.items():
+            with open(os.path.join(self.dst_dir, name), mode="rb") as f_hdlr:
+                self.assertEqual(f_hdlr.read(), data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.src_dir, ignore_errors=True)
+        shutil.rmtree(self.dst_dir, ignore_errors=True)
+
+        for name in [self.arch_file, self.arch_file + ".idx"]:
+            if os.path.isfile(name):
+                os.remove(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
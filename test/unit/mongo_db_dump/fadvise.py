@@ -0,0 +1,110 @@
+# Classification (U)
+
+"""Program:  fadvise.py
+
+    Description:  Unit testing of fadvise in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/fadvise.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_fadvise
+        test_not_supported
+        test_bad_fd
+        test_fadvise
+
+    """
+
+    def test_no_fadvise(self):
+
+        """Function:  test_no_fadvise
+
+        Description:  Test with posix_fadvise not available.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(mongo_db_dump, "os") as mock_os:
+            del mock_os.posix_fadvise
+            mongo_db_dump.fadvise(3, 0, 0, "POSIX_FADV_DONTNEED")
+
+            self.assertEqual(mock_os.mock_calls, [])
+
+    @mock.patch("mongo_db_dump.os.posix_fadvise")
+    def test_not_supported(self, mock_advise):
+
+        """Function:  test_not_supported
+
+        Description:  Test with a file which does not support advice.
+
+        Arguments:
+
+        """
+
+        mock_advise.side_effect = OSError(29, "Illegal seek")
+        mongo_db_dump.fadvise(3, 0, 0, "POSIX_FADV_DONTNEED")
+
+        self.assertTrue(mock_advise.called)
+
+    @mock.patch("mongo_db_dump.os.posix_fadvise")
+    def test_bad_fd(self, mock_advise):
+
+        """Function:  test_bad_fd
+
+        Description:  Test with a file descriptor which is not open.
+
+        Arguments:
+
+        """
+
+        mock_advise.side_effect = OSError(9, "Bad file descriptor")
+
+        with self.assertRaises(OSError):
+            mongo_db_dump.fadvise(3, 0, 0, "POSIX_FADV_DONTNEED")
+
+    @mock.patch("mongo_db_dump.os.posix_fadvise")
+    def test_fadvise(self, mock_advise):
+
+        """Function:  test_fadvise
+
+        Description:  Test with the advice given for the range.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.fadvise(3, 4096, 8192, "POSIX_FADV_WILLNEED")
+
+        mock_advise.assert_called_once_with(
+            3, 4096, 8192, os.POSIX_FADV_WILLNEED)
+
+
+if __name__ == "__main__":
+    unittest.main()
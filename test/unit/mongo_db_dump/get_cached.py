@@ -0,0 +1,75 @@
+# Classification (U)
+
+"""Program:  get_cached.py
+
+    Description:  Unit testing of get_cached in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_cached.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_meminfo
+        test_get_cached
+
+    """
+
+    @mock.patch("mongo_db_dump.open")
+    def test_no_meminfo(self, mock_open):
+
+        """Function:  test_no_meminfo
+
+        Description:  Test with /proc/meminfo not readable.
+
+        Arguments:
+
+        """
+
+        mock_open.side_effect = FileNotFoundError("No such file")
+
+        self.assertIsNone(mongo_db_dump.get_cached())
+
+    @mock.patch("mongo_db_dump.open")
+    def test_get_cached(self, mock_open):
+
+        """Function:  test_get_cached
+
+        Description:  Test with the page cache size in bytes.
+
+        Arguments:
+
+        """
+
+        mock_open.return_value.__enter__.return_value = iter([
+            "MemTotal:       16318800 kB\n", "Cached:          2048 kB\n"])
+
+        self.assertEqual(mongo_db_dump.get_cached(), 2097152)
+
+
+if __name__ == "__main__":
+    unittest.main()
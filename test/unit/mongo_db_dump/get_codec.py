@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  get_codec.py
+
+    Description:  Unit testing of get_codec in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_codec.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zstd_frames
+        test_gzip_members
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = [b"a" * 1000, os.urandom(1000), b"c" * 10]
+
+    @unittest.skipIf(mongo_db_dump.zstandard is None,
+                     "zstandard module not installed")
+    def test_zstd_frames(self):
+
+        """Function:  test_zstd_frames
+
+        Description:  Test with concatenated zstd frames.
+
+        Arguments:
+
+        """
+
+        compress, decompress = mongo_db_dump.get_codec("zstd", level=1)
+
+        self.assertEqual(
+            decompress(b"".join(compress(item) for item in self.data)),
+            b"".join(self.data))
+
+    def test_gzip_members(self):
+
+        """Function:  test_gzip_members
+
+        Description:  Test with concatenated gzip members.
+
+        Arguments:
+
+        """
+
+        compress, decompress = mongo_db_dump.get_codec("gzip")
+
+        self.assertEqual(
+            decompress(b"".join(compress(item) for item in self.data)),
+            b"".join(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
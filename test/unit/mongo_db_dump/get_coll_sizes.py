@@ -0,0 +1,179 @@
+# Classification (U)
+
+"""Program:  get_coll_sizes.py
+
+    Description:  Unit testing of get_coll_sizes in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_coll_sizes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Database():                                       # pylint:disable=R0903
+
+    """Class:  Database
+
+    Description:  Class stub holder for pymongo.database.Database class.
+
+    Methods:
+        __init__
+        list_collections
+        command
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.colls = [
+            {"name": "small", "type": "collection"},
+            {"name": "system.profile", "type": "collection"},
+            {"name": "system.js", "type": "collection"},
+            {"name": "large_view", "type": "view"},
+            {"name": "large", "type": "collection"}]
+        self.sizes = {"small": 1024, "system.js": 512, "large": 1048576}
+        self.error = None
+
+    def list_collections(self):
+
+        """Method:  list_collections
+
+        Description:  Stub holder for Database.list_collections method.
+
+        Arguments:
+
+        """
+
+        if self.error:
+            raise self.error
+
+        return iter(self.colls)
+
+    def command(self, cmd, name):
+
+        """Method:  command
+
+        Description:  Stub holder for Database.command method.
+
+        Arguments:
+            (input) cmd -> Database command
+            (input) name -> Collection name
+
+        """
+
+        if name not in self.sizes:
+            raise pymongo.errors.OperationFailure(
+                f"Namespace {name} is a view, not a collection")
+
+        return {"ns": "sales." + name, "size": self.sizes[name]} \
+            if cmd == "collStats" else {}
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = {"sales": Database()}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_list_failure
+        test_get_coll_sizes
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_list_failure(self):
+
+        """Function:  test_list_failure
+
+        Description:  Test with the collections not listed.
+
+        Arguments:
+
+        """
+
+        self.server.conn["sales"].error = pymongo.errors.OperationFailure(
+            "not authorized")
+
+        self.assertIsNone(mongo_db_dump.get_coll_sizes(self.server, "sales"))
+
+    def test_get_coll_sizes(self):
+
+        """Function:  test_get_coll_sizes
+
+        Description:  Test with the collection sizes, views size 0 and
+            system collections other than system.js skipped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.get_coll_sizes(self.server, "sales"),
+            {"small": 1024, "system.js": 512, "large_view": 0,
+             "large": 1048576})
+
+
+if __name__ == "__main__":
+    unittest.main()
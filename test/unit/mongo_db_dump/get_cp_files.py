@@ -0,0 +1,168 @@
+# Classification (U)
+
+"""Program:  get_cp_files.py
+
+    Description:  Unit testing of get_cp_files in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_cp_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_dir
+        test_sub_dirs
+        test_default_exclude
+        test_include
+        test_largest_first
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.src_dir = "./test/unit/mongo_db_dump/tmp/src_dir"
+        os.makedirs(os.path.join(self.src_dir, "journal"))
+
+        for name, size in [("small.wt", 10), ("large.wt", 300),
+                           (os.path.join("journal", "WiredTigerLog.1"), 50)]:
+            with open(os.path.join(self.src_dir, name), mode="wb") as f_hdlr:
+                f_hdlr.write(b"x" * size)
+
+        self.files = [("large.wt", 300),
+                      (os.path.join("journal", "WiredTigerLog.1"), 50),
+                      ("small.wt", 10)]
+
+    def test_empty_dir(self):
+
+        """Function:  test_empty_dir
+
+        Description:  Test with an empty directory.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.src_dir)
+        os.makedirs(self.src_dir)
+
+        self.assertEqual(
+            mongo_db_dump.get_cp_files(self.src_dir), ([], []))
+
+    def test_sub_dirs(self):
+
+        """Function:  test_sub_dirs
+
+        Description:  Test with sub-directories returned.
+
+        Arguments:
+
+        """
+
+        dir_list, _ = mongo_db_dump.get_cp_files(self.src_dir)
+
+        self.assertEqual(dir_list, ["journal"])
+
+    def test_default_exclude(self):
+
+        """Function:  test_default_exclude
+
+        Description:  Test with the default exclude patterns.
+
+        Arguments:
+
+        """
+
+        for name in [os.path.join("diagnostic.data", "metrics.1"),
+                     os.path.join("_tmp", "extsort.1"), "mongod.lock",
+                     "core.1234"]:
+            os.makedirs(os.path.join(self.src_dir, os.path.dirname(name)),
+                        exist_ok=True)
+
+            with open(os.path.join(self.src_dir, name), mode="wb") as f_hdlr:
+                f_hdlr.write(b"x" * 1000)
+
+        dir_list, file_list = mongo_db_dump.get_cp_files(
+            self.src_dir, exclude=mongo_db_dump.CP_EXCLUDE)
+
+        self.assertEqual(dir_list, ["journal"])
+        self.assertEqual([item[:2] for item in file_list], self.files)
+
+    def test_include(self):
+
+        """Function:  test_include
+
+        Description:  Test with include and path exclude patterns.
+
+        Arguments:
+
+        """
+
+        _, file_list = mongo_db_dump.get_cp_files(
+            self.src_dir, include=["*.wt", "journal/*"],
+            exclude=["journal/*.2", "small.*"])
+
+        self.assertEqual([item[:2] for item in file_list], self.files[:2])
+
+    def test_largest_first(self):
+
+        """Function:  test_largest_first
+
+        Description:  Test with files sorted largest first.
+
+        Arguments:
+
+        """
+
+        _, file_list = mongo_db_dump.get_cp_files(self.src_dir)
+
+        self.assertEqual([item[:2] for item in file_list], self.files)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.src_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  get_db_list.py
+
+    Description:  Unit testing of get_db_list in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_db_list.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.japd = "JAPD"
+        self.data = {"databases": [
+            {"name": "admin", "sizeOnDisk": 40960},
+            {"name": "local", "sizeOnDisk": 1073741824},
+            {"name": "sales", "sizeOnDisk": 536870912},
+            {"name": "config", "sizeOnDisk": 110592}]}
+        self.error = None
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+            (input) cmd -> Database command
+
+        """
+
+        if self.error:
+            raise self.error
+
+        return self.data if cmd == "listDatabases" else {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_list_failure
+        test_get_db_list
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_list_failure(self):
+
+        """Function:  test_list_failure
+
+        Description:  Test with the databases not listed.
+
+        Arguments:
+
+        """
+
+        self.server.error = pymongo.errors.OperationFailure("not authorized")
+
+        self.assertIsNone(mongo_db_dump.get_db_list(self.server))
+
+    def test_get_db_list(self):
+
+        """Function:  test_get_db_list
+
+        Description:  Test with the databases largest first without local.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_db_dump.get_db_list(self.server),
+                         ["sales", "config", "admin"])
+
+
+if __name__ == "__main__":
+    unittest.main()
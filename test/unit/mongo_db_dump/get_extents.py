@@ -0,0 +1,189 @@
+# Classification (U)
+
+"""Program:  get_extents.py
+
+    Description:  Unit testing of get_extents in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_extents.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import errno
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write_file
+        test_not_supported
+        test_empty_file
+        test_all_holes
+        test_holes
+        test_no_holes
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.f_name = "./test/unit/mongo_db_dump/tmp/WiredTigerPreplog.1"
+        self.block = 1048576
+
+    def write_file(self, extents, size):
+
+        """Function:  write_file
+
+        Description:  Writes a sparse file with data at the extents.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, mode="wb") as f_hdlr:
+            for start, end in extents:
+                f_hdlr.seek(start)
+                f_hdlr.write(b"x" * (end - start))
+
+            f_hdlr.truncate(size)
+
+        return os.open(self.f_name, os.O_RDONLY)
+
+    @mock.patch("mongo_db_dump.os.lseek")
+    def test_not_supported(self, mock_lseek):
+
+        """Function:  test_not_supported
+
+        Description:  Test with a filesystem which cannot report holes.
+
+        Arguments:
+
+        """
+
+        mock_lseek.side_effect = OSError(errno.EINVAL, "Invalid argument")
+
+        self.assertEqual(mongo_db_dump.get_extents(0, 100), [(0, 100)])
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        f_desc = self.write_file([], 0)
+
+        try:
+            self.assertEqual(mongo_db_dump.get_extents(f_desc, 0), [])
+
+        finally:
+            os.close(f_desc)
+
+    def test_all_holes(self):
+
+        """Function:  test_all_holes
+
+        Description:  Test with a file which is one hole, e.g. a preallocated
+            journal file.
+
+        Arguments:
+
+        """
+
+        f_desc = self.write_file([], self.block * 4)
+
+        try:
+            self.assertEqual(
+                mongo_db_dump.get_extents(f_desc, self.block * 4), [])
+
+        finally:
+            os.close(f_desc)
+
+    def test_holes(self):
+
+        """Function:  test_holes
+
+        Description:  Test with data between holes.
+
+        Arguments:
+
+        """
+
+        extents = [(self.block, self.block * 2),
+                   (self.block * 4, self.block * 5)]
+        f_desc = self.write_file(extents, self.block * 8)
+
+        try:
+            self.assertEqual(
+                mongo_db_dump.get_extents(f_desc, self.block * 8), extents)
+
+        finally:
+            os.close(f_desc)
+
+    def test_no_holes(self):
+
+        """Function:  test_no_holes
+
+        Description:  Test with a file with no holes.
+
+        Arguments:
+
+        """
+
+        f_desc = self.write_file([(0, 10000)], 10000)
+
+        try:
+            self.assertEqual(
+                mongo_db_dump.get_extents(f_desc, 10000), [(0, 10000)])
+
+        finally:
+            os.close(f_desc)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.f_name):
+            os.remove(self.f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
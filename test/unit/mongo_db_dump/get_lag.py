@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  get_lag.py
+
+    Description:  Unit testing of get_lag in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_lag.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self, members):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.members = members
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+
+        """
+
+        return {"cmd": cmd, "members": self.members}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_secondary
+        test_ahead_of_primary
+        test_primary
+        test_no_primary
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        now = datetime.datetime(2026, 10, 18, 12, 0, 0)
+        self.primary = {"name": "host1:27017", "state": 1, "optimeDate": now}
+        self.secondary = {"name": "host2:27017", "state": 2, "self": True,
+                          "optimeDate": now - datetime.timedelta(seconds=7)}
+
+    def test_secondary(self):
+
+        """Function:  test_secondary
+
+        Description:  Test with the lag of a secondary.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.get_lag(Server([self.primary, self.secondary])),
+            7.0)
+
+    def test_ahead_of_primary(self):
+
+        """Function:  test_ahead_of_primary
+
+        Description:  Test with the secondary optime newer than the primary.
+
+        Arguments:
+
+        """
+
+        self.secondary["optimeDate"] = self.primary["optimeDate"] \
+            + datetime.timedelta(seconds=1)
+
+        self.assertEqual(
+            mongo_db_dump.get_lag(Server([self.primary, self.secondary])), 0)
+
+    def test_primary(self):
+
+        """Function:  test_primary
+
+        Description:  Test with the server being the primary.
+
+        Arguments:
+
+        """
+
+        self.primary["self"] = True
+        del self.secondary["self"]
+
+        self.assertIsNone(
+            mongo_db_dump.get_lag(Server([self.primary, self.secondary])))
+
+    def test_no_primary(self):
+
+        """Function:  test_no_primary
+
+        Description:  Test with no primary in the replica set.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_db_dump.get_lag(Server([self.secondary])))
+
+
+if __name__ == "__main__":
+    unittest.main()
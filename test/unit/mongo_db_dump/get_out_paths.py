@@ -0,0 +1,253 @@
+# Classification (U)
+
+"""Program:  get_out_paths.py
+
+    Description:  Unit testing of get_out_paths in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_out_paths.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.databases = [{"name": "sales", "sizeOnDisk": 8192},
+                          {"name": "local", "sizeOnDisk": 4096}]
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+            (input) cmd -> Database command
+
+        """
+
+        return {"cmd": cmd, "databases": self.databases}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_archive
+        test_export
+        test_database
+        test_dump_list
+        test_instance
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/out_paths"
+        self.server = Server()
+        self.args = ArgParser()
+        self.args.args_array = {"-o": self.dir_path}
+
+        for name in ["admin", "sales", "cp_dump_20250101_010000"]:
+            os.makedirs(os.path.join(self.dir_path, name))
+
+        for name in ["dump_20250101_010000.log", "mongodump_tuning.json"]:
+            with open(os.path.join(self.dir_path, name), mode="w",
+                      encoding="UTF-8") as f_hdlr:
+                f_hdlr.write("{}")
+
+    def test_archive(self):
+
+        """Function:  test_archive
+
+        Description:  Test with an archive dump, only the archive.
+
+        Arguments:
+
+        """
+
+        arch_file = os.path.join(self.dir_path, "dump.archive.gz")
+
+        self.assertEqual(
+            mongo_db_dump.get_out_paths(
+                self.server, self.args, {"arch_file": arch_file}),
+            [arch_file])
+
+    def test_export(self):
+
+        """Function:  test_export
+
+        Description:  Test with an export file.
+
+        Arguments:
+
+        """
+
+        f_name = os.path.join(self.dir_path, "export_sales_orders.json")
+        self.args.args_array["-o"] = f_name
+
+        self.assertEqual(
+            mongo_db_dump.get_out_paths(self.server, self.args), [f_name])
+
+    def test_database(self):
+
+        """Function:  test_database
+
+        Description:  Test with a -b database dump, only its directory.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = "sales"
+
+        self.assertEqual(
+            mongo_db_dump.get_out_paths(self.server, self.args),
+            [os.path.join(self.dir_path, "sales")])
+
+    def test_dump_list(self):
+
+        """Function:  test_dump_list
+
+        Description:  Test with databases dumped in parallel, only their
+            directories.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.get_out_paths(
+                self.server, self.args, dump_list=["--db=admin"]),
+            [os.path.join(self.dir_path, "admin")])
+
+    def test_instance(self):
+
+        """Function:  test_instance
+
+        Description:  Test with an instance dump, the directories of the
+            instance's databases and not the copies or files beside them.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.get_out_paths(self.server, self.args),
+            [os.path.join(self.dir_path, "sales")])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  get_prev_dump.py
+
+    Description:  Unit testing of get_prev_dump in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_prev_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_prev_dump
+        test_skip_files
+        test_skip_incomplete
+        test_latest_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_dir = "./test/unit/mongo_db_dump/tmp/dump_dir"
+        os.makedirs(self.dump_dir)
+
+    def test_no_prev_dump(self):
+
+        """Function:  test_no_prev_dump
+
+        Description:  Test with no previous dump directory.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_db_dump.get_prev_dump(self.dump_dir))
+
+    def test_skip_files(self):
+
+        """Function:  test_skip_files
+
+        Description:  Test with files named like a dump being skipped.
+
+        Arguments:
+
+        """
+
+        os.makedirs(os.path.join(self.dump_dir, "cp_dump_20250101_0100"))
+
+        with open(os.path.join(self.dump_dir, "cp_dump_20250102_0100"),
+                  mode="w", encoding="UTF-8"):
+            pass
+
+        self.assertEqual(
+            mongo_db_dump.get_prev_dump(self.dump_dir),
+            os.path.join(self.dump_dir, "cp_dump_20250101_0100"))
+
+    def test_skip_incomplete(self):
+
+        """Function:  test_skip_incomplete
+
+        Description:  Test with an incomplete dump directory being skipped.
+
+        Arguments:
+
+        """
+
+        for name in ["cp_dump_20250101_0100", "cp_dump_20250102_0100"]:
+            os.makedirs(os.path.join(self.dump_dir, name))
+
+        with open(os.path.join(self.dump_dir, "cp_dump_20250102_0100",
+                               "cp_dump_incomplete"),
+                  mode="w", encoding="UTF-8"):
+            pass
+
+        self.assertEqual(
+            mongo_db_dump.get_prev_dump(self.dump_dir),
+            os.path.join(self.dump_dir, "cp_dump_20250101_0100"))
+
+    def test_latest_dump(self):
+
+        """Function:  test_latest_dump
+
+        Description:  Test with the most recent dump directory returned.
+
+        Arguments:
+
+        """
+
+        for name in ["cp_dump_20250101_0100", "cp_dump_20250103_0100",
+                     "cp_dump_20250102_2300", "dump_20250104_0100"]:
+            os.makedirs(os.path.join(self.dump_dir, name))
+
+        self.assertEqual(
+            mongo_db_dump.get_prev_dump(self.dump_dir),
+            os.path.join(self.dump_dir, "cp_dump_20250103_0100"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dump_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
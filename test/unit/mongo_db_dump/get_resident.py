@@ -0,0 +1,143 @@
+# Classification (U)
+
+"""Program:  get_resident.py
+
+    Description:  Unit testing of get_resident in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_resident.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import mmap
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_file
+        test_no_libc
+        test_get_resident
+        test_windows
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/cache"
+        self.f_name = os.path.join(self.dir_path, "collection-1.wt")
+        self.size = mmap.PAGESIZE * 4
+        os.makedirs(self.dir_path)
+
+        with open(self.f_name, mode="wb") as f_hdlr:
+            f_hdlr.write(os.urandom(self.size))
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_db_dump.get_resident(3, 0), [])
+
+    @mock.patch("mongo_db_dump.LIBC", None)
+    def test_no_libc(self):
+
+        """Function:  test_no_libc
+
+        Description:  Test with the C library not available.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_db_dump.get_resident(3, self.size))
+
+    def test_get_resident(self):
+
+        """Function:  test_get_resident
+
+        Description:  Test with the pages of a file just read.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, mode="rb") as f_hdlr:
+            f_hdlr.read()
+            resident = mongo_db_dump.get_resident(f_hdlr.fileno(), self.size)
+
+        for start, end in resident:
+            self.assertEqual(start % mmap.PAGESIZE, 0)
+            self.assertTrue(start < end <= self.size)
+
+    def test_windows(self):
+
+        """Function:  test_windows
+
+        Description:  Test with mincore called a page at a time, the ranges
+            merged across the windows.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, mode="rb") as f_hdlr:
+            f_hdlr.read()
+            resident = mongo_db_dump.get_resident(f_hdlr.fileno(), self.size)
+
+            with mock.patch("mongo_db_dump.MINCORE_WINDOW", mmap.PAGESIZE):
+                self.assertEqual(
+                    mongo_db_dump.get_resident(f_hdlr.fileno(), self.size),
+                    resident)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
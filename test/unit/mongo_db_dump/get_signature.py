@@ -0,0 +1,142 @@
+# Classification (U)
+
+"""Program:  get_signature.py
+
+    Description:  Unit testing of get_signature in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_signature.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import zlib
+import hashlib
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_full_blocks
+        test_partial_block
+        test_repeated_block
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.base_file = os.path.join(self.dir_path, "base.wt")
+        self.src_file = os.path.join(self.dir_path, "src.wt")
+        self.delta_file = os.path.join(self.dir_path, "src.wt.cpdelta")
+        self.dst_file = os.path.join(self.dir_path, "dst.wt")
+        self.base = os.urandom(self.block_size * 16)
+        os.makedirs(self.dir_path)
+
+        with open(self.base_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.base)
+
+    def test_full_blocks(self):
+
+        """Function:  test_full_blocks
+
+        Description:  Test with a signature entry for each full block.
+
+        Arguments:
+
+        """
+
+        signature = mongo_db_dump.get_signature(
+            self.base_file, self.block_size)
+        block = self.base[self.block_size * 3:self.block_size * 4]
+
+        self.assertEqual(
+            signature[zlib.adler32(block)][
+                hashlib.blake2b(block, digest_size=16).digest()], 3)
+        self.assertEqual(
+            sum(len(item) for item in signature.values()), 16)
+
+    def test_partial_block(self):
+
+        """Function:  test_partial_block
+
+        Description:  Test with the last partial block left out.
+
+        Arguments:
+
+        """
+
+        with open(self.base_file, mode="ab") as f_hdlr:
+            f_hdlr.write(b"x" * 100)
+
+        signature = mongo_db_dump.get_signature(
+            self.base_file, self.block_size)
+
+        self.assertEqual(
+            sum(len(item) for item in signature.values()), 16)
+
+    def test_repeated_block(self):
+
+        """Function:  test_repeated_block
+
+        Description:  Test with a repeated block kept as its first block.
+
+        Arguments:
+
+        """
+
+        with open(self.base_file, mode="wb") as f_hdlr:
+            f_hdlr.write(bytes(self.block_size * 4))
+
+        signature = mongo_db_dump.get_signature(
+            self.base_file, self.block_size)
+
+        self.assertEqual(list(signature.values()), [
+            {hashlib.blake2b(bytes(self.block_size),
+                             digest_size=16).digest(): 0}])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
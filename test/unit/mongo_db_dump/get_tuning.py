@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  get_tuning.py
+
+    Description:  Unit testing of get_tuning in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_tuning.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_file
+        test_bad_file
+        test_not_list
+        test_get_tuning
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/tuning"
+        self.f_name = os.path.join(self.dir_path, "mongodump_tuning.json")
+        self.runs = [{"num_parallel": 4, "procs": 1, "bytes": 1048576,
+                      "seconds": 2.5}]
+        os.makedirs(self.dir_path)
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with no tuning file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_db_dump.get_tuning(self.dir_path), [])
+
+    def test_bad_file(self):
+
+        """Function:  test_bad_file
+
+        Description:  Test with a tuning file not in JSON format.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("{bad")
+
+        self.assertEqual(mongo_db_dump.get_tuning(self.dir_path), [])
+
+    def test_not_list(self):
+
+        """Function:  test_not_list
+
+        Description:  Test with a tuning file not holding a list.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump({"num_parallel": 4}, f_hdlr)
+
+        self.assertEqual(mongo_db_dump.get_tuning(self.dir_path), [])
+
+    def test_get_tuning(self):
+
+        """Function:  test_get_tuning
+
+        Description:  Test with the past runs returned.
+
+        Arguments:
+
+        """
+
+        with open(self.f_name, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(self.runs, f_hdlr)
+
+        self.assertEqual(mongo_db_dump.get_tuning(self.dir_path), self.runs)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
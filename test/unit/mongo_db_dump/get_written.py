@@ -0,0 +1,107 @@
+# Classification (U)
+
+"""Program:  get_written.py
+
+    Description:  Unit testing of get_written in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/get_written.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_file
+        test_get_written
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/written"
+        self.old_file = os.path.join(self.dir_path, "old", "coll.bson")
+        self.new_file = os.path.join(self.dir_path, "new", "coll.bson")
+
+        for f_name in [self.old_file, self.new_file]:
+            os.makedirs(os.path.dirname(f_name))
+
+            with open(f_name, mode="wb") as f_hdlr:
+                f_hdlr.write(b"x" * 4096)
+
+        os.utime(self.old_file, (1600000000, 1600000000))
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with the output a single file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mongo_db_dump.get_written([self.new_file], 0),
+                         [self.new_file])
+
+    def test_get_written(self):
+
+        """Function:  test_get_written
+
+        Description:  Test with only the files modified since returned.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.get_written([self.dir_path], 1700000000000000000),
+            [self.new_file])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  is_local_host.py
+
+    Description:  Unit testing of is_local_host in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/is_local_host.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import socket
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def getaddrinfo(host, port):
+
+    """Function:  getaddrinfo
+
+    Description:  Stub holder for socket.getaddrinfo.
+
+    Arguments:
+
+    """
+
+    addrs = {"dbhost": "10.1.1.5", "dbhost2": "10.1.1.6",
+             "localhost": "127.0.0.1"}
+
+    if host not in addrs:
+        raise socket.gaierror("Name or service not known")
+
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (addrs[host], port))]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_loopback
+        test_local_address
+        test_remote_address
+        test_unknown_host
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.patch1 = mock.patch("mongo_db_dump.socket.getaddrinfo",
+                                 getaddrinfo)
+        self.patch2 = mock.patch("mongo_db_dump.socket.gethostname",
+                                 mock.Mock(return_value="dbhost"))
+        self.patch1.start()
+        self.patch2.start()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.patch1.stop()
+        self.patch2.stop()
+
+    def test_loopback(self):
+
+        """Function:  test_loopback
+
+        Description:  Test with a loopback host name.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mongo_db_dump.is_local_host("localhost"))
+
+    def test_local_address(self):
+
+        """Function:  test_local_address
+
+        Description:  Test with a host name of this server.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mongo_db_dump.is_local_host("dbhost"))
+
+    def test_remote_address(self):
+
+        """Function:  test_remote_address
+
+        Description:  Test with a host name of another server.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mongo_db_dump.is_local_host("dbhost2"))
+
+    def test_unknown_host(self):
+
+        """Function:  test_unknown_host
+
+        Description:  Test with a host name that does not resolve.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mongo_db_dump.is_local_host("nohost"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  is_match.py
+
+    Description:  Unit testing of is_match in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/is_match.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_patterns
+        test_path_pattern
+        test_name_pattern
+        test_no_match
+
+    """
+
+    def test_no_patterns(self):
+
+        """Function:  test_no_patterns
+
+        Description:  Test with an empty pattern list.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mongo_db_dump.is_match("mongod.lock", []))
+
+    def test_path_pattern(self):
+
+        """Function:  test_path_pattern
+
+        Description:  Test with a pattern matched against the relative path.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mongo_db_dump.is_match("journal/WiredTigerLog.1", ["journal/*"]))
+        self.assertFalse(
+            mongo_db_dump.is_match("db1/journal/Log.1", ["journal/*"]))
+
+    def test_name_pattern(self):
+
+        """Function:  test_name_pattern
+
+        Description:  Test with a pattern matched against the name.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mongo_db_dump.is_match("db1/core.1234", mongo_db_dump.CP_EXCLUDE))
+
+    def test_no_match(self):
+
+        """Function:  test_no_match
+
+        Description:  Test with no pattern matching.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mongo_db_dump.is_match(
+                "collection-0-123.wt", mongo_db_dump.CP_EXCLUDE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  is_unchanged.py
+
+    Description:  Unit testing of is_unchanged in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/is_unchanged.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write_file
+        test_hash_differs
+        test_hash_same
+        test_mtime_differs
+        test_size_differs
+        test_no_prev_file
+        test_unchanged
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp"
+        self.src_file = os.path.join(self.dir_path, "collection-1.wt")
+        self.prev_file = os.path.join(self.dir_path, "collection-1.wt.prev")
+        self.write_file(self.src_file, b"abcd", 1600000000)
+
+    @staticmethod
+    def write_file(f_name, data, mtime):
+
+        """Function:  write_file
+
+        Description:  Writes a file with set data and modification time.
+
+        Arguments:
+
+        """
+
+        with open(f_name, mode="wb") as f_hdlr:
+            f_hdlr.write(data)
+
+        os.utime(f_name, (mtime, mtime))
+
+    def test_hash_differs(self):
+
+        """Function:  test_hash_differs
+
+        Description:  Test with same size and mtime but different digest.
+
+        Arguments:
+
+        """
+
+        self.write_file(self.prev_file, b"abce", 1600000000)
+
+        self.assertTrue(
+            mongo_db_dump.is_unchanged(self.src_file, self.prev_file))
+        self.assertFalse(
+            mongo_db_dump.is_unchanged(
+                self.src_file, self.prev_file, use_hash=True))
+
+    def test_hash_same(self):
+
+        """Function:  test_hash_same
+
+        Description:  Test with same digest.
+
+        Arguments:
+
+        """
+
+        self.write_file(self.prev_file, b"abcd", 1600000000)
+
+        self.assertTrue(
+            mongo_db_dump.is_unchanged(
+                self.src_file, self.prev_file, use_hash=True))
+
+    def test_mtime_differs(self):
+
+        """Function:  test_mtime_differs
+
+        Description:  Test with different modification times.
+
+        Arguments:
+
+        """
+
+        self.write_file(self.prev_file, b"abcd", 1600000001)
+
+        self.assertFalse(
+            mongo_db_dump.is_unchanged(self.src_file, self.prev_file))
+
+    def test_size_differs(self):
+
+        """Function:  test_size_differs
+
+        Description:  Test with different file sizes.
+
+        Arguments:
+
+        """
+
+        self.write_file(self.prev_file, b"abcde", 1600000000)
+
+        self.assertFalse(
+            mongo_db_dump.is_unchanged(self.src_file, self.prev_file))
+
+    def test_no_prev_file(self):
+
+        """Function:  test_no_prev_file
+
+        Description:  Test with no file in the previous dump.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mongo_db_dump.is_unchanged(self.src_file, self.prev_file))
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with an unchanged file.
+
+        Arguments:
+
+        """
+
+        self.write_file(self.prev_file, b"abcd", 1600000000)
+
+        self.assertTrue(
+            mongo_db_dump.is_unchanged(self.src_file, self.prev_file))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        for f_name in [self.src_file, self.prev_file]:
+            if os.path.isfile(f_name):
+                os.remove(f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
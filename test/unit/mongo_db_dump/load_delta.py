@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  load_delta.py
+
+    Description:  Unit testing of load_delta in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/load_delta.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_full_dump
+        test_delta_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.dumps = [os.path.join(self.base_dir, "cp_dump_2025010" + str(num)
+                                   + "_0100") for num in range(1, 4)]
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        self.data = {}
+        data = {name: os.urandom(self.block_size * 16)
+                for name in self.files}
+
+        for num, dmp_dir in enumerate(self.dumps):
+            os.makedirs(os.path.join(dmp_dir, "journal"))
+
+            for name in self.files:
+                data[name] = data[name][:self.block_size * num] \
+                    + os.urandom(self.block_size) \
+                    + data[name][self.block_size * (num + 1):]
+                self.data[(dmp_dir, name)] = data[name]
+
+                with open(os.path.join(dmp_dir, name), mode="wb") as f_hdlr:
+                    f_hdlr.write(data[name])
+
+    def test_full_dump(self):
+
+        """Function:  test_full_dump
+
+        Description:  Test with a dump which is not stored as deltas.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_db_dump.load_delta(self.dumps[0]))
+
+    def test_delta_dump(self):
+
+        """Function:  test_delta_dump
+
+        Description:  Test with a dump stored as deltas.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.delta_store(self.dumps[0], self.dumps[1],
+                                  block_size=self.block_size)
+
+        self.assertEqual(
+            mongo_db_dump.load_delta(self.dumps[0]),
+            {"base": os.path.basename(self.dumps[1]),
+             "block_size": self.block_size, "files": sorted(self.files)})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.base_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
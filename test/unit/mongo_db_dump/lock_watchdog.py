@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  lock_watchdog.py
+
+    Description:  Unit testing of LockWatchdog in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/lock_watchdog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        unlock_db
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.unlock_cnt = 0
+
+    def unlock_db(self):
+
+        """Method:  unlock_db
+
+        Description:  Stub holder for mongo_class.Server.unlock_db method.
+
+        Arguments:
+
+        """
+
+        self.unlock_cnt += 1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_budget
+        test_expired
+        test_unlock_once
+        test_within_budget
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_budget(self):
+
+        """Function:  test_no_budget
+
+        Description:  Test with no lock budget set.
+
+        Arguments:
+
+        """
+
+        watchdog = mongo_db_dump.LockWatchdog(self.server)
+        watchdog.start()
+        watchdog.unlock()
+
+        self.assertIsNone(watchdog.timer)
+        self.assertFalse(watchdog.cancel.is_set())
+        self.assertEqual(self.server.unlock_cnt, 1)
+
+    def test_expired(self):
+
+        """Function:  test_expired
+
+        Description:  Test with the lock budget running out.
+
+        Arguments:
+
+        """
+
+        watchdog = mongo_db_dump.LockWatchdog(self.server, 0.01)
+        watchdog.start()
+
+        self.assertTrue(watchdog.cancel.wait(5))
+
+        watchdog.timer.join(5)
+
+        self.assertEqual(self.server.unlock_cnt, 1)
+
+    def test_unlock_once(self):
+
+        """Function:  test_unlock_once
+
+        Description:  Test with the copy unlocking after the watchdog.
+
+        Arguments:
+
+        """
+
+        watchdog = mongo_db_dump.LockWatchdog(self.server, 60)
+        watchdog.expired()
+        watchdog.unlock()
+
+        self.assertEqual(self.server.unlock_cnt, 1)
+
+    def test_within_budget(self):
+
+        """Function:  test_within_budget
+
+        Description:  Test with the copy finishing within the lock budget.
+
+        Arguments:
+
+        """
+
+        watchdog = mongo_db_dump.LockWatchdog(self.server, 60)
+        watchdog.start()
+        watchdog.unlock()
+        watchdog.timer.join(5)
+
+        self.assertFalse(watchdog.cancel.is_set())
+        self.assertFalse(watchdog.timer.is_alive())
+        self.assertEqual(self.server.unlock_cnt, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
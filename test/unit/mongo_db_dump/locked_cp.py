@@ -0,0 +1,269 @@
+# Classification (U)
+
+"""Program:  locked_cp.py
+
+    Description:  Unit testing of locked_cp in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/locked_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        lock_db
+        is_locked
+        unlock_db
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.db_path = "Database_Directory_Path"
+        self.locked = False
+        self.can_lock = True
+        self.can_unlock = True
+
+    def lock_db(self, lock):
+
+        """Method:  lock_db
+
+        Description:  Stub holder for mongo_class.Server.lock_db method.
+
+        Arguments:
+            (input) lock -> True|False - Lock the database?
+
+        """
+
+        self.locked = lock and self.can_lock
+
+    def is_locked(self):
+
+        """Method:  is_locked
+
+        Description:  Stub holder for mongo_class.Server.is_locked method.
+
+        Arguments:
+
+        """
+
+        return self.locked
+
+    def unlock_db(self):
+
+        """Method:  unlock_db
+
+        Description:  Stub holder for mongo_class.Server.unlock_db method.
+
+        Arguments:
+
+        """
+
+        self.locked = not self.can_unlock
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unable_to_lock
+        test_still_locked
+        test_budget_exceeded
+        test_copy_raises
+        test_delta_copy
+        test_archive
+        test_copy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.dmp_dir = "DirectoryPath/cp_dump_20250101_0100"
+        self.stats = {}
+        self.msg = "Error:  Unable to lock the database for dump to occur."
+        self.msg2 = "Warning:  Database still locked after dump."
+        self.msg3 = "Error:  Lock budget of 0.01 seconds exceeded, copy" \
+            " cancelled and database unlocked."
+
+    def test_unable_to_lock(self):
+
+        """Function:  test_unable_to_lock
+
+        Description:  Test with the database unable to lock.
+
+        Arguments:
+
+        """
+
+        self.server.can_lock = False
+
+        self.assertEqual(
+            mongo_db_dump.locked_cp(
+                self.server, self.dmp_dir, stats=self.stats),
+            (True, self.msg))
+        self.assertEqual(self.stats, {})
+
+    @mock.patch("mongo_db_dump.parallel_cp",
+                mock.Mock(return_value=(False, None)))
+    def test_still_locked(self):
+
+        """Function:  test_still_locked
+
+        Description:  Test with the database still locked after the copy.
+
+        Arguments:
+
+        """
+
+        self.server.can_unlock = False
+
+        self.assertEqual(
+            mongo_db_dump.locked_cp(self.server, self.dmp_dir),
+            (True, self.msg2))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_budget_exceeded(self, mock_copy):
+
+        """Function:  test_budget_exceeded
+
+        Description:  Test with the copy running past the lock budget.
+
+        Arguments:
+
+        """
+
+        def slow_copy(src_dir, dst_dir, **kwargs):
+            kwargs["cancel"].wait(5)
+            return True, "Error:  Copy failed for file1: Copy cancelled"
+
+        mock_copy.side_effect = slow_copy
+
+        self.assertEqual(
+            mongo_db_dump.locked_cp(self.server, self.dmp_dir, budget=0.01),
+            (True, self.msg3))
+        self.assertFalse(self.server.locked)
+
+    @mock.patch("mongo_db_dump.copy_db_files",
+                mock.Mock(side_effect=ValueError("Bad zstd frame")))
+    def test_copy_raises(self):
+
+        """Function:  test_copy_raises
+
+        Description:  Test with the copy raising, the database is unlocked.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mongo_db_dump.locked_cp(
+                self.server, self.dmp_dir, stats=self.stats)
+
+        self.assertFalse(self.server.locked)
+        self.assertIn("unlocked", self.stats)
+
+    @mock.patch("mongo_db_dump.delta_cp")
+    def test_delta_copy(self, mock_delta):
+
+        """Function:  test_delta_copy
+
+        Description:  Test with a delta copy after a pre-copy.
+
+        Arguments:
+
+        """
+
+        mock_delta.return_value = (False, None)
+
+        self.assertEqual(
+            mongo_db_dump.locked_cp(
+                self.server, self.dmp_dir, snapshot=(0, ([], []))),
+            (False, None))
+        self.assertTrue(mock_delta.called)
+
+    @mock.patch("mongo_db_dump.archive_cp")
+    def test_archive(self, mock_arch):
+
+        """Function:  test_archive
+
+        Description:  Test with a copy into an archive.
+
+        Arguments:
+
+        """
+
+        mock_arch.return_value = (False, None)
+
+        self.assertEqual(
+            mongo_db_dump.locked_cp(self.server, self.dmp_dir, codec="zstd"),
+            (False, None))
+        self.assertEqual(
+            mock_arch.call_args.args[1], self.dmp_dir + ".tar.zst")
+
+    @mock.patch("mongo_db_dump.parallel_cp",
+                mock.Mock(return_value=(False, None)))
+    def test_copy(self):
+
+        """Function:  test_copy
+
+        Description:  Test with a successful locked copy.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.locked_cp(
+                self.server, self.dmp_dir, stats=self.stats), (False, None))
+        self.assertFalse(self.server.locked)
+        self.assertLessEqual(
+            self.stats["lock_acquired"], self.stats["unlocked"])
+
+
+if __name__ == "__main__":
+    unittest.main()
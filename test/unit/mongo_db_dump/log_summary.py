@@ -0,0 +1,128 @@
+# Classification (U)
+
+"""Program:  log_summary.py
+
+    Description:  Unit testing of LogSummary in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/log_summary.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_print
+        test_suppress
+        test_short_log
+        test_long_log
+
+    """
+
+    def test_print(self):
+
+        """Function:  test_print
+
+        Description:  Test with the lines printed as they are added.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.LogSummary()
+
+        with mock.patch("builtins.print") as mock_print:
+            summary.add("writing sales.coll\n")
+
+        mock_print.assert_called_once_with("writing sales.coll", flush=True)
+
+    def test_suppress(self):
+
+        """Function:  test_suppress
+
+        Description:  Test with standard out suppressed.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.LogSummary(True)
+
+        with mock.patch("builtins.print") as mock_print:
+            summary.add("writing sales.coll\n")
+
+        self.assertFalse(mock_print.called)
+        self.assertEqual(summary.lines(), ["writing sales.coll"])
+
+    def test_short_log(self):
+
+        """Function:  test_short_log
+
+        Description:  Test with all the lines of a short log kept.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.LogSummary(True)
+
+        for num in range(mongo_db_dump.LOG_HEAD_LINES
+                         + mongo_db_dump.LOG_TAIL_LINES):
+            summary.add(f"line {num}\n")
+
+        self.assertEqual(
+            summary.lines(),
+            [f"line {num}" for num in range(
+                mongo_db_dump.LOG_HEAD_LINES + mongo_db_dump.LOG_TAIL_LINES)])
+
+    def test_long_log(self):
+
+        """Function:  test_long_log
+
+        Description:  Test with the first and last lines of a long log kept.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.LogSummary(True)
+
+        for num in range(10000):
+            summary.add(f"line {num}\n")
+
+        lines = summary.lines()
+        skipped = 10000 - mongo_db_dump.LOG_HEAD_LINES \
+            - mongo_db_dump.LOG_TAIL_LINES
+
+        self.assertEqual(summary.count, 10000)
+        self.assertEqual(len(summary.tail), mongo_db_dump.LOG_TAIL_LINES)
+        self.assertEqual(lines[:2], ["line 0", "line 1"])
+        self.assertEqual(lines[mongo_db_dump.LOG_HEAD_LINES],
+                         f"... {skipped} log lines not shown ...")
+        self.assertEqual(lines[-1], "line 9999")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+# Classification (U)
+
+"""Program:  make_delta.py
+
+    Description:  Unit testing of make_delta in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/make_delta.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        rebuild
+        test_unchanged
+        test_changed_block
+        test_shifted_blocks
+        test_unaligned_insert
+        test_no_roll
+        test_roll_limit
+        test_appended
+        test_not_worth_storing
+        test_empty_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.base_file = os.path.join(self.dir_path, "base.wt")
+        self.src_file = os.path.join(self.dir_path, "src.wt")
+        self.delta_file = os.path.join(self.dir_path, "src.wt.cpdelta")
+        self.dst_file = os.path.join(self.dir_path, "dst.wt")
+        self.base = os.urandom(self.block_size * 16)
+        os.makedirs(self.dir_path)
+
+        with open(self.base_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.base)
+
+    def rebuild(self, src, max_roll=4096):
+
+        """Function:  rebuild
+
+        Description:  Writes the source file, its delta and rebuilds it.
+
+        Arguments:
+            (input) src -> Contents of the source file
+            (input) max_roll -> Number of bytes to roll the checksum
+            (output) Size of the delta file or None
+
+        """
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(src)
+
+        delta_size = mongo_db_dump.make_delta(
+            self.src_file, self.base_file, self.delta_file, self.block_size,
+            max_roll)
+
+        if delta_size:
+            mongo_db_dump.apply_delta(
+                self.delta_file, self.base_file, self.dst_file)
+
+            with open(self.dst_file, mode="rb") as f_hdlr:
+                self.assertEqual(f_hdlr.read(), src)
+
+        return delta_size
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with a file the same as the base file.
+
+        Arguments:
+
+        """
+
+        self.assertLess(self.rebuild(self.base), 100)
+
+    def test_changed_block(self):
+
+        """Function:  test_changed_block
+
+        Description:  Test with one block changed.
+
+        Arguments:
+
+        """
+
+        src = self.base[:self.block_size * 5] + os.urandom(10) \
+            + self.base[self.block_size * 5 + 10:]
+
+        self.assertLess(self.rebuild(src), self.block_size + 200)
+
+    def test_shifted_blocks(self):
+
+        """Function:  test_shifted_blocks
+
+        Description:  Test with bytes inserted, blocks found by rolling.
+
+        Arguments:
+
+        """
+
+        src = self.base[:self.block_size * 5] + b"inserted" \
+            + self.base[self.block_size * 5:]
+
+        self.assertLess(self.rebuild(src), 200)
+
+    def test_unaligned_insert(self):
+
+        """Function:  test_unaligned_insert
+
+        Description:  Test with a run of bytes inserted longer than max_roll
+            and not a multiple of the block size.
+
+        Arguments:
+
+        """
+
+        src = self.base[:self.block_size * 5] + os.urandom(5000) \
+            + self.base[self.block_size * 5:]
+
+        self.assertLess(self.rebuild(src, 512), 5000 + 200)
+
+    def test_no_roll(self):
+
+        """Function:  test_no_roll
+
+        Description:  Test with bytes inserted and no rolling checksum.
+
+        Arguments:
+
+        """
+
+        src = self.base[:self.block_size * 12] + b"inserted" \
+            + self.base[self.block_size * 12:]
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(src)
+
+        self.assertGreater(
+            mongo_db_dump.make_delta(self.src_file, self.base_file,
+                                     self.delta_file, self.block_size, 0),
+            self.block_size * 4)
+
+    def test_roll_limit(self):
+
+        """Function:  test_roll_limit
+
+        Description:  Test with bytes inserted past the roll limit, only
+            block aligned offsets are checked.
+
+        Arguments:
+
+        """
+
+        src = self.base[:self.block_size * 12] + os.urandom(5000) \
+            + self.base[self.block_size * 12:]
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(src)
+
+        self.assertGreater(
+            mongo_db_dump.make_delta(self.src_file, self.base_file,
+                                     self.delta_file, self.block_size,
+                                     roll_limit=1000),
+            self.block_size * 4)
+
+    def test_appended(self):
+
+        """Function:  test_appended
+
+        Description:  Test with data appended to the base file.
+
+        Arguments:
+
+        """
+
+        self.assertLess(self.rebuild(self.base + b"x" * 1000), 1200)
+
+    def test_not_worth_storing(self):
+
+        """Function:  test_not_worth_storing
+
+        Description:  Test with a file mostly different from the base file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.rebuild(os.urandom(self.block_size * 16)))
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty file.
+
+        Arguments:
+
+        """
+
+        self.assertGreater(self.rebuild(b""), 0)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
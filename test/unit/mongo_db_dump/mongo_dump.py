@@ -151,6 +151,20 @@ class UnitTest(unittest.TestCase):
         test_missing_value
         test_missing_option
         test_failure
+        test_bad_procs
+        test_single_proc
+        test_default_procs
+        test_oplog
+        test_parallel
+        test_users_roles
+        test_parallel_collections
+        test_database_no_procs
+        test_bad_num_parallel
+        test_num_parallel
+        test_auto_parallel
+        test_bad_codec
+        test_bad_level
+        test_archive
         test_db_dump
 
     """
@@ -220,6 +234,293 @@ class UnitTest(unittest.TestCase):
             (mongo_db_dump.mongo_dump(self.server, self.args)),
             (True, "Error Message"))
 
+    def test_bad_procs(self):
+
+        """Function:  test_bad_procs
+
+        Description:  Test with -P option not a positive integer.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = "0"
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)),
+            (True, "Error:  -P option requires a positive integer."))
+
+    @mock.patch("mongo_db_dump.get_db_list")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_single_proc(self, mock_cmd, mock_list):
+
+        """Function:  test_single_proc
+
+        Description:  Test with -P 1, a single mongodump for the instance.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-P": "1"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertFalse(mock_list.called)
+        self.assertNotIn("dump_list", mock_cmd.call_args.kwargs)
+
+    @mock.patch("mongo_db_dump.get_db_list")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_default_procs(self, mock_cmd, mock_list):
+
+        """Function:  test_default_procs
+
+        Description:  Test without -P option, a single mongodump for the
+            instance.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertFalse(mock_list.called)
+        self.assertNotIn("dump_list", mock_cmd.call_args.kwargs)
+
+    @mock.patch("mongo_db_dump.get_db_list")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_oplog(self, mock_cmd, mock_list):
+
+        """Function:  test_oplog
+
+        Description:  Test with -l option, a single mongodump for the
+            instance.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-P": "4", "-l": True}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertFalse(mock_list.called)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db2", "db1"]))
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_parallel(self, mock_cmd):
+
+        """Function:  test_parallel
+
+        Description:  Test with one mongodump per database.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-P": "3"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertEqual(mock_cmd.call_args.kwargs["dump_list"],
+                         ["--db=db2", "--db=db1"])
+        self.assertEqual(mock_cmd.call_args.kwargs["procs"], 3)
+
+    @mock.patch("mongo_db_dump.get_coll_list")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_users_roles(self, mock_cmd, mock_list):
+
+        """Function:  test_users_roles
+
+        Description:  Test with -b and -r options, a single mongodump for the
+            database.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {
+            "-o": "/directory/path", "-b": "sales", "-r": True}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertFalse(mock_list.called)
+
+    @mock.patch("mongo_db_dump.get_coll_list",
+                mock.Mock(return_value=["large", "small"]))
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_parallel_collections(self, mock_cmd):
+
+        """Function:  test_parallel_collections
+
+        Description:  Test with one mongodump per collection of -b database.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-b": "sales",
+                                "-P": "2"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertEqual(mock_cmd.call_args.kwargs["dump_list"],
+                         ["--collection=large", "--collection=small"])
+
+    @mock.patch("mongo_db_dump.get_coll_list")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_database_no_procs(self, mock_cmd, mock_list):
+
+        """Function:  test_database_no_procs
+
+        Description:  Test with -b database and no -P option, a single
+            mongodump for the database.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-b": "sales"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertFalse(mock_list.called)
+        self.assertNotIn("dump_list", mock_cmd.call_args.kwargs)
+
+    def test_bad_num_parallel(self):
+
+        """Function:  test_bad_num_parallel
+
+        Description:  Test with -N option not a positive integer or auto.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-N"] = "fast"
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)),
+            (True, "Error:  -N option requires a positive integer or auto."))
+
+    @mock.patch("mongo_db_dump.auto_parallel")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_num_parallel(self, mock_cmd, mock_auto):
+
+        """Function:  test_num_parallel
+
+        Description:  Test with -N option set to a number.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-N"] = "8"
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertEqual(mock_cmd.call_args.kwargs["num_parallel"], 8)
+        self.assertFalse(mock_auto.called)
+
+    @mock.patch("mongo_db_dump.get_db_list",
+                mock.Mock(return_value=["db2", "db1"]))
+    @mock.patch("mongo_db_dump.auto_parallel", mock.Mock(return_value=2))
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_auto_parallel(self, mock_cmd):
+
+        """Function:  test_auto_parallel
+
+        Description:  Test with -N auto option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-P": "3",
+                                "-N": "auto"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)), (False, None))
+        self.assertEqual(mock_cmd.call_args.kwargs["num_parallel"], 2)
+        mongo_db_dump.auto_parallel.assert_called_once_with(
+            self.server, self.args, 3)
+
+    def test_bad_codec(self):
+
+        """Function:  test_bad_codec
+
+        Description:  Test with -Z option not a codec.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Z"] = "bzip2"
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args)),
+            (True, "Error:  -Z option must be one of: gzip, zstd, none"))
+
+    def test_bad_level(self):
+
+        """Function:  test_bad_level
+
+        Description:  Test with dump_level not an integer.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Z"] = "gzip"
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args,
+                                      cfg=mock.Mock(dump_level="high"))),
+            (True, "Error:  dump_level must be an integer or None."))
+
+    @mock.patch("mongo_db_dump.get_db_list")
+    @mock.patch("mongo_db_dump.mongo_generic")
+    def test_archive(self, mock_cmd, mock_list):
+
+        """Function:  test_archive
+
+        Description:  Test with -Z option, a single mongodump archive.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-o": "/directory/path", "-P": "4",
+                                "-Z": "gzip"}
+        mock_cmd.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_dump(self.server, self.args,
+                                      cfg=mock.Mock(dump_level=9))),
+            (False, None))
+        self.assertFalse(mock_list.called)
+        self.assertNotIn("dump_list", mock_cmd.call_args.kwargs)
+
+        archive = mock_cmd.call_args.kwargs["archive"]
+
+        self.assertTrue(
+            archive["arch_file"].startswith("/directory/path/dump_"))
+        self.assertTrue(archive["arch_file"].endswith(".archive.gz"))
+        self.assertEqual(archive["codec"], "gzip")
+        self.assertEqual(archive["level"], 9)
+
     @mock.patch("mongo_db_dump.mongo_generic")
     def test_db_dump(self, mock_cmd):
 
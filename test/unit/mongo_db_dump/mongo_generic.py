@@ -16,6 +16,9 @@
 # Standard
 import sys
 import os
+import io
+import gzip
+import json
 import unittest
 import mock
 
@@ -37,6 +40,7 @@ class ArgParser():                                      # pylint:disable=R0903
     Methods:
         __init__
         arg_exist
+        get_val
 
     """
 
@@ -64,6 +68,18 @@ class ArgParser():                                      # pylint:disable=R0903
 
         return arg in self.args_array
 
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
 
 class Mail():
 
@@ -142,6 +158,8 @@ class SubProcess():
 
         """
 
+        self.stderr = io.BytesIO()
+
     def wait(self):
 
         """Method:  wait
@@ -181,6 +199,7 @@ class Server():
 
     Methods:
         __init__
+        adm_cmd
         lock_db
         is_locked
         unlock_db
@@ -201,6 +220,19 @@ class Server():
         self.locked = False
         self.japd = "JAPD"
 
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+            (input) cmd -> Database command
+
+        """
+
+        return {"cmd": cmd, "databases": []}
+
     def lock_db(self, lock):
 
         """Method:  lock_db
@@ -255,6 +287,15 @@ class UnitTest(unittest.TestCase):
         test_log_file
         test_empty_log
         test_export
+        test_page_cache
+        test_no_drop_cache
+        test_parallel
+        test_num_parallel
+        test_num_parallel_failed
+        test_progress
+        test_archive
+        test_archive_none
+        test_archive_failure
         test_db_dump
         tearDown
 
@@ -283,12 +324,13 @@ class UnitTest(unittest.TestCase):
         self.args2.args_array = {"-p": "DirectoryPath2", "-x": True}
         self.file_list = ["2020-08-14T14:31:12 writing sysmon.mysql_perf to",
                           "2020-08-14T14:31:12 writing sysmon.mongo_rep to"]
+        self.log_data = "".join(line + "\n" for line in self.file_list)
         self.file_list2 = ["Error detected in dump"]
         e_file = self.dir_path + "/log_file.err"
         self.msg = f"Error detected in error file: {e_file}"
 
     @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, False]))
+                mock.Mock(return_value=False))
     @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
@@ -304,7 +346,8 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.side_effect = [self.file_list, self.file_list2]
+        mock_file.return_value = self.file_list2
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         with gen_libs.no_std_out():
             mongo_db_dump.mongo_generic(
@@ -314,7 +357,7 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(self.mail.msg, self.file_list2[0])
 
     @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, False]))
+                mock.Mock(return_value=False))
     @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
@@ -330,7 +373,8 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.side_effect = [self.file_list, self.file_list2]
+        mock_file.return_value = self.file_list2
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         with gen_libs.no_std_out():
             self.assertEqual(
@@ -339,7 +383,7 @@ class UnitTest(unittest.TestCase):
                     self.log_file, mail=self.mail), (True, self.msg))
 
     @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, False]))
+                mock.Mock(return_value=False))
     @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
@@ -355,7 +399,8 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.side_effect = [self.file_list, self.file_list2]
+        mock_file.return_value = self.file_list2
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         with gen_libs.no_std_out():
             self.assertEqual(
@@ -383,12 +428,9 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.cmd_name2, self.log_file),
             (False, None))
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, True]))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
-    def test_mail_log_suppress(self, mock_cmd, mock_subp, mock_file):
+    def test_mail_log_suppress(self, mock_cmd, mock_subp):
 
         """Function:  test_mail_log_suppress
 
@@ -400,7 +442,7 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.return_value = self.file_list
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         with gen_libs.no_std_out():
             self.assertEqual(
@@ -410,12 +452,9 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(self.mail.msg, self.file_list[1])
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, True]))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
-    def test_log_file_suppress(self, mock_cmd, mock_subp, mock_file):
+    def test_log_file_suppress(self, mock_cmd, mock_subp):
 
         """Function:  test_log_file_suppress
 
@@ -427,7 +466,7 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.return_value = self.file_list
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         self.assertEqual(
             mongo_db_dump.mongo_generic(
@@ -456,12 +495,9 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(self.mail.msg, "")
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, True]))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
-    def test_mail_log_file(self, mock_cmd, mock_subp, mock_file):
+    def test_mail_log_file(self, mock_cmd, mock_subp):
 
         """Function:  test_mail_log_file
 
@@ -473,7 +509,7 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.return_value = self.file_list
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         with gen_libs.no_std_out():
             self.assertEqual(
@@ -483,12 +519,9 @@ class UnitTest(unittest.TestCase):
 
         self.assertEqual(self.mail.msg, self.file_list[1])
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(side_effect=[False, True]))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
-    def test_log_file(self, mock_cmd, mock_subp, mock_file):
+    def test_log_file(self, mock_cmd, mock_subp):
 
         """Function:  test_log_file
 
@@ -500,7 +533,7 @@ class UnitTest(unittest.TestCase):
 
         mock_cmd.return_value = "DumpCommand"
         mock_subp.return_value = self.subp
-        mock_file.return_value = self.file_list
+        self.subp.stderr = io.BytesIO(self.log_data.encode())
 
         with gen_libs.no_std_out():
             self.assertEqual(
@@ -508,6 +541,9 @@ class UnitTest(unittest.TestCase):
                     self.server, self.args, self.cmd_name,
                     self.log_file), (False, None))
 
+        with open(self.log_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.log_data)
+
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
     def test_empty_log(self, mock_cmd, mock_subp):
@@ -548,6 +584,273 @@ class UnitTest(unittest.TestCase):
                 self.server, self.args, self.cmd_name2, self.log_file),
             (False, None))
 
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_page_cache(self, mock_cmd, mock_subp):
+
+        """Function:  test_page_cache
+
+        Description:  Test with the dump files dropped from the page cache.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = "DumpCommand"
+        mock_subp.return_value = self.subp
+        self.args2.args_array["-o"] = self.dir_path
+
+        self.assertEqual(
+            mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                mail=self.mail), (False, None))
+        self.assertTrue(self.mail.msg.startswith("Page cache:  {"))
+        self.assertIn('"written_dropped": 0', self.mail.msg)
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_no_drop_cache(self, mock_cmd, mock_subp):
+
+        """Function:  test_no_drop_cache
+
+        Description:  Test with drop_cache set to False.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = "DumpCommand"
+        mock_subp.return_value = self.subp
+        self.args2.args_array["-o"] = self.dir_path
+
+        self.assertEqual(
+            mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                mail=self.mail,
+                cfg=mock.Mock(drop_cache=False, prom_textfile_dir=None)),
+            (False, None))
+        self.assertEqual(self.mail.msg, "")
+
+    @mock.patch("mongo_db_dump.run_cmd")
+    @mock.patch("mongo_db_dump.parallel_dump")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_parallel(self, mock_cmd, mock_parallel, mock_run):
+
+        """Function:  test_parallel
+
+        Description:  Test with one command run per database.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump"]
+
+        def write_files(                                # pylint:disable=R0913
+                server, cmd, dump_list, log_file, err_file, procs, line_func):
+            for f_name in [log_file, err_file]:
+                open(f_name, mode="w", encoding="UTF-8").close()
+
+        mock_parallel.side_effect = write_files
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_generic(
+                self.server, self.args, self.cmd_name, self.log_file,
+                dump_list=["--db=db2", "--db=db1"], procs=2)), (False, None))
+        mock_parallel.assert_called_once_with(
+            self.server, ["mongodump"], ["--db=db2", "--db=db1"],
+            self.log_file, self.log_file + ".err", 2, mock.ANY)
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("mongo_db_dump.save_tuning")
+    @mock.patch("mongo_db_dump.run_cmd")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_num_parallel(self, mock_cmd, mock_run, mock_save):
+
+        """Function:  test_num_parallel
+
+        Description:  Test with --numParallelCollections added and the run
+            recorded.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump"]
+
+        def write_files(server, cmd, log_file, err_file, line_func):
+            for f_name in [log_file, err_file]:
+                open(f_name, mode="w", encoding="UTF-8").close()
+
+        mock_run.side_effect = write_files
+        self.args2.args_array["-o"] = self.dir_path
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                num_parallel=3)), (False, None))
+        self.assertEqual(mock_run.call_args.args[1],
+                         ["mongodump", "--numParallelCollections=3"])
+        self.assertEqual(mock_save.call_args.args[0], self.dir_path)
+        self.assertEqual(mock_save.call_args.args[1]["num_parallel"], 3)
+        self.assertEqual(mock_save.call_args.args[1]["procs"], 1)
+
+    @mock.patch("mongo_db_dump.save_tuning")
+    @mock.patch("mongo_db_dump.run_cmd")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_num_parallel_failed(self, mock_cmd, mock_run, mock_save):
+
+        """Function:  test_num_parallel_failed
+
+        Description:  Test with a failed run not recorded.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump"]
+
+        def write_files(server, cmd, log_file, err_file, line_func):
+            for f_name in [log_file, err_file]:
+                open(f_name, mode="w", encoding="UTF-8").close()
+
+            return 1
+
+        mock_run.side_effect = write_files
+        self.args2.args_array["-o"] = self.dir_path
+
+        self.assertEqual(
+            (mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                num_parallel=3)), (False, None))
+        self.assertFalse(mock_save.called)
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_progress(self, mock_cmd, mock_subp):
+
+        """Function:  test_progress
+
+        Description:  Test with the progress lines written as JSON lines and
+            a Prometheus textfile.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump"]
+        mock_subp.return_value = self.subp
+        self.subp.stderr = io.BytesIO(
+            b"2025-01-01T10:00:00.000+0000\t[##..............]  sales.orders"
+            b"  100/1000  (10.0%)\n")
+        prom_file = os.path.join(self.dir_path, "mongo_db_dump_mongodump.prom")
+
+        self.assertEqual(
+            mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                cfg=mock.Mock(drop_cache=False,
+                              prom_textfile_dir=self.dir_path)),
+            (False, None))
+
+        with open(self.log_file + ".progress.jsonl", mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.loads(f_hdlr.read())["docs"], 100)
+
+        with open(prom_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertIn('mongo_dump_running{program="mongodump"} 0',
+                          f_hdlr.read())
+
+        os.remove(prom_file)
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_archive(self, mock_cmd, mock_subp):
+
+        """Function:  test_archive
+
+        Description:  Test with mongodump writing a compressed archive.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump", "--out=" + self.dir_path]
+        mock_subp.return_value = self.subp
+        self.subp.stdout = io.BytesIO(b"archive data")
+        archive = {"arch_file": self.log_file + ".archive.gz",
+                   "codec": "gzip", "level": None, "threads": 2, "stats": {}}
+
+        self.assertEqual(
+            mongo_db_dump.mongo_generic(
+                self.server, self.args, self.cmd_name, self.log_file,
+                mail=self.mail, archive=archive), (False, None))
+        self.assertEqual(mock_subp.call_args.args[0],
+                         ["mongodump", "--archive"])
+        self.assertTrue(self.mail.msg.startswith("Archive:  {"))
+
+        with gzip.open(archive["arch_file"], mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"archive data")
+
+    @mock.patch("mongo_db_dump.compress_stream")
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_archive_none(self, mock_cmd, mock_subp, mock_compress):
+
+        """Function:  test_archive_none
+
+        Description:  Test with mongodump's archive spliced to the file as
+            is.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump"]
+        mock_subp.return_value = self.subp
+        fd_in, fd_out = os.pipe()
+        os.write(fd_out, b"archive data")
+        os.close(fd_out)
+        self.subp.stdout = os.fdopen(fd_in, mode="rb")
+        archive = {"arch_file": self.log_file + ".archive", "codec": "none",
+                   "stats": {}}
+
+        self.assertEqual(
+            mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                archive=archive), (False, None))
+        self.subp.stdout.close()
+        self.assertFalse(mock_compress.called)
+
+        with open(archive["arch_file"], mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"archive data")
+
+    @mock.patch("mongo_db_dump.compress_stream",
+                mock.Mock(side_effect=OSError("No space left on device")))
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
+    def test_archive_failure(self, mock_cmd, mock_subp):
+
+        """Function:  test_archive_failure
+
+        Description:  Test with the compressed archive not written.
+
+        Arguments:
+
+        """
+
+        mock_cmd.return_value = ["mongodump"]
+        mock_subp.return_value = mock.Mock(stderr=io.BytesIO())
+        archive = {"arch_file": self.log_file + ".archive.gz",
+                   "codec": "gzip", "stats": {}}
+
+        self.assertEqual(
+            mongo_db_dump.mongo_generic(
+                self.server, self.args2, self.cmd_name, self.log_file,
+                archive=archive),
+            (True, f"Error:  Unable to write {archive['arch_file']}:"
+             f" No space left on device"))
+        self.assertTrue(mock_subp.return_value.kill.called)
+
     @mock.patch("mongo_db_dump.subprocess.Popen")
     @mock.patch("mongo_db_dump.mongo_libs.create_cmd")
     def test_db_dump(self, mock_cmd, mock_subp):
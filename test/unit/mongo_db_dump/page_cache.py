@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  page_cache.py
+
+    Description:  Unit testing of PageCache in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/page_cache.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import mmap
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_resident
+        test_not_owner
+        test_release_all
+        test_release
+        test_release_grown
+        test_finish_removed
+        test_finish
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/cache"
+        self.f_name = os.path.join(self.dir_path, "collection-1.wt")
+        self.size = mmap.PAGESIZE * 4
+        os.makedirs(self.dir_path)
+
+        with open(self.f_name, mode="wb") as f_hdlr:
+            f_hdlr.write(os.urandom(self.size))
+
+    def test_resident(self):
+
+        """Function:  test_resident
+
+        Description:  Test with the file's resident page ranges returned.
+
+        Arguments:
+
+        """
+
+        page_cache = mongo_db_dump.PageCache()
+
+        for start, end in page_cache.resident(self.f_name):
+            self.assertTrue(0 <= start < end <= self.size)
+
+    @mock.patch("mongo_db_dump.os.access", mock.Mock(return_value=False))
+    @mock.patch("mongo_db_dump.os.geteuid", mock.Mock(return_value=54321))
+    @mock.patch("mongo_db_dump.get_resident")
+    def test_not_owner(self, mock_resident):
+
+        """Function:  test_not_owner
+
+        Description:  Test with a file not owned or writable, the whole file
+            is taken as cached.
+
+        Arguments:
+
+        """
+
+        page_cache = mongo_db_dump.PageCache()
+
+        self.assertEqual(page_cache.resident(self.f_name), [(0, self.size)])
+        self.assertFalse(mock_resident.called)
+
+    @mock.patch("mongo_db_dump.fadvise")
+    def test_release_all(self, mock_advise):
+
+        """Function:  test_release_all
+
+        Description:  Test with no resident ranges, the whole file dropped.
+
+        Arguments:
+
+        """
+
+        page_cache = mongo_db_dump.PageCache()
+        page_cache.release(self.f_name)
+
+        self.assertEqual(mock_advise.call_args.args[1:],
+                         (0, self.size, "POSIX_FADV_DONTNEED"))
+        self.assertEqual(page_cache.stats["read_dropped"], self.size)
+
+    @mock.patch("mongo_db_dump.fadvise")
+    def test_release(self, mock_advise):
+
+        """Function:  test_release
+
+        Description:  Test with the pages cached before the read kept.
+
+        Arguments:
+
+        """
+
+        page_cache = mongo_db_dump.PageCache()
+        page_cache.release(self.f_name, [(0, mmap.PAGESIZE),
+                                         (mmap.PAGESIZE * 3, self.size)])
+
+        self.assertEqual(
+            [item.args[1:3] for item in mock_advise.call_args_list],
+            [(mmap.PAGESIZE, mmap.PAGESIZE * 2)])
+        self.assertEqual(page_cache.stats["read_dropped"], mmap.PAGESIZE * 2)
+        self.assertEqual(page_cache.stats["read_kept"], mmap.PAGESIZE * 2)
+
+    @mock.patch("mongo_db_dump.fadvise")
+    def test_release_grown(self, mock_advise):
+
+        """Function:  test_release_grown
+
+        Description:  Test with the file grown since its resident ranges.
+
+        Arguments:
+
+        """
+
+        page_cache = mongo_db_dump.PageCache()
+        page_cache.release(self.f_name, [(0, mmap.PAGESIZE * 2)])
+
+        self.assertEqual(
+            [item.args[1:3] for item in mock_advise.call_args_list],
+            [(mmap.PAGESIZE * 2, mmap.PAGESIZE * 2)])
+
+    def test_finish_removed(self):
+
+        """Function:  test_finish_removed
+
+        Description:  Test with a written file removed before finish.
+
+        Arguments:
+
+        """
+
+        page_cache = mongo_db_dump.PageCache()
+        page_cache.written(self.f_name)
+        os.remove(self.f_name)
+
+        self.assertEqual(page_cache.finish()["written_dropped"], 0)
+
+    @mock.patch("mongo_db_dump.get_cached")
+    def test_finish(self, mock_cached):
+
+        """Function:  test_finish
+
+        Description:  Test with the written files synced and dropped.
+
+        Arguments:
+
+        """
+
+        mock_cached.side_effect = [1048576, 524288]
+        page_cache = mongo_db_dump.PageCache()
+        page_cache.written(self.f_name)
+
+        self.assertEqual(
+            page_cache.finish(),
+            {"read_kept": 0, "read_dropped": 0, "written_dropped": self.size,
+             "cached_before": 1048576, "cached_after": 524288})
+        self.assertEqual(page_cache.files, [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
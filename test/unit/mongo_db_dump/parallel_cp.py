@@ -0,0 +1,217 @@
+# Classification (U)
+
+"""Program:  parallel_cp.py
+
+    Description:  Unit testing of parallel_cp in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/parallel_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        compare_trees
+        test_copy_error
+        test_dst_exists
+        test_manifest
+        test_fan_out
+        test_multiple_threads
+        test_single_thread
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp"
+        self.src_dir = os.path.join(self.base_dir, "src_dir")
+        self.dst_dir = os.path.join(self.base_dir, "dst_dir")
+        self.files = ["collection-1.wt", "index-2.wt",
+                      os.path.join("journal", "WiredTigerLog.1")]
+        os.makedirs(os.path.join(self.src_dir, "journal"))
+
+        for cnt, name in enumerate(self.files):
+            with open(os.path.join(self.src_dir, name), mode="wb") as f_hdlr:
+                f_hdlr.write(os.urandom(1024 * (cnt + 1)))
+
+    def compare_trees(self):
+
+        """Function:  compare_trees
+
+        Description:  Compares the source and destination file contents.
+
+        Arguments:
+
+        """
+
+        for name in self.files:
+            with open(os.path.join(self.src_dir, name), mode="rb") as src, \
+                    open(os.path.join(self.dst_dir, name), mode="rb") as dst:
+                self.assertEqual(src.read(), dst.read())
+
+    @mock.patch("mongo_db_dump.cp_file",
+                mock.Mock(side_effect=OSError("Disk full")))
+    def test_copy_error(self):
+
+        """Function:  test_copy_error
+
+        Description:  Test with a file copy raising an error.
+
+        Arguments:
+
+        """
+
+        err_flag, err_msg = mongo_db_dump.parallel_cp(
+            self.src_dir, self.dst_dir, threads=1)
+
+        self.assertTrue(err_flag)
+        self.assertTrue(err_msg.startswith("Error:  Copy failed for "))
+
+    def test_dst_exists(self):
+
+        """Function:  test_dst_exists
+
+        Description:  Test with the destination directory already existing.
+
+        Arguments:
+
+        """
+
+        os.makedirs(self.dst_dir)
+
+        err_flag, err_msg = mongo_db_dump.parallel_cp(
+            self.src_dir, self.dst_dir, threads=2)
+
+        self.assertTrue(err_flag)
+        self.assertTrue(err_msg.startswith("Error:  Unable to setup copy"))
+
+    def test_manifest(self):
+
+        """Function:  test_manifest
+
+        Description:  Test with the files hashed while they are copied.
+
+        Arguments:
+
+        """
+
+        manifest = {}
+
+        self.assertEqual(
+            mongo_db_dump.parallel_cp(
+                self.src_dir, self.dst_dir, threads=2, manifest=manifest),
+            (False, None))
+        self.compare_trees()
+        self.assertEqual(sorted(manifest), sorted(self.files))
+
+        for name in self.files:
+            self.assertEqual(
+                manifest[name]["digest"],
+                mongo_db_dump.file_digest(os.path.join(self.src_dir, name)))
+
+    def test_fan_out(self):
+
+        """Function:  test_fan_out
+
+        Description:  Test with the tree written to two destinations.
+
+        Arguments:
+
+        """
+
+        dst_dir = self.dst_dir
+        fan_out_dir = os.path.join(self.base_dir, "dst_dir2")
+
+        try:
+            self.assertEqual(
+                mongo_db_dump.parallel_cp(
+                    self.src_dir, self.dst_dir, threads=2,
+                    fan_out_dirs=[fan_out_dir]), (False, None))
+            self.compare_trees()
+            self.dst_dir = fan_out_dir
+            self.compare_trees()
+
+        finally:
+            self.dst_dir = dst_dir
+            shutil.rmtree(fan_out_dir, ignore_errors=True)
+
+    def test_multiple_threads(self):
+
+        """Function:  test_multiple_threads
+
+        Description:  Test with multiple copy threads.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.parallel_cp(self.src_dir, self.dst_dir, threads=4),
+            (False, None))
+        self.compare_trees()
+
+    def test_single_thread(self):
+
+        """Function:  test_single_thread
+
+        Description:  Test with a single copy thread.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.parallel_cp(self.src_dir, self.dst_dir),
+            (False, None))
+        self.compare_trees()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.src_dir, ignore_errors=True)
+        shutil.rmtree(self.dst_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
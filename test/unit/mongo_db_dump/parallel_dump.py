@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  parallel_dump.py
+
+    Description:  Unit testing of parallel_dump in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/parallel_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.japd = "JAPD"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cmd_failure
+        test_parallel_dump
+        test_line_func
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/parallel_dump"
+        self.log_file = os.path.join(self.dir_path, "dump_20250101_010000.log")
+        self.err_file = os.path.join(self.dir_path, "dump_20250101_010000.err")
+        self.cmd = ["/opt/mongo/bin/mongodump", "--out=" + self.dir_path]
+        self.codes = {"sales": 0, "admin": 0}
+        os.makedirs(self.dir_path)
+
+        def run_cmd(server, cmd, log_file, err_file, line_func):
+            name = cmd[-1].split("=")[1]
+
+            if line_func:
+                line_func(f"writing {name}.coll\n")
+
+            with open(log_file, mode="w", encoding="UTF-8") as f_hdlr:
+                f_hdlr.write(f"writing {name}.coll\n")
+
+            with open(err_file, mode="w", encoding="UTF-8") as f_hdlr:
+                f_hdlr.write("")
+
+            return self.codes[name]
+
+        self.run_cmd = run_cmd
+
+    @mock.patch("mongo_db_dump.run_cmd")
+    def test_cmd_failure(self, mock_run):
+
+        """Function:  test_cmd_failure
+
+        Description:  Test with a command exiting with an error.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = self.run_cmd
+        self.codes["admin"] = 1
+        mongo_db_dump.parallel_dump(
+            self.server, self.cmd, ["--db=sales", "--db=admin"], self.log_file,
+            self.err_file, 2)
+
+        with open(self.err_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(
+                f_hdlr.read(),
+                "mongodump --db=admin exited with return code 1\n")
+
+    @mock.patch("mongo_db_dump.run_cmd")
+    def test_parallel_dump(self, mock_run):
+
+        """Function:  test_parallel_dump
+
+        Description:  Test with the logs combined in database order.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = self.run_cmd
+        mongo_db_dump.parallel_dump(
+            self.server, self.cmd, ["--db=sales", "--db=admin"], self.log_file,
+            self.err_file, 2)
+
+        self.assertEqual(
+            [item.args[1] for item in mock_run.call_args_list],
+            [self.cmd + ["--db=sales"], self.cmd + ["--db=admin"]])
+
+        with open(self.log_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(f_hdlr.read(),
+                             "writing sales.coll\nwriting admin.coll\n")
+
+        self.assertEqual(
+            sorted(os.listdir(self.dir_path)),
+            ["dump_20250101_010000.err", "dump_20250101_010000.log"])
+
+    @mock.patch("mongo_db_dump.run_cmd")
+    def test_line_func(self, mock_run):
+
+        """Function:  test_line_func
+
+        Description:  Test with the log lines passed to line_func.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = self.run_cmd
+        lines = []
+        mongo_db_dump.parallel_dump(
+            self.server, self.cmd, ["--db=sales", "--db=admin"], self.log_file,
+            self.err_file, 1, lines.append)
+
+        self.assertEqual(
+            lines, ["writing sales.coll\n", "writing admin.coll\n"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
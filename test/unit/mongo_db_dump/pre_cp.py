@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  pre_cp.py
+
+    Description:  Unit testing of pre_cp in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/pre_cp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_walk_error
+        test_copy_error
+        test_pre_copy
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.src_dir = "Database_Directory_Path"
+        self.dst_dir = "DirectoryPath/cp_dump_20250101_0100"
+        self.cp_list = (["journal"], [("collection-1.wt", 10, 1600000000)])
+        self.msg = "Error:  Copy failed for collection-1.wt: Disk full"
+
+    @mock.patch("mongo_db_dump.get_cp_files",
+                mock.Mock(side_effect=PermissionError("Permission denied")))
+    def test_walk_error(self):
+
+        """Function:  test_walk_error
+
+        Description:  Test with an error walking the source directory.
+
+        Arguments:
+
+        """
+
+        err_flag, err_msg, snapshot = mongo_db_dump.pre_cp(
+            self.src_dir, self.dst_dir)
+
+        self.assertTrue(err_flag)
+        self.assertTrue(err_msg.startswith("Error:  Unable to setup copy"))
+        self.assertIsNone(snapshot)
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    @mock.patch("mongo_db_dump.get_cp_files")
+    def test_copy_error(self, mock_files, mock_copy):
+
+        """Function:  test_copy_error
+
+        Description:  Test with an error during the copy.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.cp_list
+        mock_copy.return_value = (True, self.msg)
+
+        self.assertEqual(
+            mongo_db_dump.pre_cp(self.src_dir, self.dst_dir)[:2],
+            (True, self.msg))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    @mock.patch("mongo_db_dump.get_cp_files")
+    def test_pre_copy(self, mock_files, mock_copy):
+
+        """Function:  test_pre_copy
+
+        Description:  Test with a successful pre-copy.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.cp_list
+        mock_copy.return_value = (False, None)
+
+        err_flag, err_msg, snapshot = mongo_db_dump.pre_cp(
+            self.src_dir, self.dst_dir, threads=2)
+
+        self.assertEqual((err_flag, err_msg), (False, None))
+        self.assertEqual(snapshot[1], self.cp_list)
+        self.assertTrue(mock_copy.call_args.kwargs["missing_ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
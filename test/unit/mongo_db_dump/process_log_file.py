@@ -82,6 +82,8 @@ class UnitTest(unittest.TestCase):
         test_mail_log_file
         test_log_file
         test_empty_log
+        test_long_log
+        test_summary
         tearDown
 
     """
@@ -102,10 +104,10 @@ class UnitTest(unittest.TestCase):
         self.file_list = ["2020-08-14T14:31:12 writing sysmon.mysql_perf to",
                           "2020-08-14T14:31:12 writing sysmon.mongo_rep to"]
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(return_value=False))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
-    def test_no_suppress(self, mock_file):
+        with open(self.log_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("".join(line + "\n" for line in self.file_list))
+
+    def test_no_suppress(self):
 
         """Function:  test_no_suppress
 
@@ -115,16 +117,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_file.return_value = self.file_list
-
         with gen_libs.no_std_out():
             self.assertFalse(
                 mongo_db_dump.process_log_file(self.log_file, False, None))
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(return_value=False))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
-    def test_mail_log_suppress(self, mock_file):
+    def test_mail_log_suppress(self):
 
         """Function:  test_mail_log_suppress
 
@@ -134,16 +131,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_file.return_value = self.file_list
-
         mongo_db_dump.process_log_file(self.log_file, True, self.mail)
 
         self.assertEqual(self.mail.msg, self.file_list[1])
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(return_value=False))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
-    def test_log_file_suppress(self, mock_file):
+    def test_log_file_suppress(self):
 
         """Function:  test_log_file_suppress
 
@@ -153,15 +145,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_file.return_value = self.file_list
-
         self.assertFalse(
             mongo_db_dump.process_log_file(self.log_file, True, None))
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(return_value=False))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
-    def test_mail_log_file(self, mock_file):
+    def test_mail_log_file(self):
 
         """Function:  test_mail_log_file
 
@@ -171,16 +158,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_file.return_value = self.file_list
-
         mongo_db_dump.process_log_file(self.log_file, True, self.mail)
 
         self.assertEqual(self.mail.msg, self.file_list[1])
 
-    @mock.patch("mongo_db_dump.gen_libs.is_empty_file",
-                mock.Mock(return_value=False))
-    @mock.patch("mongo_db_dump.gen_libs.file_2_list")
-    def test_log_file(self, mock_file):
+    def test_log_file(self):
 
         """Function:  test_log_file
 
@@ -190,8 +172,6 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_file.return_value = self.file_list
-
         self.assertFalse(
             mongo_db_dump.process_log_file(self.log_file, True, None))
 
@@ -210,6 +190,66 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mongo_db_dump.process_log_file(self.log_file, True, None))
 
+    def test_long_log(self):
+
+        """Function:  test_long_log
+
+        Description:  Test with only the first and last lines of a long log
+            mailed.
+
+        Arguments:
+
+        """
+
+        mail = mock.Mock()
+
+        with open(self.log_file, mode="w", encoding="UTF-8") as f_hdlr:
+            for num in range(1000):
+                f_hdlr.write(f"line {num}\n")
+
+        mongo_db_dump.process_log_file(self.log_file, True, mail)
+
+        lines = [item.args[0] for item in mail.add_2_msg.call_args_list]
+
+        self.assertEqual(len(lines), mongo_db_dump.LOG_HEAD_LINES
+                         + mongo_db_dump.LOG_TAIL_LINES + 1)
+        self.assertEqual(lines[0], "line 0")
+        self.assertEqual(lines[mongo_db_dump.LOG_HEAD_LINES],
+                         "... 875 log lines not shown ...")
+        self.assertEqual(lines[-1], "line 999")
+
+    def test_summary(self):
+
+        """Function:  test_summary
+
+        Description:  Test with the log already read into a LogSummary.
+
+        Arguments:
+
+        """
+
+        summary = mongo_db_dump.LogSummary(True)
+        summary.add("writing sales.coll\n")
+        os.remove(self.log_file)
+
+        mongo_db_dump.process_log_file(self.log_file, True, self.mail,
+                                       summary)
+
+        self.assertEqual(self.mail.msg, "writing sales.coll")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.log_file):
+            os.remove(self.log_file)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  rebuild_dump.py
+
+    Description:  Unit testing of rebuild_dump in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/rebuild_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_rebuild_failure
+        test_rebuild_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.dumps = [os.path.join(self.base_dir, "cp_dump_2025010" + str(num)
+                                   + "_0100") for num in range(1, 4)]
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        self.data = {}
+        data = {name: os.urandom(self.block_size * 16)
+                for name in self.files}
+
+        for num, dmp_dir in enumerate(self.dumps):
+            os.makedirs(os.path.join(dmp_dir, "journal"))
+
+            for name in self.files:
+                data[name] = data[name][:self.block_size * num] \
+                    + os.urandom(self.block_size) \
+                    + data[name][self.block_size * (num + 1):]
+                self.data[(dmp_dir, name)] = data[name]
+
+                with open(os.path.join(dmp_dir, name), mode="wb") as f_hdlr:
+                    f_hdlr.write(data[name])
+
+        self.dst_dir = os.path.join(self.base_dir, "db_path")
+        mongo_db_dump.delta_store(self.dumps[0], self.dumps[1],
+                                  block_size=self.block_size)
+        mongo_db_dump.delta_store(self.dumps[1], self.dumps[2],
+                                  block_size=self.block_size)
+        os.makedirs(self.dst_dir)
+
+    def test_rebuild_failure(self):
+
+        """Function:  test_rebuild_failure
+
+        Description:  Test with a delta file which cannot be applied.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dumps[2], self.files[1]),
+                  mode="r+b") as f_hdlr:
+            f_hdlr.write(b"changed")
+
+        err_flag, err_msg = mongo_db_dump.rebuild_dump(
+            self.dumps[0], self.dst_dir)
+
+        self.assertTrue(err_flag)
+        self.assertIn(f"Rebuild failed for {self.files[1]}", err_msg)
+
+    def test_rebuild_dump(self):
+
+        """Function:  test_rebuild_dump
+
+        Description:  Test with every file of the oldest dump rebuilt.
+
+        Arguments:
+
+        """
+
+        stats = {}
+
+        self.assertEqual(
+            mongo_db_dump.rebuild_dump(self.dumps[0] + "/", self.dst_dir,
+                                       threads=2, stats=stats),
+            (False, None))
+        self.assertEqual(stats, {"files": 2, "bytes": self.block_size * 32})
+        self.assertEqual(sorted(os.listdir(self.dst_dir)),
+                         ["collection-1.wt", "journal"])
+
+        for name in self.files:
+            with open(os.path.join(self.dst_dir, name), mode="rb") as f_hdlr:
+                self.assertEqual(f_hdlr.read(),
+                                 self.data[(self.dumps[0], name)])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.base_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# Classification (U)
+
+"""Program:  rebuild_file.py
+
+    Description:  Unit testing of rebuild_file in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/rebuild_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_full_file
+        test_one_delta
+        test_delta_chain
+        test_missing_base
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_dir = "./test/unit/mongo_db_dump/tmp/delta"
+        self.block_size = 4096
+        self.dumps = [os.path.join(self.base_dir, "cp_dump_2025010" + str(num)
+                                   + "_0100") for num in range(1, 4)]
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        self.data = {}
+        data = {name: os.urandom(self.block_size * 16)
+                for name in self.files}
+
+        for num, dmp_dir in enumerate(self.dumps):
+            os.makedirs(os.path.join(dmp_dir, "journal"))
+
+            for name in self.files:
+                data[name] = data[name][:self.block_size * num] \
+                    + os.urandom(self.block_size) \
+                    + data[name][self.block_size * (num + 1):]
+                self.data[(dmp_dir, name)] = data[name]
+
+                with open(os.path.join(dmp_dir, name), mode="wb") as f_hdlr:
+                    f_hdlr.write(data[name])
+
+        self.dst_file = os.path.join(self.base_dir, "rebuilt.wt")
+
+    def test_full_file(self):
+
+        """Function:  test_full_file
+
+        Description:  Test with a file not stored as a delta.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.rebuild_file(self.dumps[2], self.files[0],
+                                   self.dst_file)
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(),
+                             self.data[(self.dumps[2], self.files[0])])
+
+    def test_one_delta(self):
+
+        """Function:  test_one_delta
+
+        Description:  Test with a delta against a full file.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.delta_store(self.dumps[1], self.dumps[2],
+                                  block_size=self.block_size)
+
+        self.assertEqual(
+            mongo_db_dump.rebuild_file(self.dumps[1], self.files[0],
+                                       self.dst_file), self.block_size * 16)
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(),
+                             self.data[(self.dumps[1], self.files[0])])
+
+    def test_delta_chain(self):
+
+        """Function:  test_delta_chain
+
+        Description:  Test with a delta against a delta.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.delta_store(self.dumps[0], self.dumps[1],
+                                  block_size=self.block_size)
+        mongo_db_dump.delta_store(self.dumps[1], self.dumps[2],
+                                  block_size=self.block_size)
+        mongo_db_dump.rebuild_file(self.dumps[0], self.files[1],
+                                   self.dst_file)
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(),
+                             self.data[(self.dumps[0], self.files[1])])
+
+        self.assertEqual(sorted(os.listdir(self.base_dir)),
+                         sorted([os.path.basename(item)
+                                 for item in self.dumps] + ["rebuilt.wt"]))
+
+    def test_missing_base(self):
+
+        """Function:  test_missing_base
+
+        Description:  Test with the base dump removed.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.delta_store(self.dumps[1], self.dumps[2],
+                                  block_size=self.block_size)
+        shutil.rmtree(self.dumps[2])
+
+        with self.assertRaises(FileNotFoundError):
+            mongo_db_dump.rebuild_file(self.dumps[1], self.files[0],
+                                       self.dst_file)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.base_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
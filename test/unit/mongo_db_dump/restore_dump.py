@@ -0,0 +1,401 @@
+# Classification (U)
+
+"""Program:  restore_dump.py
+
+    Description:  Unit testing of restore_dump in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/restore_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Mail():
+
+    """Class:  Mail
+
+    Description:  Class stub holder for gen_class.Mail class.
+
+    Methods:
+        __init__
+        add_2_msg
+        send_mail
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.msgs = []
+
+    def add_2_msg(self, data):
+
+        """Method:  add_2_msg
+
+        Description:  Stub method holder for Mail.add_2_msg.
+
+        Arguments:
+            (input) data -> Message line to add to email body.
+
+        """
+
+        self.msgs.append(data)
+
+        return True
+
+    def send_mail(self):
+
+        """Method:  send_mail
+
+        Description:  Stub method holder for Mail.send_mail.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_dump
+        test_no_db_path
+        test_db_path_not_empty
+        test_unknown_owner
+        test_check_failure
+        test_copy_failure
+        test_archive
+        test_delta_dump
+        test_owner
+        test_restore_mail
+        test_restore
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = Mail()
+        self.base_dir = "./test/unit/mongo_db_dump/tmp"
+        self.dmp_dir = os.path.join(self.base_dir, "cp_dump_20250101_0100")
+        self.db_path = os.path.join(self.base_dir, "db_path")
+        self.args = ArgParser()
+        self.args.args_array["-R"] = self.dmp_dir + "/"
+        self.args.args_array["-o"] = self.db_path
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        manifest = {}
+        os.makedirs(os.path.join(self.dmp_dir, "journal"))
+        os.makedirs(os.path.join(self.db_path, "lost+found"))
+
+        for name in self.files:
+            f_name = os.path.join(self.dmp_dir, name)
+
+            with open(f_name, mode="wb") as f_hdlr:
+                f_hdlr.write(os.urandom(4096))
+
+            manifest[name] = {
+                "size": 4096, "mtime_ns": os.stat(f_name).st_mtime_ns,
+                "digest": "0"}
+
+        mongo_db_dump.write_manifest(self.dmp_dir, manifest)
+
+    def test_no_dump(self):
+
+        """Function:  test_no_dump
+
+        Description:  Test with a dump which does not exist.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-R"] = self.dmp_dir + "_missing"
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args),
+            (True, f"Error:  Dump does not exist: {self.dmp_dir}_missing"))
+
+    def test_no_db_path(self):
+
+        """Function:  test_no_db_path
+
+        Description:  Test with a database directory which does not exist.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.db_path + "_missing"
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args),
+            (True, f"Error:  Restore directory does not exist:"
+             f" {self.db_path}_missing"))
+
+    def test_db_path_not_empty(self):
+
+        """Function:  test_db_path_not_empty
+
+        Description:  Test with database files in the database directory.
+
+        Arguments:
+
+        """
+
+        open(os.path.join(self.db_path, "WiredTiger"), mode="w",
+             encoding="UTF-8").close()
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args),
+            (True, f"Error:  Restore directory is not empty: {self.db_path}"))
+
+    def test_unknown_owner(self):
+
+        """Function:  test_unknown_owner
+
+        Description:  Test with a cp_restore_owner user which is not found.
+
+        Arguments:
+
+        """
+
+        cfg = mock.Mock(cp_restore_owner="no_such_user_x")
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args, cfg=cfg),
+            (True, "Error:  cp_restore_owner user or group not found:"
+             " no_such_user_x"))
+
+    def test_check_failure(self):
+
+        """Function:  test_check_failure
+
+        Description:  Test with a dump file missing from the dump.
+
+        Arguments:
+
+        """
+
+        os.remove(os.path.join(self.dmp_dir, self.files[0]))
+        err_flag, err_msg = mongo_db_dump.restore_dump(self.args)
+
+        self.assertTrue(err_flag)
+        self.assertIn("Manifest check failed for 1 of 2 files", err_msg)
+        self.assertEqual(os.listdir(self.db_path), ["lost+found"])
+
+    @mock.patch("mongo_db_dump.set_owner")
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_copy_failure(self, mock_copy, mock_owner):
+
+        """Function:  test_copy_failure
+
+        Description:  Test with a copy failure.
+
+        Arguments:
+
+        """
+
+        mock_copy.return_value = (True, "Error:  Copy failed")
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args),
+            (True, "Error:  Copy failed"))
+        self.assertFalse(mock_owner.called)
+
+    @mock.patch("mongo_db_dump.set_owner", mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.extract_archive")
+    def test_archive(self, mock_extract):
+
+        """Function:  test_archive
+
+        Description:  Test with an archive extracted in parallel.
+
+        Arguments:
+
+        """
+
+        arch_file = self.dmp_dir + ".tar.gz"
+        open(arch_file, mode="w", encoding="UTF-8").close()
+        self.args.args_array["-R"] = arch_file
+        mock_extract.return_value = (False, None)
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args), (False, None))
+        self.assertEqual(mock_extract.call_args.args,
+                         (arch_file, self.db_path))
+        os.remove(arch_file)
+
+    @mock.patch("mongo_db_dump.set_owner", mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.rebuild_dump")
+    def test_delta_dump(self, mock_rebuild):
+
+        """Function:  test_delta_dump
+
+        Description:  Test with a dump stored as block deltas rebuilt.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, "cp_dump_delta.json"), mode="w",
+                  encoding="UTF-8") as f_hdlr:
+            json.dump({"base": "cp_dump_20250102_0100", "block_size": 4096,
+                       "files": []}, f_hdlr)
+
+        mock_rebuild.return_value = (False, None)
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args), (False, None))
+        self.assertEqual(mock_rebuild.call_args.args,
+                         (self.dmp_dir, self.db_path))
+
+    @mock.patch("mongo_db_dump.set_owner")
+    def test_owner(self, mock_owner):
+
+        """Function:  test_owner
+
+        Description:  Test with the files given to the database directory
+            owner.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.restore_dump(self.args)
+
+        mock_owner.assert_called_once_with(
+            self.db_path, os.stat(self.db_path).st_uid,
+            os.stat(self.db_path).st_gid)
+
+    def test_restore_mail(self):
+
+        """Function:  test_restore_mail
+
+        Description:  Test with the restore statistics in the email.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args, mail=self.mail),
+            (False, None))
+        self.assertIn(f"Restored {self.dmp_dir} to {self.db_path}",
+                      self.mail.msgs[0])
+        self.assertIn('"files": 2', self.mail.msgs[0])
+
+    def test_restore(self):
+
+        """Function:  test_restore
+
+        Description:  Test with the dump files restored without the sidecar
+            files.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.restore_dump(self.args), (False, None))
+        self.assertEqual(
+            sorted(os.listdir(self.db_path)),
+            ["collection-1.wt", "journal", "lost+found"])
+
+        for name in self.files:
+            with open(os.path.join(self.dmp_dir, name), mode="rb") as src, \
+                    open(os.path.join(self.db_path, name), mode="rb") as dst:
+                self.assertEqual(src.read(), dst.read())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dmp_dir)
+        shutil.rmtree(self.db_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
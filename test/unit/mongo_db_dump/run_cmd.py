@@ -0,0 +1,201 @@
+# Classification (U)
+
+"""Program:  run_cmd.py
+
+    Description:  Unit testing of run_cmd in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/run_cmd.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.japd = "JAPD"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_run_cmd
+        test_line_func
+        test_out_func
+        test_out_func_failure
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/run_cmd"
+        self.log_file = os.path.join(self.dir_path, "dump.log")
+        self.err_file = os.path.join(self.dir_path, "dump.err")
+        os.makedirs(self.dir_path)
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    def test_run_cmd(self, mock_subp):
+
+        """Function:  test_run_cmd
+
+        Description:  Test with the command run and its return code.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value.wait.return_value = 1
+
+        self.assertEqual(
+            mongo_db_dump.run_cmd(self.server, ["mongodump", "--db=sales"],
+                                  self.log_file, self.err_file), 1)
+        self.assertEqual(mock_subp.call_args_list[0].args[0],
+                         ["echo", "JAPD"])
+        self.assertEqual(mock_subp.call_args_list[1].args[0],
+                         ["mongodump", "--db=sales"])
+        self.assertEqual(mock_subp.call_args_list[1].kwargs["stderr"].name,
+                         self.log_file)
+        self.assertTrue(os.path.isfile(self.err_file))
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    def test_line_func(self, mock_subp):
+
+        """Function:  test_line_func
+
+        Description:  Test with the log read a line at a time, written to the
+            log file and passed to line_func.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value.wait.return_value = 0
+        mock_subp.return_value.stderr = io.BytesIO(
+            b"writing sales.coll\ndone dumping sales.coll\n")
+        lines = []
+
+        self.assertEqual(
+            mongo_db_dump.run_cmd(self.server, ["mongodump", "--db=sales"],
+                                  self.log_file, self.err_file, lines.append),
+            0)
+        self.assertEqual(mock_subp.call_args_list[1].kwargs["stderr"],
+                         mongo_db_dump.subprocess.PIPE)
+        self.assertEqual(lines, ["writing sales.coll\n",
+                                 "done dumping sales.coll\n"])
+
+        with open(self.log_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), "".join(lines))
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    def test_out_func(self, mock_subp):
+
+        """Function:  test_out_func
+
+        Description:  Test with standard out passed to out_func.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value.wait.return_value = 0
+        mock_subp.return_value.stdout = io.BytesIO(b"archive data")
+        out_data = []
+
+        self.assertEqual(
+            mongo_db_dump.run_cmd(
+                self.server, ["mongodump", "--archive"], self.log_file,
+                self.err_file, out_func=lambda src: out_data.append(
+                    src.read())), 0)
+        self.assertEqual(mock_subp.call_args_list[1].kwargs["stdout"],
+                         mongo_db_dump.subprocess.PIPE)
+        self.assertEqual(out_data, [b"archive data"])
+        self.assertFalse(mock_subp.return_value.kill.called)
+
+    @mock.patch("mongo_db_dump.subprocess.Popen")
+    def test_out_func_failure(self, mock_subp):
+
+        """Function:  test_out_func_failure
+
+        Description:  Test with out_func failing, the program is killed.
+
+        Arguments:
+
+        """
+
+        def out_func(src):
+            raise OSError("No space left on device")
+
+        with self.assertRaises(OSError):
+            mongo_db_dump.run_cmd(
+                self.server, ["mongodump", "--archive"], self.log_file,
+                self.err_file, out_func=out_func)
+
+        self.assertTrue(mock_subp.return_value.kill.called)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
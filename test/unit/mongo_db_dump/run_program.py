@@ -189,6 +189,8 @@ class UnitTest(unittest.TestCase):
         test_email_no_subj
         test_mail
         test_dump_error
+        test_restore
+        test_verify
         test_run_program
 
     """
@@ -219,6 +221,8 @@ class UnitTest(unittest.TestCase):
         self.args4.args_array = {
             "-d": True, "-c": True, "-M": True, "-x": True}
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -241,6 +245,8 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(
                 mongo_db_dump.run_program(self.args, self.func_names))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -261,6 +267,8 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(
                 mongo_db_dump.run_program(self.args4, self.func_names2))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -280,6 +288,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mongo_db_dump.run_program(self.args, self.func_names))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -299,6 +309,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mongo_db_dump.run_program(self.args3, self.func_names))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -318,6 +330,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mongo_db_dump.run_program(self.args2, self.func_names))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -337,6 +351,8 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mongo_db_dump.run_program(self.args2, self.func_names))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -357,6 +373,59 @@ class UnitTest(unittest.TestCase):
             self.assertFalse(
                 mongo_db_dump.run_program(self.args, self.func_names2))
 
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
+    @mock.patch("mongo_db_dump.mongo_libs.disconnect")
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_restore(self, mock_inst, mock_disconn):
+
+        """Function:  test_restore
+
+        Description:  Test with restore, the server is not connected to.
+
+        Arguments:
+
+        """
+
+        self.server.status = False
+        mock_inst.return_value = self.server
+        func = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-d": True, "-c": True, "-R": "/dump"}
+
+        self.assertFalse(mongo_db_dump.run_program(
+            self.args, {"-R": func}, offline_list=["-R"]))
+        self.assertEqual(func.call_args.args, (self.args,))
+        self.assertNotIn("offline_list", func.call_args.kwargs)
+        self.assertFalse(mock_disconn.called)
+
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
+    @mock.patch("mongo_db_dump.mongo_libs.disconnect")
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_verify(self, mock_inst, mock_disconn):
+
+        """Function:  test_verify
+
+        Description:  Test with verify, the server is not connected to.
+
+        Arguments:
+
+        """
+
+        self.server.status = False
+        mock_inst.return_value = self.server
+        func = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-d": True, "-c": True, "-C": "/dump"}
+
+        self.assertFalse(mongo_db_dump.run_program(
+            self.args, {"-C": func}, offline_list=["-C", "-R"]))
+        self.assertEqual(func.call_args.args, (self.args,))
+        self.assertFalse(mock_disconn.called)
+
+    @mock.patch("mongo_db_dump.gen_libs.load_module",
+                mock.Mock(return_value=None))
     @mock.patch("mongo_db_dump.get_req_options", mock.Mock(return_value=[]))
     @mock.patch("mongo_db_dump.mongo_libs.disconnect",
                 mock.Mock(return_value=True))
@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  save_tuning.py
+
+    Description:  Unit testing of save_tuning in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/save_tuning.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_file
+        test_last_runs
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/tuning"
+        self.f_name = os.path.join(self.dir_path, "mongodump_tuning.json")
+        self.runs = [{"num_parallel": 4, "procs": 1, "bytes": 1048576,
+                      "seconds": 2.5}]
+        os.makedirs(self.dir_path)
+
+    def test_new_file(self):
+
+        """Function:  test_new_file
+
+        Description:  Test with the first run recorded.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.save_tuning(self.dir_path, self.runs[0])
+
+        self.assertEqual(mongo_db_dump.get_tuning(self.dir_path), self.runs)
+        self.assertFalse(os.path.exists(self.f_name + ".tmp"))
+
+    def test_last_runs(self):
+
+        """Function:  test_last_runs
+
+        Description:  Test with only the last TUNING_RUNS runs kept.
+
+        Arguments:
+
+        """
+
+        for num in range(1, mongo_db_dump.TUNING_RUNS + 3):
+            mongo_db_dump.save_tuning(self.dir_path, {"num_parallel": num})
+
+        runs = mongo_db_dump.get_tuning(self.dir_path)
+
+        self.assertEqual(len(runs), mongo_db_dump.TUNING_RUNS)
+        self.assertEqual(runs[0]["num_parallel"], 3)
+        self.assertEqual(runs[-1]["num_parallel"],
+                         mongo_db_dump.TUNING_RUNS + 2)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
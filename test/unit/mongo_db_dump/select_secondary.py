@@ -0,0 +1,371 @@
+# Classification (U)
+
+"""Program:  select_secondary.py
+
+    Description:  Unit testing of select_secondary in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/select_secondary.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+import mock
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        adm_cmd
+
+    """
+
+    def __init__(self, members=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.members = members
+        self.cmd = None
+
+    def adm_cmd(self, cmd):
+
+        """Method:  adm_cmd
+
+        Description:  Stub holder for mongo_class.Server.adm_cmd method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        if self.members is None:
+            raise pymongo.errors.OperationFailure("not running with --replSet")
+
+        return {"set": "rs1", "members": self.members}
+
+
+class Member():                                         # pylint:disable=R0903
+
+    """Class:  Member
+
+    Description:  Class stub holder for mongo_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self, db_path):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.db_path = db_path
+        self.host = None
+        self.port = None
+        self.status = (True, None)
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Stub holder for mongo_class.Server.connect method.
+
+        Arguments:
+
+        """
+
+        return self.status
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_status_failure
+        test_no_secondary
+        test_unhealthy
+        test_not_local
+        test_no_db_path
+        test_connect_failure
+        test_least_lag
+        test_ping_time
+        test_no_primary
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.now = datetime.datetime(2026, 10, 18, 12, 0, 0)
+        self.primary = {"name": "host1:27017", "health": 1, "state": 1,
+                        "optimeDate": self.now}
+        self.sec1 = {"name": "host2:27018", "health": 1, "state": 2,
+                     "optimeDate": self.now - datetime.timedelta(seconds=5),
+                     "pingMs": 1}
+        self.sec2 = {"name": "host3:27019", "health": 1, "state": 2,
+                     "optimeDate": self.now - datetime.timedelta(seconds=1),
+                     "pingMs": 3}
+        self.member = Member(os.getcwd())
+        self.msg = "Error:  No healthy secondary found on this server with" \
+            " a local dbpath."
+
+    def test_status_failure(self):
+
+        """Function:  test_status_failure
+
+        Description:  Test with the server not a replica set member.
+
+        Arguments:
+
+        """
+
+        server = Server()
+        err_flag, err_msg, member = mongo_db_dump.select_secondary(
+            server, self.args)
+
+        self.assertTrue(err_flag)
+        self.assertIn("Unable to get replica set status", err_msg)
+        self.assertIsNone(member)
+        self.assertEqual(server.cmd, "replSetGetStatus")
+
+    def test_no_secondary(self):
+
+        """Function:  test_no_secondary
+
+        Description:  Test with only a primary in the replica set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.select_secondary(
+                Server([self.primary]), self.args), (True, self.msg, None))
+
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=True))
+    def test_unhealthy(self):
+
+        """Function:  test_unhealthy
+
+        Description:  Test with an unhealthy secondary skipped.
+
+        Arguments:
+
+        """
+
+        self.sec2["health"] = 0
+
+        with mock.patch("mongo_db_dump.mongo_libs.create_instance",
+                        mock.Mock(return_value=self.member)):
+            _, _, member = mongo_db_dump.select_secondary(
+                Server([self.primary, self.sec1, self.sec2]), self.args)
+
+        self.assertEqual((member.host, member.port), ("host2", 27018))
+
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=False))
+    def test_not_local(self):
+
+        """Function:  test_not_local
+
+        Description:  Test with no secondary on this server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.select_secondary(
+                Server([self.primary, self.sec1]), self.args),
+            (True, self.msg, None))
+
+    @mock.patch("mongo_db_dump.mongo_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_no_db_path(self, mock_inst):
+
+        """Function:  test_no_db_path
+
+        Description:  Test with the secondary dbpath not found locally.
+
+        Arguments:
+
+        """
+
+        self.member.db_path = "/No/Such/Directory"
+        mock_inst.return_value = self.member
+
+        self.assertEqual(
+            mongo_db_dump.select_secondary(
+                Server([self.primary, self.sec1]), self.args),
+            (True, self.msg, None))
+        mongo_db_dump.mongo_libs.disconnect.assert_called_once_with(
+            [self.member])
+
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_connect_failure(self, mock_inst):
+
+        """Function:  test_connect_failure
+
+        Description:  Test with a secondary connection failure.
+
+        Arguments:
+
+        """
+
+        self.member.status = (False, "Connection refused")
+        mock_inst.return_value = self.member
+
+        self.assertEqual(
+            mongo_db_dump.select_secondary(
+                Server([self.primary, self.sec1]), self.args),
+            (True, self.msg, None))
+
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_least_lag(self, mock_inst):
+
+        """Function:  test_least_lag
+
+        Description:  Test with the least lagged secondary selected.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.member
+
+        self.assertEqual(
+            mongo_db_dump.select_secondary(
+                Server([self.primary, self.sec1, self.sec2]), self.args),
+            (False, None, self.member))
+        self.assertEqual((self.member.host, self.member.port),
+                         ("host3", 27019))
+
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_ping_time(self, mock_inst):
+
+        """Function:  test_ping_time
+
+        Description:  Test with equal lag and the lowest ping time selected.
+
+        Arguments:
+
+        """
+
+        self.sec2["optimeDate"] = self.sec1["optimeDate"]
+        mock_inst.return_value = self.member
+        mongo_db_dump.select_secondary(
+            Server([self.primary, self.sec2, self.sec1]), self.args)
+
+        self.assertEqual((self.member.host, self.member.port),
+                         ("host2", 27018))
+
+    @mock.patch("mongo_db_dump.is_local_host", mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.mongo_libs.create_instance")
+    def test_no_primary(self, mock_inst):
+
+        """Function:  test_no_primary
+
+        Description:  Test with no primary, lag from the newest secondary.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.member
+        mongo_db_dump.select_secondary(
+            Server([self.sec1, self.sec2]), self.args)
+
+        self.assertEqual((self.member.host, self.member.port),
+                         ("host3", 27019))
+
+
+if __name__ == "__main__":
+    unittest.main()
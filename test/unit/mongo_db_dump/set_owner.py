@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  set_owner.py
+
+    Description:  Unit testing of set_owner in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/set_owner.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import stat
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_owner
+        test_new_owner
+        test_permissions
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_path = "./test/unit/mongo_db_dump/tmp/db_path"
+        self.f_name = os.path.join(self.db_path, "journal", "Log.1")
+        os.makedirs(os.path.dirname(self.f_name))
+
+        with open(self.f_name, mode="wb") as f_hdlr:
+            f_hdlr.write(b"x")
+
+        self.uid = os.getuid()
+        self.gid = os.getgid()
+
+    @mock.patch("mongo_db_dump.os.lchown")
+    def test_same_owner(self, mock_chown):
+
+        """Function:  test_same_owner
+
+        Description:  Test with the files already owned by the owner.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.set_owner(self.db_path, self.uid, self.gid)
+
+        self.assertFalse(mock_chown.called)
+
+    @mock.patch("mongo_db_dump.os.lchown")
+    def test_new_owner(self, mock_chown):
+
+        """Function:  test_new_owner
+
+        Description:  Test with the files given to another owner.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.set_owner(self.db_path, self.uid + 1, self.gid)
+
+        self.assertEqual(
+            sorted(item.args[0] for item in mock_chown.call_args_list),
+            sorted([self.db_path, os.path.join(self.db_path, "journal"),
+                    self.f_name]))
+
+    def test_permissions(self):
+
+        """Function:  test_permissions
+
+        Description:  Test with owner read/write access added.
+
+        Arguments:
+
+        """
+
+        os.chmod(self.f_name, 0o440)
+        os.chmod(os.path.dirname(self.f_name), 0o550)
+        mongo_db_dump.set_owner(self.db_path, self.uid, self.gid)
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.f_name).st_mode), 0o640)
+        self.assertEqual(
+            stat.S_IMODE(os.stat(os.path.dirname(self.f_name)).st_mode),
+            0o750)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.db_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
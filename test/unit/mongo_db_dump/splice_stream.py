@@ -0,0 +1,168 @@
+# Classification (U)
+
+"""Program:  splice_stream.py
+
+    Description:  Unit testing of splice_stream in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/splice_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import errno
+import shutil
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _run
+        test_splice
+        test_not_supported
+        test_no_splice
+        test_error
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp/splice"
+        self.arch_file = os.path.join(self.dir_path, "dump.archive")
+        self.data = os.urandom(1000) * 300
+        os.makedirs(self.dir_path)
+
+    def _run(self):
+
+        """Function:  _run
+
+        Description:  Writes the data to a pipe in a thread and splices the
+            pipe to the file.
+
+        Arguments:
+
+        """
+
+        stats = {}
+        fd_in, fd_out = os.pipe()
+
+        def writer():
+            with os.fdopen(fd_out, mode="wb") as f_hdlr:
+                f_hdlr.write(self.data)
+
+        thr = threading.Thread(target=writer)
+        thr.start()
+
+        with os.fdopen(fd_in, mode="rb") as src:
+            mongo_db_dump.splice_stream(src, self.arch_file, chunk_size=65536,
+                                        stats=stats)
+
+        thr.join()
+
+        with open(self.arch_file, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+        return stats
+
+    def test_splice(self):
+
+        """Function:  test_splice
+
+        Description:  Test with the pipe spliced to the file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self._run(), {"bytes": len(self.data),
+                                       "bytes_written": len(self.data)})
+
+    def test_not_supported(self):
+
+        """Function:  test_not_supported
+
+        Description:  Test with splice not supported by the file, the
+            read/write loop is used.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_db_dump.os.splice", create=True,
+                        side_effect=OSError(errno.EINVAL, "Invalid argument")):
+            self.assertEqual(self._run()["bytes"], len(self.data))
+
+    def test_no_splice(self):
+
+        """Function:  test_no_splice
+
+        Description:  Test with no os.splice, the read/write loop is used.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_db_dump.os.splice", None, create=True):
+            self.assertEqual(self._run()["bytes"], len(self.data))
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test with a splice error other than not supported.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mongo_db_dump.os.splice", create=True,
+                        side_effect=OSError(errno.ENOSPC, "No space")):
+            with self.assertRaises(OSError):
+                mongo_db_dump.splice_stream(mock.Mock(fileno=lambda: 0),
+                                            self.arch_file)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,267 @@
+# Classification (U)
+
+"""Program:  stream_copy.py
+
+    Description:  Unit testing of stream_copy in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/stream_copy.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import errno
+import hashlib
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        read_dst
+        write_sparse
+        test_cancelled
+        test_direct_not_supported
+        test_direct
+        test_empty_file
+        test_sparse_hash
+        test_sparse
+        test_fan_out
+        test_copy
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "./test/unit/mongo_db_dump/tmp"
+        self.src_file = os.path.join(self.dir_path, "collection-1.wt")
+        self.dst_file = os.path.join(self.dir_path, "collection-1.wt.cp")
+        self.dst_file2 = os.path.join(self.dir_path, "collection-1.wt.cp2")
+        self.data = os.urandom(10000)
+        self.real_open = os.open
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    def read_dst(self):
+
+        """Function:  read_dst
+
+        Description:  Returns the contents of the destination file.
+
+        Arguments:
+
+        """
+
+        with open(self.dst_file, mode="rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_cancelled(self):
+
+        """Function:  test_cancelled
+
+        Description:  Test with the copy cancelled.
+
+        Arguments:
+
+        """
+
+        cancel = threading.Event()
+        cancel.set()
+
+        with self.assertRaises(InterruptedError):
+            mongo_db_dump.stream_copy(
+                self.src_file, self.dst_file, cancel=cancel)
+
+    @mock.patch("mongo_db_dump.os.open")
+    def test_direct_not_supported(self, mock_open):
+
+        """Function:  test_direct_not_supported
+
+        Description:  Test with O_DIRECT not supported by the filesystem.
+
+        Arguments:
+
+        """
+
+        def no_direct(path, flags, mode=0o777):
+            if flags & getattr(os, "O_DIRECT", 0):
+                raise OSError(errno.EINVAL, "Invalid argument")
+
+            return self.real_open(path, flags, mode)
+
+        mock_open.side_effect = no_direct
+
+        mongo_db_dump.stream_copy(
+            self.src_file, self.dst_file, chunk_size=4096, direct=True)
+
+        self.assertEqual(self.read_dst(), self.data)
+
+    def test_direct(self):
+
+        """Function:  test_direct
+
+        Description:  Test with the destination written with O_DIRECT.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.stream_copy(
+            self.src_file, self.dst_file, chunk_size=4096, direct=True)
+
+        self.assertEqual(self.read_dst(), self.data)
+
+    def test_empty_file(self):
+
+        """Function:  test_empty_file
+
+        Description:  Test with an empty source file.
+
+        Arguments:
+
+        """
+
+        with open(self.src_file, mode="wb"):
+            pass
+
+        mongo_db_dump.stream_copy(self.src_file, self.dst_file)
+
+        self.assertEqual(self.read_dst(), b"")
+
+    def write_sparse(self):
+
+        """Function:  write_sparse
+
+        Description:  Writes a source file with data between holes.
+
+        Arguments:
+
+        """
+
+        with open(self.src_file, mode="wb") as f_hdlr:
+            f_hdlr.seek(1048576)
+            f_hdlr.write(self.data)
+            f_hdlr.truncate(4194304)
+
+        with open(self.src_file, mode="rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_sparse_hash(self):
+
+        """Function:  test_sparse_hash
+
+        Description:  Test with the holes included in the digest.
+
+        Arguments:
+
+        """
+
+        data = self.write_sparse()
+        hasher = hashlib.sha256()
+
+        mongo_db_dump.stream_copy(
+            self.src_file, self.dst_file, hasher=hasher, direct=True)
+
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(data).hexdigest())
+
+    def test_sparse(self):
+
+        """Function:  test_sparse
+
+        Description:  Test with the holes kept in the destination.
+
+        Arguments:
+
+        """
+
+        data = self.write_sparse()
+
+        mongo_db_dump.stream_copy(self.src_file, self.dst_file)
+
+        self.assertEqual(self.read_dst(), data)
+        self.assertLess(
+            os.stat(self.dst_file).st_blocks * 512, len(data) // 2)
+
+    def test_fan_out(self):
+
+        """Function:  test_fan_out
+
+        Description:  Test with each chunk written to two destinations.
+
+        Arguments:
+
+        """
+
+        data = self.write_sparse()
+
+        mongo_db_dump.stream_copy(
+            self.src_file, self.dst_file, chunk_size=4096,
+            fan_out=[self.dst_file2])
+
+        self.assertEqual(self.read_dst(), data)
+
+        with open(self.dst_file2, mode="rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), data)
+
+    def test_copy(self):
+
+        """Function:  test_copy
+
+        Description:  Test with the file copied in several chunks.
+
+        Arguments:
+
+        """
+
+        mongo_db_dump.stream_copy(
+            self.src_file, self.dst_file, chunk_size=1000)
+
+        self.assertEqual(self.read_dst(), self.data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        for f_name in [self.src_file, self.dst_file, self.dst_file2]:
+            if os.path.isfile(f_name):
+                os.remove(f_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
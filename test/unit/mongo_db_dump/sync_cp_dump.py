@@ -16,6 +16,8 @@
 # Standard
 import sys
 import os
+import json
+import shutil
 import unittest
 import mock
 
@@ -27,7 +29,7 @@ import version                                  # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
-class ArgParser():                                      # pylint:disable=R0903
+class ArgParser():
 
     """Class:  ArgParser
 
@@ -35,6 +37,7 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        arg_exist
         get_val
 
     """
@@ -51,6 +54,18 @@ class ArgParser():                                      # pylint:disable=R0903
 
         self.args_array = {"-c": "mongo_cfg", "-d": "config"}
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def get_val(self, skey, def_val=None):
 
         """Method:  get_val
@@ -88,6 +103,7 @@ class Mail():
         """
 
         self.data = None
+        self.msgs = []
 
     def add_2_msg(self, data):
 
@@ -101,6 +117,7 @@ class Mail():
         """
 
         self.data = data
+        self.msgs.append(data)
 
         return True
 
@@ -321,6 +338,32 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_stats_file
+        test_archive
+        test_zstd_not_installed
+        test_bad_codec
+        test_warm_copy_failure
+        test_warm_copy
+        test_incremental
+        test_delta_store
+        test_bad_delta_block_size
+        test_page_cache
+        test_no_drop_cache
+        test_copy_failure
+        test_threads_not_int
+        test_threads_zero
+        test_bad_budget
+        test_bad_cp_method
+        test_cp_options
+        test_bad_rate_limit
+        test_manifest
+        test_fan_out_missing_dir
+        test_fan_out
+        test_incomplete_marker
+        test_secondary_failure
+        test_secondary
+        test_cold_copy_no_mongod_conf
+        test_cold_copy
         test_db_locked_mail
         test_unable_to_lock_mail
         test_db_dump_locked_mail
@@ -351,6 +394,603 @@ class UnitTest(unittest.TestCase):
         self.msg1 = "Error:  Database previously locked, unable to dump."
         self.msg2 = "Error:  Unable to lock the database for dump to occur."
         self.msg3 = "Warning:  Database still locked after dump."
+        self.msg4 = "Error:  -n option requires a positive integer."
+        self.msg5 = "Error:  Copy failed for file1: Disk full"
+        self.msg6 = "Error:  -a option must be one of: gzip, zstd"
+        self.msg7 = "Error:  -a zstd requires the zstandard python module."
+        self.msg8 = "Error:  -m option requires a positive number of seconds."
+        self.msg9 = "Error:  cp_method must be one of: auto, clone," \
+            " copy_file_range, sendfile, read"
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_stats_file(self, mock_copy):
+
+        """Function:  test_stats_file
+
+        Description:  Test with statistics written to the dump directory.
+
+        Arguments:
+
+        """
+
+        dmp_dir = "./test/unit/mongo_db_dump/tmp"
+        self.args.args_array["-o"] = dmp_dir
+
+        def make_dir(src_dir, dst_dir, **kwargs):
+            os.makedirs(dst_dir)
+            kwargs["stats"].update({"files": 2, "bytes": 1048576})
+            return False, None
+
+        mock_copy.side_effect = make_dir
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+
+        dmp_dir = mongo_db_dump.get_prev_dump(dmp_dir)
+
+        with open(os.path.join(dmp_dir, "cp_dump_stats.json"), mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            stats = json.load(f_hdlr)
+
+        shutil.rmtree(dmp_dir)
+
+        self.assertEqual(stats["files"], 2)
+        self.assertIn("lock_seconds", stats)
+        self.assertIn("mb_per_sec", stats)
+
+    @mock.patch("mongo_db_dump.archive_cp")
+    def test_archive(self, mock_arch):
+
+        """Function:  test_archive
+
+        Description:  Test with dump to a compressed archive.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "gzip"
+        mock_arch.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+        self.assertTrue(mock_arch.call_args.args[1].endswith(".tar.gz"))
+
+    @mock.patch("mongo_db_dump.zstandard", None)
+    def test_zstd_not_installed(self):
+
+        """Function:  test_zstd_not_installed
+
+        Description:  Test with zstd codec and no zstandard module.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "zstd"
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg7))
+
+    def test_bad_codec(self):
+
+        """Function:  test_bad_codec
+
+        Description:  Test with an unknown archive codec.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "bzip2"
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg6))
+
+    @mock.patch("mongo_db_dump.pre_cp")
+    def test_warm_copy_failure(self, mock_pre):
+
+        """Function:  test_warm_copy_failure
+
+        Description:  Test with the pre-copy failing before the lock.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-w"] = True
+        mock_pre.return_value = (True, self.msg5, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg5))
+        self.assertIsNone(self.server3.hold)
+
+    @mock.patch("mongo_db_dump.delta_cp")
+    @mock.patch("mongo_db_dump.pre_cp")
+    def test_warm_copy(self, mock_pre, mock_delta):
+
+        """Function:  test_warm_copy
+
+        Description:  Test with a pre-copy and locked delta copy.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-w"] = True
+        mock_pre.return_value = (False, None, (0, ([], [])))
+        mock_delta.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+        self.assertTrue(mock_delta.called)
+        self.assertFalse(self.server3.locked)
+
+    @mock.patch("mongo_db_dump.get_prev_dump",
+                mock.Mock(return_value="DirectoryPath/cp_dump_20250101_0000"))
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_incremental(self, mock_copy):
+
+        """Function:  test_incremental
+
+        Description:  Test with an incremental dump against previous dump.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = True
+        mock_copy.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+        self.assertEqual(
+            mock_copy.call_args.kwargs["prev_dir"],
+            "DirectoryPath/cp_dump_20250101_0000")
+
+    @mock.patch("mongo_db_dump.get_prev_dump",
+                mock.Mock(return_value="DirectoryPath/cp_dump_20250101_0000"))
+    @mock.patch("mongo_db_dump.load_delta", mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.delta_store")
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_delta_store(self, mock_copy, mock_delta):
+
+        """Function:  test_delta_store
+
+        Description:  Test with the previous dump stored as block deltas.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-D"] = True
+        mock_copy.return_value = (False, None)
+        mock_delta.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+        self.assertEqual(mock_delta.call_args.args[0],
+                         "DirectoryPath/cp_dump_20250101_0000")
+        self.assertEqual(mock_delta.call_args.kwargs["block_size"], 16384)
+
+    def test_bad_delta_block_size(self):
+
+        """Function:  test_bad_delta_block_size
+
+        Description:  Test with a delta block size which is not positive.
+
+        Arguments:
+
+        """
+
+        cfg = mock.Mock(cp_method="auto", cp_chunk_size=1048576,
+                        cp_rate_limit=None, cp_iops_limit=None,
+                        cp_locked_rate_limit=None, cp_delta_block_size=0,
+                        cp_delta_roll=4096)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args, cfg=cfg)),
+            (True, "Error:  cp_delta_block_size requires a positive integer"
+             " and cp_delta_roll zero or a positive integer."))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_page_cache(self, mock_copy):
+
+        """Function:  test_page_cache
+
+        Description:  Test with the page cache impact in the statistics.
+
+        Arguments:
+
+        """
+
+        mock_copy.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args,
+                                        mail=self.mail)), (False, None))
+        self.assertIsInstance(
+            mock_copy.call_args.kwargs["page_cache"], mongo_db_dump.PageCache)
+        self.assertIn('"page_cache": {', self.mail.data)
+        self.assertIn('"read_dropped": 0', self.mail.data)
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_no_drop_cache(self, mock_copy):
+
+        """Function:  test_no_drop_cache
+
+        Description:  Test with drop_cache set to False.
+
+        Arguments:
+
+        """
+
+        cfg = mock.Mock(cp_method="auto", cp_chunk_size=1048576,
+                        cp_rate_limit=None, cp_iops_limit=None,
+                        cp_locked_rate_limit=None, cp_delta_block_size=16384,
+                        cp_delta_roll=4096, drop_cache=False)
+        mock_copy.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args, cfg=cfg)),
+            (False, None))
+        self.assertIsNone(mock_copy.call_args.kwargs["page_cache"])
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_copy_failure(self, mock_copy):
+
+        """Function:  test_copy_failure
+
+        Description:  Test with the copy failing and database unlocked.
+
+        Arguments:
+
+        """
+
+        mock_copy.return_value = (True, self.msg5)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg5))
+        self.assertFalse(self.server3.locked)
+
+    def test_threads_not_int(self):
+
+        """Function:  test_threads_not_int
+
+        Description:  Test with a non-integer thread count.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = "abc"
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg4))
+        self.assertIsNone(self.server3.hold)
+
+    def test_threads_zero(self):
+
+        """Function:  test_threads_zero
+
+        Description:  Test with a thread count of zero.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = "0"
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg4))
+
+    def test_bad_budget(self):
+
+        """Function:  test_bad_budget
+
+        Description:  Test with a lock budget that is not a number.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "abc"
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg8))
+        self.assertIsNone(self.server3.hold)
+
+    def test_bad_cp_method(self):
+
+        """Function:  test_bad_cp_method
+
+        Description:  Test with an unknown copy method in the config file.
+
+        Arguments:
+
+        """
+
+        cfg = mock.Mock(cp_method="splice")
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args, cfg=cfg)),
+            (True, self.msg9))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_cp_options(self, mock_copy):
+
+        """Function:  test_cp_options
+
+        Description:  Test with copy settings from the config file.
+
+        Arguments:
+
+        """
+
+        cfg = mock.Mock(cp_method="sendfile", cp_chunk_size=1048576,
+                        cp_direct=False, cp_include=None, cp_exclude=[],
+                        cp_rate_limit=1048576, cp_iops_limit=None,
+                        cp_locked_rate_limit=None, cp_delta_block_size=16384,
+                        cp_delta_roll=4096)
+        mock_copy.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args, cfg=cfg)),
+            (False, None))
+        self.assertEqual(
+            mock_copy.call_args.kwargs["cp_opts"],
+            {"method": "sendfile", "chunk_size": 1048576, "direct": False})
+        self.assertIsNone(mock_copy.call_args.kwargs["limiter"].rate)
+
+    def test_bad_rate_limit(self):
+
+        """Function:  test_bad_rate_limit
+
+        Description:  Test with a rate limit which is not a positive number.
+
+        Arguments:
+
+        """
+
+        cfg = mock.Mock(cp_method="auto", cp_chunk_size=1048576,
+                        cp_rate_limit=0, cp_iops_limit="100",
+                        cp_locked_rate_limit=None, cp_delta_block_size=16384,
+                        cp_delta_roll=4096)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args, cfg=cfg)),
+            (True, "Error:  cp_rate_limit, cp_iops_limit requires a positive"
+             " number or None."))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_manifest(self, mock_copy):
+
+        """Function:  test_manifest
+
+        Description:  Test with a checksum manifest written to the dump.
+
+        Arguments:
+
+        """
+
+        dmp_dir = "./test/unit/mongo_db_dump/tmp"
+        self.args.args_array["-o"] = dmp_dir
+        self.args.args_array["-j"] = True
+
+        def make_dir(src_dir, dst_dir, **kwargs):
+            os.makedirs(dst_dir)
+            kwargs["manifest"]["file1"] = {
+                "size": 1, "mtime_ns": 1, "digest": "abc"}
+            return False, None
+
+        mock_copy.side_effect = make_dir
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+
+        dmp_dir = mongo_db_dump.get_prev_dump(dmp_dir)
+        manifest = mongo_db_dump.load_manifest(dmp_dir)
+        shutil.rmtree(dmp_dir)
+
+        self.assertEqual(
+            manifest,
+            ("sha256", {"file1": {"size": 1, "mtime_ns": 1, "digest": "abc"}}))
+
+    def test_fan_out_missing_dir(self):
+
+        """Function:  test_fan_out_missing_dir
+
+        Description:  Test with a fan-out directory which does not exist.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-f"] = ["./test/unit/mongo_db_dump/tmp",
+                                      "/no_such_dir"]
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, "Error:  -f directory does not exist: /no_such_dir"))
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_fan_out(self, mock_copy):
+
+        """Function:  test_fan_out
+
+        Description:  Test with the dump written to a second directory.
+
+        Arguments:
+
+        """
+
+        dmp_dir = "./test/unit/mongo_db_dump/tmp"
+        fan_out = os.path.join(dmp_dir, "fan_out")
+        os.makedirs(fan_out)
+        self.args.args_array["-o"] = dmp_dir
+        self.args.args_array["-f"] = [fan_out]
+
+        def make_dir(src_dir, dst_dir, **kwargs):
+            for item in [dst_dir] + kwargs["fan_out_dirs"]:
+                os.makedirs(item)
+
+            return False, None
+
+        mock_copy.side_effect = make_dir
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (False, None))
+
+        dmp_dir = mongo_db_dump.get_prev_dump(dmp_dir)
+        fan_out_dir = mongo_db_dump.get_prev_dump(fan_out)
+        stats_file = os.path.isfile(
+            os.path.join(fan_out_dir, "cp_dump_stats.json"))
+        shutil.rmtree(dmp_dir)
+        shutil.rmtree(fan_out)
+
+        self.assertEqual(
+            os.path.basename(dmp_dir), os.path.basename(fan_out_dir))
+        self.assertTrue(stats_file)
+
+    @mock.patch("mongo_db_dump.parallel_cp")
+    def test_incomplete_marker(self, mock_copy):
+
+        """Function:  test_incomplete_marker
+
+        Description:  Test with a failed copy marked as incomplete.
+
+        Arguments:
+
+        """
+
+        dmp_dir = "./test/unit/mongo_db_dump/tmp"
+        self.args.args_array["-o"] = dmp_dir
+
+        def make_dir(src_dir, dst_dir, **kwargs):
+            os.makedirs(dst_dir)
+            return True, self.msg5
+
+        mock_copy.side_effect = make_dir
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, self.msg5))
+        self.assertIsNone(mongo_db_dump.get_prev_dump(dmp_dir))
+
+        for item in os.listdir(dmp_dir):
+            if item.startswith("cp_dump_"):
+                shutil.rmtree(os.path.join(dmp_dir, item))
+
+    @mock.patch("mongo_db_dump.select_secondary")
+    def test_secondary_failure(self, mock_select):
+
+        """Function:  test_secondary_failure
+
+        Description:  Test with no secondary selected.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = True
+        mock_select.return_value = (True, "Error:  No secondary", None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, "Error:  No secondary"))
+        self.assertIsNone(self.server3.hold)
+
+    @mock.patch("mongo_db_dump.mongo_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mongo_db_dump.parallel_cp")
+    @mock.patch("mongo_db_dump.select_secondary")
+    def test_secondary(self, mock_select, mock_copy):
+
+        """Function:  test_secondary
+
+        Description:  Test with the selected secondary locked and copied.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = True
+        self.server.locked = True
+        mock_select.return_value = (False, None, self.server3)
+        mock_copy.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server, self.args)),
+            (False, None))
+        self.assertEqual(self.server3.hold, True)
+        mongo_db_dump.mongo_libs.disconnect.assert_called_once_with(
+            [self.server3])
+
+    def test_cold_copy_no_mongod_conf(self):
+
+        """Function:  test_cold_copy_no_mongod_conf
+
+        Description:  Test with cold copy and no cp_mongod_conf in the
+            config.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-K"] = True
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
+            (True, "Error:  -K option requires cp_mongod_conf in the"
+             " configuration file."))
+
+    @mock.patch("mongo_db_dump.locked_cp")
+    @mock.patch("mongo_db_dump.cold_cp")
+    def test_cold_copy(self, mock_cold, mock_locked):
+
+        """Function:  test_cold_copy
+
+        Description:  Test with cold copy instead of locking the database.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-K"] = True
+        self.args.args_array["-p"] = "/opt/mongo/bin"
+        cfg = mock.Mock(cp_method="auto", cp_chunk_size=1048576,
+                        cp_direct=False, cp_include=None, cp_exclude=[],
+                        cp_rate_limit=None, cp_iops_limit=None,
+                        cp_locked_rate_limit=None, cp_max_lag=30,
+                        cp_delta_block_size=16384, cp_delta_roll=4096,
+                        cp_shutdown_timeout=60, cp_catchup_timeout=600,
+                        conf_file="/etc/mongo/client.conf",
+                        cp_mongod_conf="/etc/mongod.conf")
+        mock_cold.return_value = (False, None)
+
+        self.assertEqual(
+            (mongo_db_dump.sync_cp_dump(self.server3, self.args, cfg=cfg)),
+            (False, None))
+        self.assertFalse(mock_locked.called)
+        self.assertEqual(
+            mock_cold.call_args.kwargs["start_cmd"],
+            ["/opt/mongo/bin/mongod", "--config", "/etc/mongod.conf",
+             "--fork"])
+        self.assertEqual(mock_cold.call_args.kwargs["max_lag"], 30)
 
     def test_db_locked_mail(self):
 
@@ -384,7 +1024,7 @@ class UnitTest(unittest.TestCase):
             self.server2, self.args, mail=self.mail)), (True, self.msg2))
         self.assertEqual(self.mail.data, self.msg2)
 
-    @mock.patch("mongo_db_dump.shutil.copytree")
+    @mock.patch("mongo_db_dump.parallel_cp")
     def test_db_dump_locked_mail(self, mock_copy):
 
         """Function:  test_db_dump_locked_mail
@@ -395,13 +1035,14 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_copy.return_value = True
+        mock_copy.return_value = (False, None)
 
         self.assertEqual((mongo_db_dump.sync_cp_dump(
             self.server, self.args, mail=self.mail)), (True, self.msg3))
-        self.assertEqual(self.mail.data, self.msg3)
+        self.assertIn(self.msg3, self.mail.msgs)
+        self.assertIn("lock_seconds", self.mail.data)
 
-    @mock.patch("mongo_db_dump.shutil.copytree")
+    @mock.patch("mongo_db_dump.parallel_cp")
     def test_db_dump_mail(self, mock_copy):
 
         """Function:  test_db_dump_mail
@@ -412,13 +1053,14 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_copy.return_value = True
+        mock_copy.return_value = (False, None)
 
         self.assertEqual((mongo_db_dump.sync_cp_dump(
             self.server3, self.args, mail=self.mail)), (False, None))
-        self.assertIsNone(self.mail.data)
+        self.assertEqual(self.mail.msgs[0], "Sync/Copy dump statistics:")
+        self.assertIn("lock_seconds", self.mail.data)
 
-    @mock.patch("mongo_db_dump.shutil.copytree")
+    @mock.patch("mongo_db_dump.parallel_cp")
     def test_db_dump(self, mock_copy):
 
         """Function:  test_db_dump
@@ -429,13 +1071,13 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_copy.return_value = True
+        mock_copy.return_value = (False, None)
 
         self.assertEqual(
             (mongo_db_dump.sync_cp_dump(self.server3, self.args)),
             (False, None))
 
-    @mock.patch("mongo_db_dump.shutil.copytree")
+    @mock.patch("mongo_db_dump.parallel_cp")
     def test_db_dump_locked(self, mock_copy):
 
         """Function:  test_db_dump_locked
@@ -446,7 +1088,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_copy.return_value = True
+        mock_copy.return_value = (False, None)
 
         self.assertEqual(
             (mongo_db_dump.sync_cp_dump(self.server, self.args)),
@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  token_bucket.py
+
+    Description:  Unit testing of TokenBucket in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/token_bucket.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_limit
+        test_rate_limit
+        test_iops_limit
+        test_burst
+        test_set_rate
+
+    """
+
+    @mock.patch("mongo_db_dump.time.sleep")
+    def test_no_limit(self, mock_sleep):
+
+        """Function:  test_no_limit
+
+        Description:  Test with no limits set.
+
+        Arguments:
+
+        """
+
+        bucket = mongo_db_dump.TokenBucket()
+
+        for _ in range(10):
+            bucket.consume(1073741824)
+
+        self.assertFalse(mock_sleep.called)
+
+    @mock.patch("mongo_db_dump.time.monotonic", mock.Mock(return_value=100))
+    @mock.patch("mongo_db_dump.time.sleep")
+    def test_rate_limit(self, mock_sleep):
+
+        """Function:  test_rate_limit
+
+        Description:  Test with the callers waiting for their bytes.
+
+        Arguments:
+
+        """
+
+        bucket = mongo_db_dump.TokenBucket(rate=1048576)
+        bucket.consume(1048576)
+        bucket.consume(2097152)
+
+        self.assertEqual(
+            [item.args[0] for item in mock_sleep.call_args_list], [1.0, 3.0])
+
+    @mock.patch("mongo_db_dump.time.monotonic", mock.Mock(return_value=100))
+    @mock.patch("mongo_db_dump.time.sleep")
+    def test_iops_limit(self, mock_sleep):
+
+        """Function:  test_iops_limit
+
+        Description:  Test with the I/O calls per second limited.
+
+        Arguments:
+
+        """
+
+        bucket = mongo_db_dump.TokenBucket(iops=10)
+
+        for _ in range(3):
+            bucket.consume(1)
+
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 0.3)
+
+    @mock.patch("mongo_db_dump.time.sleep")
+    @mock.patch("mongo_db_dump.time.monotonic")
+    def test_burst(self, mock_time, mock_sleep):
+
+        """Function:  test_burst
+
+        Description:  Test with an idle bucket holding one second of tokens.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 100
+        bucket = mongo_db_dump.TokenBucket(rate=1000)
+        mock_time.return_value = 200
+        bucket.consume(1000)
+
+        self.assertFalse(mock_sleep.called)
+
+        bucket.consume(500)
+
+        self.assertEqual(mock_sleep.call_args.args[0], 0.5)
+
+    @mock.patch("mongo_db_dump.time.monotonic", mock.Mock(return_value=100))
+    @mock.patch("mongo_db_dump.time.sleep")
+    def test_set_rate(self, mock_sleep):
+
+        """Function:  test_set_rate
+
+        Description:  Test with the limit removed for the locked copy.
+
+        Arguments:
+
+        """
+
+        bucket = mongo_db_dump.TokenBucket(rate=1000, iops=10)
+        bucket.set_rate(None)
+        bucket.consume(1000000)
+
+        self.assertFalse(mock_sleep.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
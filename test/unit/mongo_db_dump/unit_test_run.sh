@@ -6,12 +6,70 @@
 
 echo ""
 echo "Unit testing..."
+/usr/bin/python test/unit/mongo_db_dump/apply_delta.py
+/usr/bin/python test/unit/mongo_db_dump/archive_cp.py
+/usr/bin/python test/unit/mongo_db_dump/auto_parallel.py
+/usr/bin/python test/unit/mongo_db_dump/check_dump.py
+/usr/bin/python test/unit/mongo_db_dump/clone_file.py
+/usr/bin/python test/unit/mongo_db_dump/cold_cp.py
+/usr/bin/python test/unit/mongo_db_dump/compress_stream.py
+/usr/bin/python test/unit/mongo_db_dump/copy_db_files.py
+/usr/bin/python test/unit/mongo_db_dump/cp_file.py
+/usr/bin/python test/unit/mongo_db_dump/cp_manifest_file.py
+/usr/bin/python test/unit/mongo_db_dump/cp_summary.py
+/usr/bin/python test/unit/mongo_db_dump/delta_cp.py
+/usr/bin/python test/unit/mongo_db_dump/delta_store.py
+/usr/bin/python test/unit/mongo_db_dump/delta_writer.py
+/usr/bin/python test/unit/mongo_db_dump/drop_written.py
+/usr/bin/python test/unit/mongo_db_dump/dump_progress.py
+/usr/bin/python test/unit/mongo_db_dump/extract_archive.py
+/usr/bin/python test/unit/mongo_db_dump/fadvise.py
+/usr/bin/python test/unit/mongo_db_dump/get_cached.py
+/usr/bin/python test/unit/mongo_db_dump/get_codec.py
+/usr/bin/python test/unit/mongo_db_dump/get_coll_list.py
+/usr/bin/python test/unit/mongo_db_dump/get_coll_sizes.py
+/usr/bin/python test/unit/mongo_db_dump/get_cp_files.py
+/usr/bin/python test/unit/mongo_db_dump/get_db_list.py
+/usr/bin/python test/unit/mongo_db_dump/get_extents.py
+/usr/bin/python test/unit/mongo_db_dump/get_lag.py
+/usr/bin/python test/unit/mongo_db_dump/get_out_paths.py
+/usr/bin/python test/unit/mongo_db_dump/get_prev_dump.py
 /usr/bin/python test/unit/mongo_db_dump/get_req_options.py
+/usr/bin/python test/unit/mongo_db_dump/get_resident.py
+/usr/bin/python test/unit/mongo_db_dump/get_signature.py
+/usr/bin/python test/unit/mongo_db_dump/get_tuning.py
+/usr/bin/python test/unit/mongo_db_dump/get_written.py
 /usr/bin/python test/unit/mongo_db_dump/help_message.py
+/usr/bin/python test/unit/mongo_db_dump/is_local_host.py
+/usr/bin/python test/unit/mongo_db_dump/is_match.py
+/usr/bin/python test/unit/mongo_db_dump/is_unchanged.py
+/usr/bin/python test/unit/mongo_db_dump/load_delta.py
+/usr/bin/python test/unit/mongo_db_dump/lock_watchdog.py
+/usr/bin/python test/unit/mongo_db_dump/locked_cp.py
+/usr/bin/python test/unit/mongo_db_dump/log_summary.py
 /usr/bin/python test/unit/mongo_db_dump/main.py
+/usr/bin/python test/unit/mongo_db_dump/make_delta.py
 /usr/bin/python test/unit/mongo_db_dump/mongo_dump.py
 /usr/bin/python test/unit/mongo_db_dump/mongo_export.py
 /usr/bin/python test/unit/mongo_db_dump/mongo_generic.py
+/usr/bin/python test/unit/mongo_db_dump/page_cache.py
+/usr/bin/python test/unit/mongo_db_dump/parallel_cp.py
+/usr/bin/python test/unit/mongo_db_dump/parallel_dump.py
+/usr/bin/python test/unit/mongo_db_dump/pre_cp.py
 /usr/bin/python test/unit/mongo_db_dump/process_log_file.py
+/usr/bin/python test/unit/mongo_db_dump/rebuild_dump.py
+/usr/bin/python test/unit/mongo_db_dump/rebuild_file.py
+/usr/bin/python test/unit/mongo_db_dump/restore_dump.py
+/usr/bin/python test/unit/mongo_db_dump/run_cmd.py
 /usr/bin/python test/unit/mongo_db_dump/run_program.py
+/usr/bin/python test/unit/mongo_db_dump/save_tuning.py
+/usr/bin/python test/unit/mongo_db_dump/select_secondary.py
+/usr/bin/python test/unit/mongo_db_dump/set_owner.py
+/usr/bin/python test/unit/mongo_db_dump/splice_stream.py
+/usr/bin/python test/unit/mongo_db_dump/stream_copy.py
 /usr/bin/python test/unit/mongo_db_dump/sync_cp_dump.py
+/usr/bin/python test/unit/mongo_db_dump/token_bucket.py
+/usr/bin/python test/unit/mongo_db_dump/verify_dump.py
+/usr/bin/python test/unit/mongo_db_dump/wait_catch_up.py
+/usr/bin/python test/unit/mongo_db_dump/wait_shutdown.py
+/usr/bin/python test/unit/mongo_db_dump/write_sidecars.py
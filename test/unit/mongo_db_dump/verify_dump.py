@@ -0,0 +1,325 @@
+# Classification (U)
+
+"""Program:  verify_dump.py
+
+    Description:  Unit testing of verify_dump in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/verify_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import json
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mongo_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Mail():
+
+    """Class:  Mail
+
+    Description:  Class stub holder for gen_class.Mail class.
+
+    Methods:
+        __init__
+        add_2_msg
+        send_mail
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.msgs = []
+
+    def add_2_msg(self, data):
+
+        """Method:  add_2_msg
+
+        Description:  Stub method holder for Mail.add_2_msg.
+
+        Arguments:
+            (input) data -> Message line to add to email body.
+
+        """
+
+        self.msgs.append(data)
+
+        return True
+
+    def send_mail(self):
+
+        """Method:  send_mail
+
+        Description:  Stub method holder for Mail.send_mail.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_manifest
+        test_bad_manifest
+        test_missing_file
+        test_size_mismatch
+        test_digest_mismatch
+        test_delta_dump
+        test_verified_mail
+        test_verified
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = Mail()
+        self.dmp_dir = "./test/unit/mongo_db_dump/tmp/cp_dump_20250101_0100"
+        self.args = ArgParser()
+        self.args.args_array["-C"] = self.dmp_dir
+        self.files = ["collection-1.wt", os.path.join("journal", "Log.1")]
+        manifest = {}
+        os.makedirs(os.path.join(self.dmp_dir, "journal"))
+
+        for name in self.files:
+            f_name = os.path.join(self.dmp_dir, name)
+
+            with open(f_name, mode="wb") as f_hdlr:
+                f_hdlr.write(os.urandom(4096))
+
+            manifest[name] = {
+                "size": 4096, "mtime_ns": os.stat(f_name).st_mtime_ns,
+                "digest": mongo_db_dump.file_digest(f_name)}
+
+        mongo_db_dump.write_manifest(self.dmp_dir, manifest)
+
+    def test_no_manifest(self):
+
+        """Function:  test_no_manifest
+
+        Description:  Test with no manifest in the dump directory.
+
+        Arguments:
+
+        """
+
+        os.remove(os.path.join(self.dmp_dir, "cp_dump_manifest.json"))
+
+        self.assertEqual(
+            mongo_db_dump.verify_dump(self.args),
+            (True, f"Error:  No manifest found in {self.dmp_dir}"))
+
+    def test_bad_manifest(self):
+
+        """Function:  test_bad_manifest
+
+        Description:  Test with a manifest which is not valid JSON.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, "cp_dump_manifest.json"),
+                  mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("{")
+
+        err_flag, err_msg = mongo_db_dump.verify_dump(self.args)
+
+        self.assertTrue(err_flag)
+        self.assertTrue(err_msg.startswith("Error:  Unable to read manifest"))
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a file missing from the dump.
+
+        Arguments:
+
+        """
+
+        os.remove(os.path.join(self.dmp_dir, self.files[0]))
+
+        err_flag, err_msg = mongo_db_dump.verify_dump(self.args)
+
+        self.assertTrue(err_flag)
+        self.assertIn("Verify failed for 1 of 2 files", err_msg)
+        self.assertIn(self.files[0], err_msg)
+
+    def test_size_mismatch(self):
+
+        """Function:  test_size_mismatch
+
+        Description:  Test with a file which changed size.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, self.files[1]),
+                  mode="ab") as f_hdlr:
+            f_hdlr.write(b"extra")
+
+        err_flag, err_msg = mongo_db_dump.verify_dump(self.args)
+
+        self.assertTrue(err_flag)
+        self.assertIn(f"{self.files[1]}: size mismatch", err_msg)
+
+    def test_digest_mismatch(self):
+
+        """Function:  test_digest_mismatch
+
+        Description:  Test with a file which has a corrupted block.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, self.files[0]),
+                  mode="r+b") as f_hdlr:
+            f_hdlr.write(b"\0" * 512)
+
+        err_flag, err_msg = mongo_db_dump.verify_dump(self.args)
+
+        self.assertTrue(err_flag)
+        self.assertIn(f"{self.files[0]}: digest mismatch", err_msg)
+
+    def test_delta_dump(self):
+
+        """Function:  test_delta_dump
+
+        Description:  Test with a dump stored as block deltas.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, "cp_dump_delta.json"), mode="w",
+                  encoding="UTF-8") as f_hdlr:
+            json.dump({"base": "cp_dump_20250102_0100", "block_size": 4096,
+                       "files": []}, f_hdlr)
+
+        self.assertEqual(
+            mongo_db_dump.verify_dump(self.args),
+            (True, f"Error:  {self.dmp_dir} is stored as block deltas,"
+                   f" restore it (-R option) to verify it."))
+
+    def test_verified_mail(self):
+
+        """Function:  test_verified_mail
+
+        Description:  Test with a verified dump and email.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.verify_dump(self.args, mail=self.mail),
+            (False, None))
+        self.assertEqual(
+            self.mail.msgs, [f"Verified 2 files in {self.dmp_dir}"])
+
+    def test_verified(self):
+
+        """Function:  test_verified
+
+        Description:  Test with every file matching the manifest.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mongo_db_dump.verify_dump(self.args), (False, None))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# Classification (U)
+
+"""Program:  wait_catch_up.py
+
+    Description:  Unit testing of wait_catch_up in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/wait_catch_up.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+import pymongo
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_caught_up
+        test_not_reachable
+        test_timeout
+
+    """
+
+    @mock.patch("mongo_db_dump.time.sleep", mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.get_lag")
+    def test_caught_up(self, mock_lag):
+
+        """Function:  test_caught_up
+
+        Description:  Test with the lag falling under max_lag.
+
+        Arguments:
+
+        """
+
+        mock_lag.side_effect = [120.0, 30.0, 4.0]
+
+        self.assertEqual(mongo_db_dump.wait_catch_up("server", 10, 60), 4.0)
+        self.assertEqual(mock_lag.call_count, 3)
+
+    @mock.patch("mongo_db_dump.time.sleep", mock.Mock(return_value=None))
+    @mock.patch("mongo_db_dump.get_lag")
+    def test_not_reachable(self, mock_lag):
+
+        """Function:  test_not_reachable
+
+        Description:  Test with the server not reachable while it restarts.
+
+        Arguments:
+
+        """
+
+        mock_lag.side_effect = [
+            pymongo.errors.ServerSelectionTimeoutError("Connection refused"),
+            None, 0]
+
+        self.assertEqual(mongo_db_dump.wait_catch_up("server", 10, 60), 0)
+
+    @mock.patch("mongo_db_dump.get_lag", mock.Mock(return_value=120.0))
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the lag still over max_lag at the timeout.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mongo_db_dump.wait_catch_up("server", 10, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
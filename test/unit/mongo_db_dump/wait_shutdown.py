@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  wait_shutdown.py
+
+    Description:  Unit testing of wait_shutdown in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/wait_shutdown.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_lock_file
+        test_empty_lock_file
+        test_timeout
+        test_shutdown_while_waiting
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_path = tempfile.mkdtemp()
+        self.lock_file = os.path.join(self.db_path, "mongod.lock")
+
+        with open(self.lock_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("12345\n")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.db_path)
+
+    def test_no_lock_file(self):
+
+        """Function:  test_no_lock_file
+
+        Description:  Test with no mongod.lock file.
+
+        Arguments:
+
+        """
+
+        os.remove(self.lock_file)
+
+        self.assertTrue(mongo_db_dump.wait_shutdown(self.db_path, 0))
+
+    def test_empty_lock_file(self):
+
+        """Function:  test_empty_lock_file
+
+        Description:  Test with mongod.lock emptied by a clean shutdown.
+
+        Arguments:
+
+        """
+
+        open(self.lock_file, mode="w", encoding="UTF-8").close()
+
+        self.assertTrue(mongo_db_dump.wait_shutdown(self.db_path, 0))
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the database still running after the timeout.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mongo_db_dump.wait_shutdown(self.db_path, 0))
+
+    @mock.patch("mongo_db_dump.time.sleep")
+    def test_shutdown_while_waiting(self, mock_sleep):
+
+        """Function:  test_shutdown_while_waiting
+
+        Description:  Test with the database shutting down while waiting.
+
+        Arguments:
+
+        """
+
+        mock_sleep.side_effect = lambda secs: os.truncate(self.lock_file, 0)
+
+        self.assertTrue(mongo_db_dump.wait_shutdown(self.db_path, 60))
+        mock_sleep.assert_called_once_with(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  write_sidecars.py
+
+    Description:  Unit testing of write_sidecars in mongo_db_dump.py.
+
+    Usage:
+        test/unit/mongo_db_dump/write_sidecars.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mongo_db_dump                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        read_file
+        test_no_dump_dir
+        test_manifest_failure
+        test_failed_dump
+        test_archive
+        test_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_dir = "./test/unit/mongo_db_dump/tmp/cp_dump_20250101_0100"
+        self.stats = {"files": 2, "lock_seconds": 1.5}
+        self.manifest = {"file1": {"size": 1, "mtime_ns": 1, "digest": "a"}}
+        self.err_msg = "Error:  Copy failed for file1: Disk full"
+        os.makedirs(self.dmp_dir)
+
+    def read_file(self, name):
+
+        """Function:  read_file
+
+        Description:  Returns the contents of a file in the dump directory.
+
+        Arguments:
+
+        """
+
+        with open(os.path.join(self.dmp_dir, name), mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_no_dump_dir(self):
+
+        """Function:  test_no_dump_dir
+
+        Description:  Test with the dump directory never created.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dmp_dir)
+
+        self.assertIsNone(
+            mongo_db_dump.write_sidecars(self.dmp_dir, None, self.stats))
+        self.assertFalse(os.path.exists(self.dmp_dir))
+
+    @mock.patch("mongo_db_dump.write_manifest",
+                mock.Mock(side_effect=OSError("Disk full")))
+    def test_manifest_failure(self):
+
+        """Function:  test_manifest_failure
+
+        Description:  Test with the manifest unable to be written.
+
+        Arguments:
+
+        """
+
+        msg = "Error:  Unable to write manifest: Disk full"
+
+        self.assertEqual(
+            mongo_db_dump.write_sidecars(
+                self.dmp_dir, None, self.stats, manifest=self.manifest), msg)
+        self.assertEqual(
+            self.read_file("cp_dump_incomplete"), msg + "\n")
+
+    def test_failed_dump(self):
+
+        """Function:  test_failed_dump
+
+        Description:  Test with the dump marked as incomplete.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mongo_db_dump.write_sidecars(
+                self.dmp_dir, None, self.stats, manifest=self.manifest,
+                err_msg=self.err_msg))
+        self.assertEqual(
+            self.read_file("cp_dump_incomplete"), self.err_msg + "\n")
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self.dmp_dir, "cp_dump_manifest.json")))
+
+    def test_archive(self):
+
+        """Function:  test_archive
+
+        Description:  Test with the statistics written next to an archive.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mongo_db_dump.write_sidecars(self.dmp_dir, "gzip", self.stats))
+
+        with open(self.dmp_dir + ".tar.gz.stats.json", mode="r",
+                  encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.load(f_hdlr), self.stats)
+
+        os.remove(self.dmp_dir + ".tar.gz.stats.json")
+
+    def test_dump(self):
+
+        """Function:  test_dump
+
+        Description:  Test with the manifest and statistics written.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mongo_db_dump.write_sidecars(
+                self.dmp_dir, None, self.stats, manifest=self.manifest))
+        self.assertEqual(
+            json.loads(self.read_file("cp_dump_stats.json")), self.stats)
+        self.assertEqual(
+            mongo_db_dump.load_manifest(self.dmp_dir),
+            ("sha256", self.manifest))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Cleanup of testing environment.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.dmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
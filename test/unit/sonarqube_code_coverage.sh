@@ -8,15 +8,73 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/apply_delta.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/archive_cp.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/auto_parallel.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/check_dump.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/clone_file.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/cold_cp.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/compress_stream.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/copy_db_files.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/cp_file.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/cp_manifest_file.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/cp_summary.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/delta_cp.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/delta_store.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/delta_writer.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/drop_written.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/dump_progress.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/extract_archive.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/fadvise.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_cached.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_codec.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_coll_list.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_coll_sizes.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_cp_files.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_db_list.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_extents.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_lag.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_out_paths.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_prev_dump.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_req_options.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_resident.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_signature.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_tuning.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/get_written.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/help_message.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/is_local_host.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/is_match.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/is_unchanged.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/load_delta.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/lock_watchdog.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/locked_cp.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/log_summary.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/main.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/make_delta.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/mongo_dump.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/mongo_export.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/mongo_generic.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/page_cache.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/parallel_cp.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/parallel_dump.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/pre_cp.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/process_log_file.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/rebuild_dump.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/rebuild_file.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/restore_dump.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/run_cmd.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/run_program.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/save_tuning.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/select_secondary.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/set_owner.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/splice_stream.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/stream_copy.py
 coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/sync_cp_dump.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/token_bucket.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/verify_dump.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/wait_catch_up.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/wait_shutdown.py
+coverage run -a --source=mongo_db_dump test/unit/mongo_db_dump/write_sidecars.py
 
 
 echo ""